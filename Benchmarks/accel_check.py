@@ -0,0 +1,86 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+X-Accel-Redirect Check
+
+외부 서비스 없이 DELIVERY_MODE=accel 동작을 확인하는 도구
+Nginx의 internal location이 하는 것처럼 X-Accel-Redirect 경로를 저장공간 경로로 바꾸어 실제 파일과 비교함
+
+사용 예시
+    python -m Benchmarks.accel_check
+"""
+
+# Libraries
+from urllib.parse import unquote
+import asyncio
+import json
+import os
+import sys
+
+from Benchmarks.harness import prepare_environment, seed_database, make_image, running_app
+
+accel_prefix: str = "/_protected_images"
+
+
+async def check_accel_delivery() -> list[str]:
+    """
+    업로드한 이미지를 원본, 크기 변환, 권한 없음, 조건부 요청으로 조회하고 X-Accel-Redirect 응답을 검증하는 기능
+    :return: 실패한 항목의 설명 list[str]
+    """
+    failures: list[str] = []
+    accounts: dict = seed_database(families=2, subs_per_family=1)
+    main_id, main_session = accounts["main"][0]
+    _, sub_session = accounts["sub"][0]
+    _, other_sub_session = accounts["sub"][1]
+    original: bytes = make_image()
+
+    def expect(condition: bool, message: str) -> None:
+        print(("ok   " if condition else "FAIL ") + message)
+        if not condition:
+            failures.append(message)
+
+    async with running_app() as client:
+        status_code, _, body = await client.upload(main_session, original)
+        expect(status_code == 201, "upload returns 201")
+        file_name: str = json.loads(body)["result"]["file_name"]
+
+        # Nginx의 alias 처리처럼 내부 경로를 저장공간 경로로 변환
+        def resolve(headers: dict) -> str:
+            redirect: str = headers.get("x-accel-redirect", "")
+            return os.path.join(os.environ["IMAGE_STORAGE"], unquote(redirect.removeprefix(accel_prefix + "/")))
+
+        status_code, headers, body = await client.request(
+            "GET", f"/access/{main_id}/{file_name}", {"Accept": "image/jpeg"}, session_id=sub_session
+        )
+        expect(status_code == 200 and body == b"", "family member gets an empty 200 body")
+        expect(headers.get("x-accel-redirect", "").startswith(accel_prefix + "/"), "X-Accel-Redirect uses the internal prefix")
+        expect(headers.get("content-type") == "image/jpeg", "Content-Type is set for Nginx")
+        expect("etag" in headers and "cache-control" in headers, "validators and cache headers are set")
+        with open(resolve(headers), "rb") as buffer:
+            expect(buffer.read() == original, "redirect path resolves to the uploaded bytes")
+
+        status_code, headers, _ = await client.request(
+            "GET", f"/access/{main_id}/{file_name}?w=64", session_id=sub_session
+        )
+        expect(status_code == 200 and os.path.isfile(resolve(headers)), "resized variant resolves inside storage")
+
+        status_code, headers, _ = await client.request(
+            "GET", f"/access/{main_id}/{file_name}", session_id=other_sub_session
+        )
+        expect(status_code == 403 and "x-accel-redirect" not in headers, "other family is refused without redirect")
+
+        status_code, headers, _ = await client.request(
+            "GET", f"/access/{main_id}/{file_name}", session_id=sub_session
+        )
+        status_code, headers, _ = await client.request(
+            "GET", f"/access/{main_id}/{file_name}", {"If-None-Match": headers["etag"]}, session_id=sub_session
+        )
+        expect(status_code == 304 and "x-accel-redirect" not in headers, "conditional request is answered by FastAPI")
+
+    return failures
+
+
+if __name__ == "__main__":
+    prepare_environment(DELIVERY_MODE="accel", ACCEL_REDIRECT_PREFIX=accel_prefix)
+    sys.exit(1 if asyncio.run(check_accel_delivery()) else 0)
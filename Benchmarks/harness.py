@@ -0,0 +1,200 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Local Test Harness
+
+외부 서비스(MariaDB, Nginx) 없이 Image Provider를 실행하기 위한 도구
+SQLite를 DB로 사용하고, 같은 Process 안에서 ASGI 호출로 요청을 보냄
+"""
+
+# Libraries
+from contextlib import asynccontextmanager
+from io import BytesIO
+from urllib.parse import urlsplit
+import asyncio
+import os
+import tempfile
+import uuid
+
+
+# 임시 작업 공간과 환경 변수를 준비하는 기능
+def prepare_environment(work_directory: str = None, **overrides) -> str:
+    """
+    SQLite DB와 이미지 저장공간을 임시 작업 공간에 만들고 환경 변수를 설정하는 기능
+    main 또는 Database를 불러오기 전에 호출해야 함
+    :param work_directory: 작업 공간 경로 (없으면 임시 경로 생성)
+    :param overrides: 추가로 설정할 환경 변수
+    :return: 작업 공간 경로 str
+    """
+    work_directory = work_directory or tempfile.mkdtemp(prefix="carebot-image-")
+    storage: str = os.path.join(work_directory, "Storage")
+    os.makedirs(storage, exist_ok=True)
+
+    os.environ.update({
+        "DB_URL": f"sqlite:///{os.path.join(work_directory, 'carebot.sqlite3')}",
+        "IMAGE_URL": "http://image-provider.local",
+        "IMAGE_STORAGE": storage,
+        "MAX_IMAGE_SIZE": "10",
+        "CACHE_DURATION": "3600",
+        **{key: str(value) for key, value in overrides.items()}
+    })
+
+    return work_directory
+
+
+# 가족, 구성원, 세션 데이터를 만드는 기능
+def seed_database(families: int = 10, subs_per_family: int = 3) -> dict:
+    """
+    주 사용자와 보조 사용자, 가족 관계, 로그인 세션을 DB에 만드는 기능
+    :param families: 만들 가족 수
+    :param subs_per_family: 가족마다 만들 보조 사용자 수
+    :return: 역할별 (사용자 ID, 세션 ID) 목록 dict
+    """
+    from Database.connector import database_instance as database
+    from Database.models import Base, AccountsTable, FamiliesTable, MemberRelationsTable, LoginSessionsTable, Role
+
+    Base.metadata.create_all(database.engine)
+    accounts: dict = {"main": [], "sub": [], "system": []}
+
+    def short_id() -> str:
+        return uuid.uuid4().hex[:16]
+
+    with database.get_pre_session()() as session:
+        def add_account(role: Role, is_main_user: bool) -> tuple[str, str]:
+            account_id, session_id = short_id(), uuid.uuid4().hex
+            session.add(AccountsTable(id=account_id, email=f"{account_id}@carebot.local", password="-", role=role))
+            session.add(LoginSessionsTable(xid=session_id, user_id=account_id, is_main_user=is_main_user))
+            return account_id, session_id
+
+        accounts["system"].append(add_account(Role.SYSTEM, True))
+
+        for _ in range(families):
+            main_account = add_account(Role.MAIN, True)
+            accounts["main"].append(main_account)
+            family_id: str = short_id()
+            session.add(FamiliesTable(id=family_id, main_user=main_account[0], family_name="family"))
+
+            for _ in range(subs_per_family):
+                sub_account = add_account(Role.SUB, False)
+                accounts["sub"].append(sub_account)
+                session.add(MemberRelationsTable(id=short_id(), family_id=family_id, user_id=sub_account[0]))
+
+        session.commit()
+
+    return accounts
+
+
+# 예제 이미지를 만드는 기능
+def make_image(width: int = 640, height: int = 480, image_format: str = "JPEG") -> bytes:
+    from PIL import Image
+
+    output = BytesIO()
+    Image.effect_noise((width, height), 32).convert("RGB").save(output, format=image_format)
+    return output.getvalue()
+
+
+# multipart/form-data 요청 본문을 만드는 기능
+def make_multipart(files: list[tuple[str, str, bytes, str]], fields: dict = None) -> tuple[bytes, str]:
+    """
+    파일과 일반 값을 multipart/form-data 형식으로 묶는 기능
+    :param files: (필드 이름, 파일명, 데이터, MIME 형식) 목록
+    :param fields: 일반 필드 dict
+    :return: 요청 본문과 Content-Type Header 값 tuple[bytes, str]
+    """
+    boundary: str = uuid.uuid4().hex
+    body = BytesIO()
+
+    for name, value in (fields or {}).items():
+        body.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+
+    for name, file_name, data, mime in files:
+        body.write(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{file_name}"\r\n'
+            f'Content-Type: {mime}\r\n\r\n'.encode()
+        )
+        body.write(data)
+        body.write(b"\r\n")
+
+    body.write(f"--{boundary}--\r\n".encode())
+    return body.getvalue(), f"multipart/form-data; boundary={boundary}"
+
+
+class ASGIClient:
+    """
+    Network 없이 ASGI Application을 직접 호출하는 최소한의 HTTP Client
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def request(self, method: str, url: str, headers: dict = None, body: bytes = b"",
+                      session_id: str = None) -> tuple[int, dict, bytes]:
+        """
+        ASGI Application에 요청을 보내고 응답을 모두 받는 기능
+        :param method: HTTP Method
+        :param url: 경로와 Query String
+        :param headers: 요청 Header
+        :param body: 요청 본문
+        :param session_id: Cookie로 전달할 세션 ID
+        :return: 상태 코드, 응답 Header(소문자 키), 응답 본문 tuple[int, dict, bytes]
+        """
+        parts = urlsplit(url)
+        request_headers: dict = {"host": "image-provider.local", **{k.lower(): v for k, v in (headers or {}).items()}}
+        if session_id:
+            request_headers["cookie"] = f"session_id={session_id}"
+        if body:
+            request_headers["content-length"] = str(len(body))
+
+        scope: dict = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": parts.path,
+            "raw_path": parts.path.encode(),
+            "query_string": parts.query.encode(),
+            "root_path": "",
+            "headers": [(key.encode(), value.encode()) for key, value in request_headers.items()],
+            "client": ("127.0.0.1", 50000),
+            "server": ("image-provider.local", 80)
+        }
+
+        request_sent: bool = False
+        response: dict = {"status": 0, "headers": {}, "body": BytesIO()}
+
+        async def receive() -> dict:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # 응답을 모두 받을 때까지 연결을 유지 (StreamingResponse가 연결 종료로 판단하지 않도록 함)
+            await asyncio.Event().wait()
+
+        async def send(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = {key.decode().lower(): value.decode() for key, value in message["headers"]}
+            elif message["type"] == "http.response.body":
+                response["body"].write(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return response["status"], response["headers"], response["body"].getvalue()
+
+    async def upload(self, session_id: str, data: bytes, file_name: str = "capture.jpg",
+                     mime: str = "image/jpeg", path: str = "/upload", fields: dict = None) -> tuple[int, dict, bytes]:
+        body, content_type = make_multipart([("file", file_name, data, mime)], fields)
+        return await self.request("POST", path, {"content-type": content_type}, body, session_id=session_id)
+
+
+# Application의 Lifespan을 실행하는 기능
+@asynccontextmanager
+async def running_app():
+    """
+    main을 불러와 Lifespan(시작/종료 작업)을 실행하고 ASGI Client를 제공하는 기능
+    prepare_environment 이후에 사용해야 함
+    """
+    import main
+
+    async with main.app.router.lifespan_context(main.app):
+        yield ASGIClient(main.app)
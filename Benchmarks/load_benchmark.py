@@ -0,0 +1,340 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Load Benchmark
+
+가족, 구성원, 세션이 등록된 DB(기본값 SQLite)로 Image Provider를 실행하고
+업로드, 조회, 삭제 요청을 정해진 비율과 동시 요청 수로 보내 지연 시간(p50/p95/p99), 처리량, 메모리 사용량을 측정하는 도구
+결과는 Git Commit 정보와 함께 JSON으로 저장되며, --compare로 이전 결과와 비교할 수 있음
+
+사용 예시
+    python -m Benchmarks.load_benchmark --requests 2000 --concurrency 1 8 32 --mix upload=1,access=8,delete=1
+    python -m Benchmarks.load_benchmark --compare Benchmarks/results/load_1a2b3c4d5e6f.json
+"""
+
+# Libraries
+from time import perf_counter
+from datetime import datetime, timezone
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+
+from Benchmarks.harness import prepare_environment, seed_database, make_image, running_app
+
+operation_names: tuple[str, ...] = ("upload", "access", "delete")
+results_directory: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+# 요청 비율 문자열을 dict로 바꾸는 기능
+def parse_mix(value: str) -> dict[str, float]:
+    """
+    :param value: "upload=1,access=8,delete=1" 형식의 요청 비율
+    :return: 요청 종류별 비율 dict
+    """
+    mix: dict[str, float] = {}
+
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in operation_names:
+            raise argparse.ArgumentTypeError(f"Unknown operation: {name}")
+        mix[name] = float(weight or 1)
+
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("At least one operation needs a positive weight")
+
+    return mix
+
+
+# 현재 Process의 메모리 사용량을 불러오는 기능
+def read_memory_usage() -> dict:
+    """
+    :return: 현재(rss)와 최대(peak) 사용량 (MB) dict
+    """
+    usage: dict = {"rss_mb": None, "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}
+
+    try:
+        with open("/proc/self/status") as status_file:
+            for line in status_file:
+                if line.startswith("VmRSS:"):
+                    usage["rss_mb"] = round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+
+    return usage
+
+
+# 측정한 Commit 정보를 불러오는 기능
+def read_git_revision() -> dict:
+    def run_git(*arguments: str) -> str:
+        try:
+            return subprocess.run(["git", *arguments], capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+
+    return {
+        "commit": run_git("rev-parse", "HEAD") or "unknown",
+        "branch": run_git("rev-parse", "--abbrev-ref", "HEAD"),
+        "dirty": bool(run_git("status", "--porcelain", "--untracked-files=no"))
+    }
+
+
+# 지연 시간 목록의 백분위 값을 계산하는 기능 (Nearest-rank)
+def percentile(sorted_values: list[float], rank: float) -> float:
+    if not sorted_values:
+        return 0.0
+
+    position: int = max(0, min(len(sorted_values) - 1, int(round(rank / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[position]
+
+
+# 요청 종류별 측정 결과를 요약하는 기능
+def summarize(latencies: list[float], statuses: dict[str, int], elapsed: float) -> dict:
+    ordered: list[float] = sorted(latencies)
+    errors: int = sum(count for code, count in statuses.items() if not code.startswith(("2", "3")))
+
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "statuses": dict(sorted(statuses.items())),
+        "requests_per_second": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(ordered, 50) * 1000, 2),
+            "p95": round(percentile(ordered, 95) * 1000, 2),
+            "p99": round(percentile(ordered, 99) * 1000, 2),
+            "max": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+            "mean": round(sum(ordered) / len(ordered) * 1000, 2) if ordered else 0.0
+        }
+    }
+
+
+class LoadScenario:
+    """
+    가족 구성과 업로드된 이미지 목록을 관리하며 요청을 만드는 시나리오
+    조회는 같은 가족의 주 사용자나 보조 사용자가, 업로드와 삭제는 주 사용자가 수행함
+    """
+    def __init__(self, accounts: dict, subs_per_family: int, image_sizes: list[tuple[int, int]], seed: int):
+        self.random = random.Random(seed)
+        self.families: list[dict] = []
+        self.upload_sequence: int = 0
+
+        # seed_database는 가족마다 보조 사용자를 차례대로 만들므로 순서로 가족을 구분
+        for index, (main_id, main_session) in enumerate(accounts["main"]):
+            members = accounts["sub"][index * subs_per_family:(index + 1) * subs_per_family]
+            self.families.append({
+                "main_id": main_id,
+                "main_session": main_session,
+                "readers": [main_session, *[session_id for _, session_id in members]],
+                "images": []
+            })
+
+        self.samples: list[bytes] = [make_image(width, height) for width, height in image_sizes]
+
+    # 이미지 데이터를 만드는 기능 (중복 제거 저장공간에서 하나로 합쳐지지 않도록 끝에 고유한 값을 덧붙임)
+    def make_upload_data(self) -> bytes:
+        self.upload_sequence += 1
+        return self.random.choice(self.samples) + self.upload_sequence.to_bytes(8, "big")
+
+    # 요청 종류를 고르는 기능 (삭제할 이미지가 없으면 업로드로 대체)
+    def choose_operation(self, mix: dict[str, float]) -> str:
+        operation: str = self.random.choices(list(mix.keys()), weights=list(mix.values()))[0]
+
+        if operation in ("access", "delete") and not any(family["images"] for family in self.families):
+            return "upload"
+        return operation
+
+    async def upload(self, client) -> int:
+        family: dict = self.random.choice(self.families)
+        status_code, _, body = await client.upload(family["main_session"], self.make_upload_data())
+
+        if status_code == 201:
+            family["images"].append(json.loads(body)["result"]["file_name"])
+        return status_code
+
+    async def access(self, client) -> int:
+        family: dict = self.random.choice([family for family in self.families if family["images"]])
+        file_name: str = self.random.choice(family["images"])
+
+        status_code, _, _ = await client.request(
+            "GET", f"/access/{family['main_id']}/{file_name}", {"Accept": "image/jpeg"},
+            session_id=self.random.choice(family["readers"])
+        )
+        return status_code
+
+    async def delete(self, client) -> int:
+        family: dict = self.random.choice([family for family in self.families if family["images"]])
+        # 다른 요청이 같은 이미지를 다시 삭제하지 않도록 먼저 목록에서 제거
+        file_name: str = family["images"].pop(self.random.randrange(len(family["images"])))
+
+        status_code, _, _ = await client.request(
+            "DELETE", f"/delete/{family['main_id']}/{file_name}", session_id=family["main_session"]
+        )
+        return status_code
+
+
+async def run_load(client, scenario: LoadScenario, mix: dict[str, float], request_count: int,
+                   concurrency: int) -> dict:
+    """
+    concurrency개의 Client가 응답을 받는 즉시 다음 요청을 보내는 방식(Closed-loop)으로 부하를 주는 기능
+    :param client: ASGI Client
+    :param scenario: 요청 시나리오
+    :param mix: 요청 종류별 비율
+    :param request_count: 보낼 전체 요청 수
+    :param concurrency: 동시에 요청을 보내는 Client 수
+    :return: 전체와 요청 종류별 측정 결과 dict
+    """
+    latencies: dict[str, list[float]] = {name: [] for name in operation_names}
+    statuses: dict[str, dict[str, int]] = {name: {} for name in operation_names}
+    remaining: list[int] = [request_count]
+
+    async def worker() -> None:
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            operation: str = scenario.choose_operation(mix)
+
+            started: float = perf_counter()
+            try:
+                status_code: str = str(await getattr(scenario, operation)(client))
+            except Exception as error:
+                status_code = type(error).__name__
+            latencies[operation].append(perf_counter() - started)
+            statuses[operation][status_code] = statuses[operation].get(status_code, 0) + 1
+
+    memory_before: dict = read_memory_usage()
+    started: float = perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed: float = perf_counter() - started
+
+    merged_statuses: dict[str, int] = {}
+    for operation_statuses in statuses.values():
+        for code, count in operation_statuses.items():
+            merged_statuses[code] = merged_statuses.get(code, 0) + count
+
+    return {
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "overall": summarize([value for values in latencies.values() for value in values], merged_statuses, elapsed),
+        "operations": {
+            name: summarize(latencies[name], statuses[name], elapsed) for name in operation_names if latencies[name]
+        },
+        "memory": {"before": memory_before, "after": read_memory_usage()}
+    }
+
+
+async def run_benchmark(arguments: argparse.Namespace) -> dict:
+    accounts: dict = seed_database(arguments.families, arguments.subs_per_family)
+    scenario = LoadScenario(accounts, arguments.subs_per_family, arguments.image_size, arguments.seed)
+
+    async with running_app() as client:
+        # 조회와 삭제할 이미지를 미리 업로드
+        for _ in range(arguments.preload):
+            await scenario.upload(client)
+
+        if arguments.warmup:
+            await run_load(client, scenario, arguments.mix, arguments.warmup, max(arguments.concurrency))
+
+        runs: list[dict] = [
+            await run_load(client, scenario, arguments.mix, arguments.requests, concurrency)
+            for concurrency in arguments.concurrency
+        ]
+
+    return {
+        "benchmark": "load",
+        "revision": read_git_revision(),
+        "created_at": datetime.now(tz=timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "database": os.environ["DB_URL"].split("://")[0]
+        },
+        "config": {
+            "families": arguments.families,
+            "subs_per_family": arguments.subs_per_family,
+            "requests": arguments.requests,
+            "concurrency": arguments.concurrency,
+            "mix": arguments.mix,
+            "image_size": arguments.image_size,
+            "preload": arguments.preload,
+            "warmup": arguments.warmup,
+            "seed": arguments.seed
+        },
+        "runs": runs
+    }
+
+
+# 이전 결과와 비교하여 출력하는 기능
+def print_comparison(baseline: dict, current: dict) -> None:
+    def change(before: float, after: float) -> str:
+        return f"{(after - before) / before * 100:+.1f}%" if before else "n/a"
+
+    print(f"baseline {baseline['revision']['commit'][:12]} -> current {current['revision']['commit'][:12]}")
+    previous_runs: dict = {run["concurrency"]: run for run in baseline["runs"]}
+
+    for run in current["runs"]:
+        previous = previous_runs.get(run["concurrency"])
+        if previous is None:
+            continue
+
+        for name in ("overall", *operation_names):
+            before = previous["overall"] if name == "overall" else previous["operations"].get(name)
+            after = run["overall"] if name == "overall" else run["operations"].get(name)
+            if not before or not after:
+                continue
+
+            print(
+                f"  c={run['concurrency']:<4} {name:<8}"
+                f" rps {after['requests_per_second']:>9} ({change(before['requests_per_second'], after['requests_per_second'])})"
+                f"  p50 {after['latency_ms']['p50']:>8}ms ({change(before['latency_ms']['p50'], after['latency_ms']['p50'])})"
+                f"  p99 {after['latency_ms']['p99']:>8}ms ({change(before['latency_ms']['p99'], after['latency_ms']['p99'])})"
+            )
+
+
+if __name__ == "__main__":
+    def image_size(value: str) -> tuple[int, int]:
+        width, _, height = value.partition("x")
+        return int(width), int(height or width)
+
+    parser = argparse.ArgumentParser(description="Care-bot Image Provider load benchmark")
+    parser.add_argument("--requests", type=int, default=1000, help="동시 요청 수마다 보낼 요청 수")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("upload=1,access=8,delete=1"))
+    parser.add_argument("--families", type=int, default=20)
+    parser.add_argument("--subs-per-family", type=int, default=3)
+    parser.add_argument("--image-size", type=image_size, nargs="+", default=[(1280, 960), (640, 480)],
+                        help="업로드할 이미지 크기 (예: 1280x960)")
+    parser.add_argument("--preload", type=int, default=100, help="측정 전에 미리 업로드할 이미지 수")
+    parser.add_argument("--warmup", type=int, default=100, help="기록하지 않고 먼저 보낼 요청 수")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--db-url", help="SQLite 대신 사용할 DB (예: 테스트용 MariaDB)")
+    parser.add_argument("--transcode", action="store_true",
+                        help="업로드 후 WebP/AVIF 변환 포함 (ASGI 호출 시간에 Background 작업이 더해짐)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로 (기본값 Benchmarks/results/load_<commit>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일 경로")
+    arguments = parser.parse_args()
+
+    overrides: dict = {"DB_URL": arguments.db_url} if arguments.db_url else {}
+    if not arguments.transcode:
+        overrides["TRANSCODE_FORMATS"] = ""
+    prepare_environment(**overrides)
+
+    benchmark_report: dict = asyncio.run(run_benchmark(arguments))
+    print(json.dumps({"revision": benchmark_report["revision"], "runs": benchmark_report["runs"]}, indent=2))
+
+    output_path: str = arguments.output or os.path.join(
+        results_directory, f"load_{benchmark_report['revision']['commit'][:12]}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w") as result_file:
+        json.dump(benchmark_report, result_file, indent=2)
+    print(f"saved: {output_path}")
+
+    if arguments.compare:
+        with open(arguments.compare) as baseline_file:
+            print_comparison(json.load(baseline_file), benchmark_report)
@@ -0,0 +1,119 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Signed URL Benchmark
+
+같은 이미지를 여러 보호자 기기가 동시에 조회하는 상황에서 Cookie 인증과 서명된 URL의 처리량을 비교하는 도구
+DB 조회 횟수는 SQLAlchemy Engine의 Cursor 실행 Event로 계산함
+
+사용 예시
+    python -m Benchmarks.signed_url_benchmark --requests 2000 --concurrency 32
+"""
+
+# Libraries
+from sqlalchemy import event
+
+from time import perf_counter
+from urllib.parse import urlsplit
+import argparse
+import asyncio
+import json
+
+from Benchmarks.harness import prepare_environment, seed_database, make_image, running_app
+
+
+async def measure(client, paths: list[tuple[str, str]], concurrency: int, reset_caches=None) -> dict:
+    """
+    주어진 (경로, 세션 ID) 요청들을 동시에 보내고 처리량과 DB 조회 수를 측정하는 기능
+    :param client: ASGI Client
+    :param paths: (경로, 세션 ID) 목록
+    :param concurrency: 동시에 보낼 요청 수
+    :param reset_caches: 요청마다 호출할 Cache 초기화 기능 (Nullable)
+    :return: 측정 결과 dict
+    """
+    from Database.connector import database_instance as database
+
+    queries: list[int] = [0]
+
+    def count_query(*_):
+        queries[0] += 1
+
+    event.listen(database.engine, "before_cursor_execute", count_query)
+    semaphore = asyncio.Semaphore(concurrency)
+    failures: list[int] = [0]
+
+    async def fetch(path: str, session_id: str) -> None:
+        async with semaphore:
+            if reset_caches:
+                reset_caches()
+            status_code, _, _ = await client.request("GET", path, {"Accept": "image/jpeg"}, session_id=session_id)
+            if status_code != 200:
+                failures[0] += 1
+
+    started: float = perf_counter()
+    await asyncio.gather(*[fetch(path, session_id) for path, session_id in paths])
+    elapsed: float = perf_counter() - started
+    event.remove(database.engine, "before_cursor_execute", count_query)
+
+    return {
+        "requests": len(paths),
+        "failures": failures[0],
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(len(paths) / elapsed, 1),
+        "db_queries": queries[0],
+        "db_queries_per_request": round(queries[0] / len(paths), 3)
+    }
+
+
+async def run_benchmark(request_count: int, concurrency: int) -> dict:
+    import Database
+    from Database.authentication import session_cache
+    from Database.access import access_cache
+
+    accounts: dict = seed_database(families=1, subs_per_family=4)
+    main_id, main_session = accounts["main"][0]
+    caregiver_sessions: list[str] = [session_id for _, session_id in accounts["sub"]]
+
+    async with running_app() as client:
+        status_code, _, body = await client.upload(main_session, make_image(1280, 960))
+        result: dict = json.loads(body)["result"]
+        cookie_path: str = f"/access/{main_id}/{result['file_name']}"
+        signed_parts = urlsplit(result["signed_path"])
+        signed_path: str = f"{signed_parts.path}?{signed_parts.query}"
+
+        def reset_caches():
+            session_cache.clear()
+            access_cache.clear()
+
+        cookie_requests = [(cookie_path, caregiver_sessions[index % len(caregiver_sessions)]) for index in range(request_count)]
+        signed_requests = [(signed_path, None) for _ in range(request_count)]
+
+        report: dict = {
+            "cookie_cold_cache": await measure(client, cookie_requests, concurrency, reset_caches),
+            "cookie_warm_cache": await measure(client, cookie_requests, concurrency),
+            "signed_url": await measure(client, signed_requests, concurrency)
+        }
+        await Database.async_flush_session_activity()
+
+    report["speedup_over_cookie_warm"] = round(
+        report["signed_url"]["requests_per_second"] / report["cookie_warm_cache"]["requests_per_second"], 2
+    )
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Care-bot Image Provider signed URL benchmark")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    arguments = parser.parse_args()
+
+    # 파일 전송 비용을 제외하고 인증 비용만 비교하기 위해 X-Accel-Redirect 모드로 실행
+    prepare_environment(URL_SIGNING_KEYS="bench:benchmark-secret", DELIVERY_MODE="accel")
+    benchmark_report: dict = asyncio.run(run_benchmark(arguments.requests, arguments.concurrency))
+    print(json.dumps(benchmark_report, indent=2))
+
+    if arguments.output:
+        with open(arguments.output, "w") as result_file:
+            json.dump(benchmark_report, result_file, indent=2)
@@ -0,0 +1,112 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Storage Backend Check
+
+설정된 저장공간(STORAGE_BACKEND)의 저장, 조회, 크기 확인, 조각 읽기, 삭제와 업로드/조회/삭제 흐름을 확인하는 도구
+S3 저장소는 Multipart Upload가 사용되도록 S3_MULTIPART_THRESHOLD보다 큰 파일로 확인하고,
+로컬 사본을 지운 후 조회하여 다른 Host가 저장한 이미지를 내려받는 경우를 확인함
+
+사용 예시
+    python -m Benchmarks.storage_check
+    docker compose --profile storage up -d minio
+    STORAGE_BACKEND=s3 S3_ENDPOINT_URL=http://127.0.0.1:9000 S3_BUCKET=carebot-images \\
+        S3_ACCESS_KEY_ID=minioadmin S3_SECRET_ACCESS_KEY=minioadmin python -m Benchmarks.storage_check --create-bucket
+"""
+
+# Libraries
+import argparse
+import asyncio
+import json
+import os
+import sys
+import uuid
+
+from Benchmarks.harness import prepare_environment, seed_database, make_image, running_app
+
+
+async def check_storage_backend(create_bucket: bool) -> list[str]:
+    """
+    저장공간 기능을 직접 호출한 후 서버를 통해 업로드, 조회, 삭제하여 결과를 검증하는 기능
+    :param create_bucket: S3 저장소의 Bucket이 없으면 만들지 여부
+    :return: 실패한 항목의 설명 list[str]
+    """
+    from Utilities.storage_tools import storage_backend
+    from Utilities.blob_tools import blob_directory, blob_storage
+
+    failures: list[str] = []
+
+    def expect(condition: bool, message: str) -> None:
+        print(("ok   " if condition else "FAIL ") + message)
+        if not condition:
+            failures.append(message)
+
+    print(f"backend: {type(storage_backend).__name__}")
+    if create_bucket and storage_backend.remote:
+        client = storage_backend.get_client()
+        if storage_backend.bucket not in [bucket["Name"] for bucket in client.list_buckets().get("Buckets", [])]:
+            client.create_bucket(Bucket=storage_backend.bucket)
+
+    # 저장공간 기능 확인 (S3 저장소는 Multipart Upload가 사용되는 크기)
+    size: int = getattr(storage_backend, "multipart_threshold", 256 * 1024) + 1024 * 1024 + 17
+    data: bytes = os.urandom(size)
+    key: str = os.path.join(blob_directory, "check", uuid.uuid4().hex)
+    source_path: str = os.path.join(blob_storage, f".upload_{uuid.uuid4().hex}.tmp")
+    with open(source_path, "wb") as buffer:
+        buffer.write(data)
+
+    await storage_backend.async_put_file(source_path, key)
+    expect(not os.path.exists(source_path), "put moves the source file")
+    expect(await storage_backend.async_stat(key) == size, "stat returns the stored size")
+    expect(await storage_backend.async_get(key) == data, "get returns the stored bytes")
+    chunks: list[bytes] = [chunk async for chunk in storage_backend.stream(key, 64 * 1024)]
+    expect(b"".join(chunks) == data and len(chunks) > 1, "stream returns the stored bytes in chunks")
+
+    if storage_backend.remote:
+        os.remove(storage_backend.local_path(key))
+    local_path: str = await storage_backend.async_localize(key)
+    with open(local_path, "rb") as buffer:
+        expect(buffer.read() == data, "localize provides a readable local copy")
+
+    await storage_backend.async_delete(key)
+    expect(await storage_backend.async_stat(key) is None, "delete removes the stored file")
+    expect(not os.path.exists(local_path), "delete removes the local copy")
+
+    # 서버를 통한 업로드, 조회, 삭제 확인
+    accounts: dict = seed_database(families=1, subs_per_family=1)
+    main_id, main_session = accounts["main"][0]
+    _, sub_session = accounts["sub"][0]
+    original: bytes = make_image()
+
+    async with running_app() as client:
+        status_code, _, body = await client.upload(main_session, original)
+        expect(status_code == 201, "upload returns 201")
+        file_name: str = json.loads(body)["result"]["file_name"]
+
+        from Utilities.index_tools import get_image_record
+        image_data: dict = get_image_record(main_id, file_name)
+        expect(await storage_backend.async_stat(image_data["path"]) == len(original), "uploaded image is stored")
+
+        # 다른 Host처럼 로컬 사본이 없는 상태에서 조회
+        if storage_backend.remote:
+            os.remove(storage_backend.local_path(image_data["path"]))
+        status_code, _, body = await client.request(
+            "GET", f"/access/{main_id}/{file_name}", {"Accept": "image/jpeg"}, session_id=sub_session
+        )
+        expect(status_code == 200 and body == original, "family member gets the stored bytes")
+
+        status_code, _, _ = await client.request("DELETE", f"/delete/{main_id}/{file_name}", session_id=main_session)
+        expect(status_code == 200, "delete returns 200")
+        expect(await storage_backend.async_stat(image_data["path"]) is None, "last reference removes the stored image")
+
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Care-bot Image Provider storage backend check")
+    parser.add_argument("--create-bucket", action="store_true")
+    arguments = parser.parse_args()
+
+    prepare_environment(TRANSCODE_FORMATS="", HOT_IMAGE_CACHE_SIZE="0")
+    sys.exit(1 if asyncio.run(check_storage_backend(arguments.create_bucket)) else 0)
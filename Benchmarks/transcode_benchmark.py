@@ -0,0 +1,139 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Transcoding Benchmark
+
+사용 예시
+    python -m Benchmarks.transcode_benchmark --source /app/Storage --workers 1 4 --output transcode.json
+"""
+
+# Libraries
+from PIL import Image, ImageDraw, ImageFilter
+
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from time import perf_counter
+import argparse
+import json
+import multiprocessing
+import os
+
+import filetype
+
+from Utilities.image_tools import transcode_image, is_format_supported
+
+
+# 실제 사진과 비슷한 특성을 가진 예제 이미지를 만드는 기능
+def make_sample_images(count: int) -> list[tuple[str, bytes]]:
+    """
+    Gradient, 도형, Noise를 섞어 사진과 비슷한 예제 이미지를 만드는 기능 (JPEG, PNG 절반씩)
+    :param count: 만들 이미지 수
+    :return: (MIME 형식, 이미지 데이터) list[tuple[str, bytes]]
+    """
+    samples: list[tuple[str, bytes]] = []
+
+    for index in range(count):
+        image = Image.linear_gradient("L").resize((1280, 960)).convert("RGB")
+        draw = ImageDraw.Draw(image)
+        for shape in range(12):
+            offset: int = (index * 37 + shape * 91) % 1000
+            draw.ellipse((offset, offset // 2, offset + 240, offset // 2 + 180), fill=(offset % 255, 120, 200 - offset % 200))
+        noise = Image.effect_noise((1280, 960), 24).convert("RGB")
+        image = Image.blend(image, noise, 0.15).filter(ImageFilter.SMOOTH)
+
+        output = BytesIO()
+        if index % 2 == 0:
+            image.save(output, format="JPEG", quality=92)
+            samples.append(("image/jpeg", output.getvalue()))
+        else:
+            image.save(output, format="PNG")
+            samples.append(("image/png", output.getvalue()))
+
+    return samples
+
+
+# 저장공간에서 JPEG, PNG 이미지를 불러오는 기능
+def load_source_images(source: str, limit: int) -> list[tuple[str, bytes]]:
+    samples: list[tuple[str, bytes]] = []
+
+    for root, directories, files in os.walk(source):
+        directories[:] = [directory for directory in directories if not directory.startswith(".")]
+        for file_name in files:
+            with open(os.path.join(root, file_name), "rb") as buffer:
+                data: bytes = buffer.read()
+            file_type = filetype.guess(data[:2048])
+            if file_type is not None and file_type.mime in ("image/jpeg", "image/png"):
+                samples.append((file_type.mime, data))
+            if len(samples) >= limit:
+                return samples
+
+    return samples
+
+
+# 이미지 하나를 변환하고 걸린 시간을 측정하는 기능 (Process Pool에서 실행)
+def measure_transcode(data: bytes, mime: str) -> tuple[int, float]:
+    started: float = perf_counter()
+    output: bytes = transcode_image(data, mime)
+    return len(output), perf_counter() - started
+
+
+# 주어진 형식과 Worker 수로 변환 성능을 측정하는 기능
+def run_benchmark(samples: list[tuple[str, bytes]], mime: str, workers: int) -> dict:
+    """
+    모든 예제 이미지를 주어진 형식으로 변환하고 용량 절감과 변환 시간을 측정하는 기능
+    :param samples: (MIME 형식, 이미지 데이터) 목록
+    :param mime: 변환할 형식
+    :param workers: Process Pool 크기
+    :return: 측정 결과 dict
+    """
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        list(pool.map(measure_transcode, [samples[0][1]] * workers, [mime] * workers))  # Worker 준비
+
+        started: float = perf_counter()
+        results = list(pool.map(measure_transcode, [data for _, data in samples], [mime] * len(samples)))
+        elapsed: float = perf_counter() - started
+
+    input_bytes: int = sum(len(data) for _, data in samples)
+    output_bytes: int = sum(size for size, _ in results)
+    encode_times: list[float] = sorted(duration for _, duration in results)
+
+    return {
+        "format": mime,
+        "workers": workers,
+        "images": len(samples),
+        "input_bytes": input_bytes,
+        "output_bytes": output_bytes,
+        "saved_ratio": round(1 - output_bytes / input_bytes, 4) if input_bytes else 0,
+        "encode_ms_mean": round(sum(encode_times) / len(encode_times) * 1000, 2),
+        "encode_ms_p95": round(encode_times[int(len(encode_times) * 0.95) - 1] * 1000, 2),
+        "images_per_second": round(len(samples) / elapsed, 2),
+        "images_per_second_per_core": round(len(samples) / elapsed / workers, 2)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Care-bot Image Provider transcoding benchmark")
+    parser.add_argument("--source", help="JPEG/PNG 이미지를 불러올 경로 (없으면 예제 이미지 생성)")
+    parser.add_argument("--count", type=int, default=24, help="사용할 이미지 수")
+    parser.add_argument("--formats", nargs="+", default=["image/webp", "image/avif"])
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, os.cpu_count() or 1])
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    arguments = parser.parse_args()
+
+    sample_images = load_source_images(arguments.source, arguments.count) if arguments.source \
+        else make_sample_images(arguments.count)
+
+    report: list[dict] = []
+    for target_mime in arguments.formats:
+        if not is_format_supported(target_mime):
+            print(f"skip {target_mime}: not supported by this Pillow build")
+            continue
+        for worker_count in arguments.workers:
+            result: dict = run_benchmark(sample_images, target_mime, worker_count)
+            report.append(result)
+            print(json.dumps(result))
+
+    if arguments.output:
+        with open(arguments.output, "w") as result_file:
+            json.dump(report, result_file, indent=2)
@@ -6,7 +6,9 @@ Database
 """
 
 from .accounts import (
-    get_one_account
+    get_one_account,
+    get_account_role,
+    get_account_ids_by_role
 )
 
 from .families import (
@@ -18,6 +20,27 @@ from .members import (
     get_all_members
 )
 
+from .access import (
+    get_accessible_ids,
+    invalidate_accessible_ids,
+    get_access_cache_stats
+)
+
 from .authentication import (
-    check_current_user
-)
\ No newline at end of file
+    check_current_user,
+    get_session_cache_stats,
+    flush_session_activity,
+    cleanup_login_sessions
+)
+
+from .asynchronous import (
+    async_get_one_account,
+    async_get_account_role,
+    async_main_id_to_family_id,
+    async_get_one_family,
+    async_get_all_members,
+    async_get_accessible_ids,
+    async_flush_session_activity,
+    async_cleanup_login_sessions,
+    async_check_current_user
+)
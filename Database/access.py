@@ -0,0 +1,99 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Database Access Control Part
+"""
+
+# Library
+from Database.connector import database_instance as database
+from Database.models import *
+
+from sqlalchemy.exc import SQLAlchemyError
+
+import os
+from dotenv import load_dotenv
+
+from Utilities.logging_tools import *
+from Utilities.worker_tools import make_shared_cache
+
+logger = get_logger("DB_Access")
+
+# 접근 권한 Cache 설정 (user_id -> 접근 가능한 소유자 ID 집합)
+load_dotenv()
+access_cache_ttl: int = int(os.getenv("ACL_CACHE_TTL", 60))
+access_cache_size: int = int(os.getenv("ACL_CACHE_SIZE", 4096))
+access_cache = make_shared_cache("access", access_cache_size, access_cache_ttl, encode=sorted, decode=frozenset)
+
+
+# 접근 권한 Cache 사용 현황 불러오기
+def get_access_cache_stats() -> dict:
+    """
+    접근 권한 Cache의 항목 수와 적중/실패 횟수를 불러오는 기능
+    :return: 접근 권한 Cache 사용 현황 dict
+    """
+    return access_cache.stats()
+
+
+# 사용자가 이미지를 볼 수 있는 소유자 ID 집합 불러오기
+def get_accessible_ids(user_id: str, role: Role) -> frozenset[str]:
+    """
+    사용자가 이미지를 볼 수 있는 소유자 ID 집합을 하나의 Join Query로 불러오는 기능
+    주 사용자는 소속된 가족의 구성원, 보조 사용자는 소속된 가족들의 주 사용자까지 접근 가능
+    :param user_id: 요청한 사용자의 ID
+    :param role: 요청한 사용자의 역할
+    :return: 접근 가능한 소유자 ID 집합 frozenset[str]
+    """
+    cached_ids: frozenset = access_cache.get(user_id)
+    if cached_ids is not None:
+        return cached_ids
+
+    return load_accessible_ids(user_id, role)
+
+
+# DB에서 사용자가 이미지를 볼 수 있는 소유자 ID 집합 불러오기
+def load_accessible_ids(user_id: str, role: Role) -> frozenset[str]:
+    """
+    DB에서 접근 가능한 소유자 ID 집합을 계산하고 Cache에 저장하는 기능
+    :param user_id: 요청한 사용자의 ID
+    :param role: 요청한 사용자의 역할
+    :return: 접근 가능한 소유자 ID 집합 frozenset[str]
+    """
+    result: frozenset[str] = frozenset([user_id])
+
+    if role not in (Role.MAIN, Role.SUB):
+        return result
+
+    database_pre_session = database.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            if role == Role.MAIN:  # 주 사용자의 가족에 소속된 구성원
+                owner_list = session.query(MemberRelationsTable.user_id).join(
+                    FamiliesTable, FamiliesTable.id == MemberRelationsTable.family_id
+                ).filter(FamiliesTable.main_user == user_id).all()
+            else:  # 보조 사용자가 소속된 가족들의 주 사용자
+                owner_list = session.query(FamiliesTable.main_user).join(
+                    MemberRelationsTable, MemberRelationsTable.family_id == FamiliesTable.id
+                ).filter(MemberRelationsTable.user_id == user_id).all()
+
+            result = frozenset([user_id, *[data[0] for data in owner_list]])
+            access_cache.set(user_id, result)
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error getting accessible ids: {str(error)}")
+            result = frozenset([user_id])
+        finally:
+            return result
+
+
+# 사용자의 접근 권한 Cache 비우기
+def invalidate_accessible_ids(user_id: str = None) -> None:
+    """
+    사용자의 접근 권한 Cache를 삭제하는 기능 (ID가 없으면 전체 삭제)
+    :param user_id: 접근 권한을 다시 계산할 사용자의 ID (Nullable)
+    :return: None
+    """
+    if user_id:
+        access_cache.invalidate(user_id)
+    else:
+        access_cache.clear()
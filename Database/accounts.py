@@ -11,10 +11,20 @@ from Database.models import *
 
 from sqlalchemy.exc import SQLAlchemyError
 
+import os
+from dotenv import load_dotenv
+
 from Utilities.logging_tools import *
+from Utilities.worker_tools import make_shared_cache
 
 logger = get_logger("DB_Accounts")
 
+# 사용자 역할 Cache 설정 (account_id -> Role, 업로드 우선 순위 분류 등 역할만 필요한 경우 DB를 거치지 않기 위함)
+load_dotenv()
+role_cache_ttl: int = int(os.getenv("ROLE_CACHE_TTL", 60))
+role_cache_size: int = int(os.getenv("ROLE_CACHE_SIZE", 10000))
+role_cache = make_shared_cache("role", role_cache_size, role_cache_ttl, encode=lambda role: role.value, decode=Role)
+
 
 # 사용자 계정 정보 불러오기
 def get_one_account(account_id: str) -> dict:
@@ -49,6 +59,7 @@ def get_one_account(account_id: str) -> dict:
                     "address": account_data[6]
                 }
                 result = serialized_data
+                role_cache.set(account_id, account_data[2])
             else:
                 result = {}
         except SQLAlchemyError as error:
@@ -57,3 +68,43 @@ def get_one_account(account_id: str) -> dict:
             result = {}
         finally:
             return result
+
+
+# 사용자 역할 불러오기
+def get_account_role(account_id: str) -> Role | None:
+    """
+    Cache에 저장된 사용자 역할을 불러오고, 없으면 계정 정보를 불러와 저장하는 기능
+    :param account_id: 사용자의 ID
+    :return: 사용자 역할 Role (계정이 없으면 None)
+    """
+    cached_role: Role = role_cache.get(account_id)
+    if cached_role is not None:
+        return cached_role
+
+    account_data: dict = get_one_account(account_id)
+    return account_data["role"] if account_data else None
+
+
+# 역할별 사용자 ID 목록 불러오기
+def get_account_ids_by_role(roles: list[Role]) -> list[str]:
+    """
+    주어진 역할을 가진 모든 사용자의 ID를 불러오는 기능
+    :param roles: 사용자 역할 목록
+    :return: 사용자 ID 목록 list[str]
+    """
+    result: list[str] = []
+
+    if not roles:
+        return result
+
+    database_pre_session = database.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            account_list = session.query(AccountsTable.id).filter(AccountsTable.role.in_(roles)).all()
+            result = [data[0] for data in account_list]
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error getting account ids by role: {str(error)}")
+            result = []
+        finally:
+            return result
@@ -0,0 +1,96 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Database Asynchronous Part
+"""
+
+# Library
+from Database.connector import database_instance as database
+from Database.models import *
+
+from Database.accounts import role_cache, get_one_account, get_account_role
+from Database.families import main_id_to_family_id, get_one_family
+from Database.members import get_all_members
+from Database.access import access_cache, load_accessible_ids
+from Database.authentication import (
+    session_cache,
+    activity_buffer,
+    load_current_user,
+    flush_session_activity,
+    cleanup_login_sessions
+)
+
+from fastapi import Request
+
+from time import time
+
+from Utilities.metrics_tools import stage_timer
+
+
+# ========== Event Loop를 막지 않는 DB 기능 ==========
+# 모든 DB 작업은 Connection Pool 크기로 제한된 전용 Thread Pool에서 실행되며,
+# Cache에 적중한 경우에는 Thread Pool을 거치지 않고 바로 반환함
+
+async def async_get_one_account(account_id: str) -> dict:
+    with stage_timer("account"):
+        return await database.run(get_one_account, account_id)
+
+
+async def async_get_account_role(account_id: str) -> Role | None:
+    with stage_timer("account"):
+        cached_role: Role = role_cache.get(account_id)
+        if cached_role is not None:
+            return cached_role
+
+        return await database.run(get_account_role, account_id)
+
+
+async def async_main_id_to_family_id(main_id: str) -> str:
+    return await database.run(main_id_to_family_id, main_id)
+
+
+async def async_get_one_family(family_id: str) -> dict:
+    return await database.run(get_one_family, family_id)
+
+
+async def async_get_all_members(family_id: str = None, user_id: str = None) -> list[dict]:
+    return await database.run(get_all_members, family_id=family_id, user_id=user_id)
+
+
+async def async_get_accessible_ids(user_id: str, role: Role) -> frozenset[str]:
+    with stage_timer("acl"):
+        cached_ids: frozenset = access_cache.get(user_id)
+        if cached_ids is not None:
+            return cached_ids
+
+        return await database.run(load_accessible_ids, user_id, role)
+
+
+async def async_flush_session_activity() -> int:
+    return await database.run(flush_session_activity)
+
+
+async def async_cleanup_login_sessions() -> int:
+    return await database.run(cleanup_login_sessions)
+
+
+async def async_check_current_user(request: Request) -> str:
+    """
+    요청한 자료 내의 Cookie 값을 이용해 사용자 ID를 식별하는 기능 (비동기)
+    :param request: 사용자가 요청한 자료 덩어리
+    :return: 해당 사용자의 ID str
+    """
+    session_id: str = request.cookies.get("session_id")
+
+    if not session_id:
+        return ""
+
+    with stage_timer("session"):
+        cached_user_id: str = session_cache.get(session_id)
+        if cached_user_id is not None:
+            if activity_buffer.touch(session_id, time()):
+                await database.run(flush_session_activity)
+            return cached_user_id
+
+        return await database.run(load_current_user, session_id)
@@ -8,6 +8,7 @@ Database Authentication Part
 # Library
 from Database.connector import database_instance as database
 from Database.models import *
+from Database.accounts import role_cache
 
 from fastapi import Request
 
@@ -17,12 +18,12 @@ from sqlalchemy.exc import SQLAlchemyError
 from datetime import timezone, datetime, timedelta
 from time import time
 
-from asyncio import sleep
-
 import os
 from dotenv import load_dotenv
 
 from Utilities.logging_tools import *
+from Utilities.cache_tools import WriteBehindBuffer
+from Utilities.worker_tools import make_shared_cache
 
 logger = get_logger("DB_Authentication")
 
@@ -30,6 +31,113 @@ logger = get_logger("DB_Authentication")
 load_dotenv()
 session_expire_time: int = int(os.getenv("SESSION_EXPIRE_TIME", 1800))
 session_cleanup_interval: int = int(os.getenv("SESSION_CLEANUP_INTERVAL", 600))
+session_cleanup_batch: int = int(os.getenv("SESSION_CLEANUP_BATCH", 500))
+
+# 세션 Cache 설정 (session_id -> user_id)
+session_cache_ttl: int = int(os.getenv("SESSION_CACHE_TTL", 60))
+session_cache_size: int = int(os.getenv("SESSION_CACHE_SIZE", 10000))
+session_cache = make_shared_cache("session", session_cache_size, session_cache_ttl)
+
+# 최근 접근 기록 지연 반영 설정 (반영 주기는 만료 판정 허용 오차를 넘지 않음)
+session_expire_skew: int = int(os.getenv("SESSION_EXPIRE_SKEW", 30))
+activity_flush_interval: float = min(float(os.getenv("ACTIVITY_FLUSH_INTERVAL", 5)), session_expire_skew)
+activity_flush_size: int = int(os.getenv("ACTIVITY_FLUSH_SIZE", 200))
+activity_buffer = WriteBehindBuffer(max_size=activity_flush_size)
+
+
+# 세션 Cache 사용 현황 불러오기
+def get_session_cache_stats() -> dict:
+    """
+    세션 Cache의 항목 수와 적중/실패 횟수를 불러오는 기능
+    :return: 세션 Cache 사용 현황 dict
+    """
+    return session_cache.stats()
+
+
+# 세션의 최근 접근 기록 남기기
+def touch_session(session_id: str) -> None:
+    """
+    세션의 최근 접근 시각을 버퍼에 기록하고, 버퍼가 가득 찬 경우 바로 반영하는 기능
+    :param session_id: 접근한 세션 ID
+    :return: None
+    """
+    if activity_buffer.touch(session_id, time()):
+        flush_session_activity()
+
+
+# 모아둔 최근 접근 기록을 한 번에 반영하기
+def flush_session_activity() -> int:
+    """
+    버퍼에 모아둔 세션들의 최근 접근 시각을 하나의 UPDATE로 반영하는 기능
+    :return: 반영한 세션 수 int
+    """
+    touched: dict = activity_buffer.drain()
+
+    if not touched:
+        return 0
+
+    database_pre_session = database.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            session.query(LoginSessionsTable).filter(
+                LoginSessionsTable.xid.in_(list(touched.keys()))
+            ).update({
+                LoginSessionsTable.last_active: func.now()
+            }, synchronize_session=False)
+            session.commit()
+            return len(touched)
+        except SQLAlchemyError as error:
+            session.rollback()
+            activity_buffer.restore(touched)
+            logger.error(f"Error flushing session activity: {str(error)}")
+            return 0
+
+
+# 만료된 세션을 일정 개수씩 삭제하기
+def cleanup_login_sessions(batch_size: int = session_cleanup_batch) -> int:
+    """
+    마지막 접근 이후 만료 시간이 지난 보조 사용자 세션을 일정 개수씩 나누어 삭제하는 기능
+    한 번에 많은 행을 잠그지 않도록 batch_size 단위로 나누어 삭제함
+    :param batch_size: 한 번에 삭제할 세션 수
+    :return: 삭제한 세션 수 int
+    """
+    removed: int = 0
+    expired_before = datetime.now(tz=timezone.utc).replace(tzinfo=None) - timedelta(
+        seconds=session_expire_time + session_expire_skew
+    )
+
+    database_pre_session = database.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            while True:
+                expired_ids: list[str] = [data[0] for data in session.query(LoginSessionsTable.xid).filter(
+                    LoginSessionsTable.is_main_user.is_(False),
+                    LoginSessionsTable.last_active < expired_before
+                ).limit(batch_size).all()]
+
+                # 이 Worker에서 아직 반영하지 않은 최근 접근 기록이 있는 세션은 제외
+                target_ids: list[str] = [
+                    session_id for session_id in expired_ids
+                    if activity_buffer.pending(session_id) < expired_before.replace(tzinfo=timezone.utc).timestamp()
+                ]
+
+                if target_ids:
+                    session.query(LoginSessionsTable).filter(
+                        LoginSessionsTable.xid.in_(target_ids)
+                    ).delete(synchronize_session=False)
+                    session.commit()
+
+                    for session_id in target_ids:
+                        session_cache.invalidate(session_id)
+                    removed += len(target_ids)
+
+                if len(expired_ids) < batch_size or not target_ids:
+                    break
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error cleaning up login sessions: {str(error)}")
+        finally:
+            return removed
 
 
 # 현재 사용자 정보 가져오기
@@ -46,35 +154,63 @@ def check_current_user(request: Request) -> str:
     if not session_id:
         return user_id
 
+    # Cache에 유효한 세션 정보가 있으면 DB에 접근하지 않음
+    cached_user_id: str = session_cache.get(session_id)
+    if cached_user_id is not None:
+        touch_session(session_id)
+        return cached_user_id
+
+    return load_current_user(session_id)
+
+
+# DB에서 세션 정보를 확인해 사용자 정보 가져오기
+def load_current_user(session_id: str) -> str:
+    """
+    DB에 저장된 세션 정보를 확인하여 사용자 ID를 식별하고 Cache에 저장하는 기능
+    :param session_id: 사용자의 세션 ID
+    :return: 해당 사용자의 ID str
+    """
+    user_id: str = ""
+
     database_pre_session = database.get_pre_session()
     with database_pre_session() as session:
         try:
-            login_data = session.query(LoginSessionsTable).filter(LoginSessionsTable.xid == session_id).first()
+            # 업로드 우선 순위 분류 등에서 다시 조회하지 않도록 사용자 역할도 함께 불러옴
+            session_data = session.query(LoginSessionsTable, AccountsTable.role).outerjoin(
+                AccountsTable, AccountsTable.id == LoginSessionsTable.user_id
+            ).filter(LoginSessionsTable.xid == session_id).first()
 
             # DB에 해당하는 세션 정보가 존재하는지 확인
-            if login_data is None:
+            if session_data is None:
                 return user_id
+            login_data, role = session_data
 
             # Main User가 아닌 경우 세션 만료를 적용
             if not login_data.is_main_user:
                 current_time: int = int(time())
                 last_active_time = login_data.last_active.replace(tzinfo=timezone.utc)
-                last_active: int = int(last_active_time.timestamp())
+                last_active: int = int(max(last_active_time.timestamp(), activity_buffer.pending(session_id)))
 
-                # 시간 초과로 세션이 만료되었는지 확인
-                if current_time - last_active > session_expire_time:
+                # 시간 초과로 세션이 만료되었는지 확인 (다른 Worker의 반영 지연을 고려해 허용 오차 적용)
+                if current_time - last_active > session_expire_time + session_expire_skew:
+                    session_cache.invalidate(session_id)
+                    activity_buffer.discard(session_id)
                     session.delete(login_data)
                     session.commit()
                     return user_id
 
-            # 최근 접근 기록 갱신하기
-            session.query(LoginSessionsTable).filter(
-                LoginSessionsTable.xid == session_id
-            ).update({
-                LoginSessionsTable.last_active: func.now()
-            })
+            # 최근 접근 기록 갱신하기 (버퍼에 모아두었다가 한 번에 반영)
+            touch_session(session_id)
 
             user_id = login_data.user_id
+            if role is not None:
+                role_cache.set(user_id, role)
+
+            # 주 사용자가 아닌 경우 만료 시간보다 오래 Cache에 남지 않도록 설정
+            if login_data.is_main_user:
+                session_cache.set(session_id, user_id)
+            else:
+                session_cache.set(session_id, user_id, ttl=session_expire_time)
         except SQLAlchemyError as error:
             session.rollback()
             logger.error(f"Error checking current user: {str(error)}")
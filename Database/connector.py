@@ -9,9 +9,16 @@ Database Connector
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+
 import os
 from dotenv import load_dotenv
 
+from Utilities.metrics_tools import TimedQueuePool
+from Utilities.worker_tools import split_connection_budget
+
 
 class Database:
     def __init__(self):
@@ -23,14 +30,28 @@ class Database:
         self.password = os.getenv("DB_PASSWORD")
         self.schema = os.getenv("DB_SCHEMA")
         self.charset = os.getenv("DB_CHARSET", "utf8")
+        self.connection_budget = int(os.getenv("DB_CONNECTION_BUDGET", 64))
 
-        # Connection Pool 방식 SQL 연결 생성
-        self.engine = create_engine(
+        # 여러 Worker로 실행되는 경우 전체 Connection 수가 한도를 넘지 않도록 Worker별 Pool 크기를 줄임
+        self.pool_size, self.max_overflow = split_connection_budget(
+            int(os.getenv("DB_POOL_SIZE", 10)),
+            int(os.getenv("DB_MAX_OVERFLOW", 5)),
+            self.connection_budget
+        )
+
+        # DB_URL이 주어지면 해당 DB를 사용 (성능 측정 등에서 SQLite로 대체하기 위함)
+        self.url = os.getenv("DB_URL") or (
             f"mysql+pymysql://{self.user}:"+
             f"{self.password}@{self.host}:{self.port}/"+
-            f"{self.schema}?charset={self.charset}",
-            pool_size=10,
-            max_overflow=5,
+            f"{self.schema}?charset={self.charset}"
+        )
+
+        # Connection Pool 방식 SQL 연결 생성 (Connection 대기 시간을 측정하는 Pool 사용)
+        self.engine = create_engine(
+            self.url,
+            poolclass=TimedQueuePool,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
             pool_recycle=120,
             pool_pre_ping=True,
             echo=False
@@ -43,8 +64,23 @@ class Database:
             bind=self.engine
         )
 
+        # DB 작업 전용 Thread Pool (Connection Pool이 허용하는 개수만큼만 동시에 실행)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.pool_size + self.max_overflow,
+            thread_name_prefix="database"
+        )
+
     # DB 연결을 위한 Pre Session을 반환하는 기능
     def get_pre_session(self):
         return self.pre_session
 
+    # 동기 DB 기능을 전용 Thread Pool에서 실행하는 기능
+    async def run(self, function, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(function, *args, **kwargs))
+
+    # 전용 Thread Pool을 종료하는 기능
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
 database_instance = Database()
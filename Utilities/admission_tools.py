@@ -0,0 +1,244 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Admission Tools
+
+동시에 처리하는 업로드 수를 제한하고, 과부하 상황에서도 시스템(Care-bot 기기) 계정의 업로드가 먼저 처리되도록 하는 도구
+일부 자리는 우선 순위가 높은 요청만 사용할 수 있도록 남겨두며, 자리가 나면 높은 우선 순위의 대기 요청부터 들어감
+일반 요청은 대기열이 가득 차면 바로 429, 대기 시간이 길어지면 503으로 거절함 (Retry-After 포함)
+"""
+
+# Libraries
+from fastapi.responses import JSONResponse
+
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Awaitable, Callable
+
+import asyncio
+import time
+import os
+from dotenv import load_dotenv
+
+from Utilities.logging_tools import *
+from Utilities.metrics_tools import registry
+
+logger = get_logger("Admission")
+
+# 유입 제어 설정 불러오기
+load_dotenv()
+upload_concurrency: int = int(os.getenv("UPLOAD_CONCURRENCY", 32))
+upload_high_reserved: int = int(os.getenv("UPLOAD_HIGH_RESERVED", 4))
+disk_write_concurrency: int = int(os.getenv("DISK_WRITE_CONCURRENCY", 8))
+disk_write_high_reserved: int = int(os.getenv("DISK_WRITE_HIGH_RESERVED", 2))
+admission_queue_size: int = int(os.getenv("ADMISSION_QUEUE_SIZE", 64))
+admission_queue_timeout: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", 5))
+admission_retry_after: int = int(os.getenv("ADMISSION_RETRY_AFTER", 2))
+
+admission_wait_histogram = registry.histogram(
+    "image_admission_wait_seconds", "Time spent waiting for an admission slot", ("controller", "priority")
+)
+admission_rejected_counter = registry.counter(
+    "image_admission_rejected_total", "Requests rejected by admission control", ("controller", "priority", "reason")
+)
+
+
+class Priority(str, Enum):
+    HIGH = "high"  # 시스템(Care-bot 기기) 계정의 업로드
+    NORMAL = "normal"
+
+
+class AdmissionRejected(Exception):
+    """
+    과부하로 요청을 받을 수 없는 경우 발생하는 예외
+    """
+    def __init__(self, reason: str, status_code: int, retry_after: int):
+        super().__init__(f"Admission rejected: {reason}")
+        self.reason = reason
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    우선 순위별 대기열을 가진 동시 실행 제한 기능 (Worker의 Event Loop 안에서만 사용)
+    """
+    def __init__(self, name: str, limit: int, high_reserved: int, queue_size: int = admission_queue_size,
+                 queue_timeout: float = admission_queue_timeout, retry_after: int = admission_retry_after):
+        """
+        :param name: 제어 대상 이름 (측정값 Label)
+        :param limit: 동시에 실행할 수 있는 전체 요청 수
+        :param high_reserved: 높은 우선 순위 요청만 사용할 수 있는 자리 수
+        :param queue_size: 일반 요청이 기다릴 수 있는 최대 개수 (넘으면 429)
+        :param queue_timeout: 일반 요청이 기다리는 최대 시간 (초, 넘으면 503)
+        :param retry_after: 거절할 때 알려줄 재시도 대기 시간 (초)
+        """
+        self.name = name
+        self.limit = max(limit, 1)
+        self.high_reserved = min(max(high_reserved, 0), self.limit - 1)
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.in_flight: dict[Priority, int] = {priority: 0 for priority in Priority}
+        self.waiters: dict[Priority, deque[asyncio.Future]] = {priority: deque() for priority in Priority}
+
+    # 지금 바로 들어갈 수 있는지 확인하는 기능
+    def has_room(self, priority: Priority) -> bool:
+        used: int = sum(self.in_flight.values())
+        if priority is Priority.HIGH:
+            return used < self.limit
+
+        # 일반 요청은 남겨둔 자리를 쓰지 못하고, 높은 우선 순위 요청이 기다리는 동안에는 들어가지 못함
+        return used < self.limit - self.high_reserved and not self.waiters[Priority.HIGH]
+
+    # 자리가 나면 대기 중인 요청을 우선 순위 순서대로 들여보내는 기능
+    def wake_waiters(self) -> None:
+        for priority in Priority:
+            waiters = self.waiters[priority]
+            while waiters and self.has_room(priority):
+                future = waiters.popleft()
+                if not future.done():
+                    self.in_flight[priority] += 1  # 자리를 넘겨준 후 깨움
+                    future.set_result(None)
+
+    def reject(self, priority: Priority, reason: str, status_code: int) -> AdmissionRejected:
+        admission_rejected_counter.inc((self.name, priority.value, reason))
+        return AdmissionRejected(reason, status_code, self.retry_after)
+
+    async def acquire(self, priority: Priority) -> None:
+        """
+        자리를 얻을 때까지 기다리는 기능 (높은 우선 순위 요청은 거절하지 않고 기다림)
+        :param priority: 요청의 우선 순위
+        :return: None (거절되면 AdmissionRejected 발생)
+        """
+        if not self.waiters[priority] and self.has_room(priority):
+            self.in_flight[priority] += 1
+            admission_wait_histogram.observe((self.name, priority.value), 0.0)
+            return
+
+        if priority is Priority.NORMAL and len(self.waiters[priority]) >= self.queue_size:
+            raise self.reject(priority, "queue full", 429)
+
+        started: float = time.perf_counter()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.waiters[priority].append(future)
+
+        try:
+            timeout: float | None = self.queue_timeout if priority is Priority.NORMAL else None
+            await asyncio.wait({future}, timeout=timeout)
+        except asyncio.CancelledError:
+            # 연결이 끊어진 경우 이미 넘겨받은 자리는 돌려줌
+            if future.done() and not future.cancelled():
+                self.release(priority)
+            else:
+                self.discard_waiter(priority, future)
+            raise
+
+        if not future.done():
+            self.discard_waiter(priority, future)
+            raise self.reject(priority, "timeout", 503)
+
+        admission_wait_histogram.observe((self.name, priority.value), time.perf_counter() - started)
+
+    def discard_waiter(self, priority: Priority, future: asyncio.Future) -> None:
+        future.cancel()
+        try:
+            self.waiters[priority].remove(future)
+        except ValueError:
+            pass
+        self.wake_waiters()  # 높은 우선 순위 요청이 빠지면 일반 요청이 들어갈 수 있음
+
+    def release(self, priority: Priority) -> None:
+        self.in_flight[priority] -= 1
+        self.wake_waiters()
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority):
+        """
+        async with controller.slot(priority): 처럼 사용하여 자리를 얻고 끝나면 돌려주는 기능
+        :param priority: 요청의 우선 순위
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    # 우선 순위별 실행/대기 중인 요청 수를 불러오는 기능
+    def stats(self) -> dict:
+        return {
+            priority.value: {
+                "in_flight": self.in_flight[priority],
+                "queued": len(self.waiters[priority])
+            } for priority in Priority
+        }
+
+
+# 제어 상태를 측정값으로 수집하도록 등록하는 기능
+def register_admission_metrics(controller: AdmissionController) -> None:
+    def collect() -> list[tuple[str, str, str, dict, float]]:
+        samples: list[tuple[str, str, str, dict, float]] = []
+        for priority, stats in controller.stats().items():
+            labels: dict = {"controller": controller.name, "priority": priority}
+            samples.extend([
+                ("image_admission_in_flight", "gauge", "Requests holding an admission slot", labels,
+                 stats["in_flight"]),
+                ("image_admission_queue_depth", "gauge", "Requests waiting for an admission slot", labels,
+                 stats["queued"])
+            ])
+        return samples
+
+    registry.register_collector(collect)
+
+
+# 거절 응답을 만드는 기능
+def make_rejected_response(error: AdmissionRejected) -> JSONResponse:
+    return JSONResponse(
+        status_code=error.status_code,
+        content={
+            "detail": {
+                "type": "too many requests" if error.status_code == 429 else "service unavailable",
+                "message": "Server is busy, please retry later"
+            }
+        },
+        headers={"Retry-After": str(error.retry_after)}
+    )
+
+
+class AdmissionMiddleware:
+    """
+    요청 본문을 받기 전에 자리를 얻도록 하는 ASGI Middleware
+    거절되는 요청은 본문을 받지 않고 바로 응답하며, 정해진 우선 순위는 request.state.priority로 전달됨
+    """
+    def __init__(self, app, controller: AdmissionController, matcher: Callable[[dict], bool],
+                 classifier: Callable[[dict], Awaitable[Priority]]):
+        """
+        :param app: ASGI Application
+        :param controller: 자리를 관리하는 AdmissionController
+        :param matcher: 제어 대상 요청인지 확인하는 함수 (scope를 받음)
+        :param classifier: 요청의 우선 순위를 정하는 비동기 함수 (scope를 받음)
+        """
+        self.app = app
+        self.controller = controller
+        self.matcher = matcher
+        self.classifier = classifier
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.matcher(scope):
+            return await self.app(scope, receive, send)
+
+        priority: Priority = await self.classifier(scope)
+        scope.setdefault("state", {})["priority"] = priority
+
+        try:
+            await self.controller.acquire(priority)
+        except AdmissionRejected as error:
+            logger.warning(f"Request rejected ({error.reason}): {scope['method']} {scope['path']}")
+            return await make_rejected_response(error)(scope, receive, send)
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(priority)
@@ -0,0 +1,85 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Archive Tools
+"""
+
+# Libraries
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Iterator
+
+import io
+import tarfile
+import zipfile
+
+from Utilities.upload_tools import upload_chunk_size
+from Utilities.storage_tools import storage_backend
+
+
+class ArchiveFormat(str, Enum):
+    ZIP = "zip"
+    TAR = "tar"
+
+
+archive_media_types: dict[ArchiveFormat, str] = {
+    ArchiveFormat.ZIP: "application/zip",
+    ArchiveFormat.TAR: "application/x-tar"
+}
+
+
+class ArchiveBuffer(io.RawIOBase):
+    """
+    압축 파일 기록 결과를 모아두었다가 조금씩 꺼내 보내기 위한 쓰기 전용 Buffer (Seek 불가)
+    """
+    def __init__(self):
+        super().__init__()
+        self.chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    # 지금까지 기록된 데이터를 꺼내는 기능
+    def take(self) -> bytes:
+        data: bytes = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+# 여러 파일을 하나의 압축 파일로 묶어 조금씩 내보내는 기능
+def stream_archive(entries: list[tuple[str, str, datetime]], archive_format: ArchiveFormat) -> Iterator[bytes]:
+    """
+    디스크에 압축 파일을 만들지 않고 파일을 읽는 대로 압축 파일 형식으로 내보내는 기능
+    이미지는 이미 압축된 형식이므로 ZIP은 압축하지 않고 저장(STORED)만 함
+    원본은 차례가 되었을 때 로컬 경로를 준비하므로 S3 저장소에서 내려받는 동안에도 앞의 파일부터 전달됨
+    :param entries: (압축 파일 안의 이름, 저장공간 기준 상대 경로, 수정 시각) 목록
+    :param archive_format: 압축 파일 형식
+    :return: 압축 파일 데이터 조각 Iterator[bytes]
+    """
+    buffer = ArchiveBuffer()
+
+    if archive_format == ArchiveFormat.ZIP:
+        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED) as archive:
+            for name, relative_path, modified_at in entries:
+                info = zipfile.ZipInfo(name, date_time=modified_at.timetuple()[:6])
+                with open(storage_backend.localize(relative_path), "rb") as source, archive.open(info, mode="w", force_zip64=True) as target:
+                    while chunk := source.read(upload_chunk_size):
+                        target.write(chunk)
+                        yield buffer.take()
+    else:
+        with tarfile.open(fileobj=buffer, mode="w|") as archive:
+            for name, relative_path, modified_at in entries:
+                with open(storage_backend.localize(relative_path), "rb") as source:
+                    info = archive.gettarinfo(fileobj=source, arcname=name)
+                    info.mtime = int(modified_at.replace(tzinfo=modified_at.tzinfo or timezone.utc).timestamp())
+                    info.uid = info.gid = 0
+                    info.uname = info.gname = ""
+                    archive.addfile(info, source)
+                yield buffer.take()
+
+    yield buffer.take()
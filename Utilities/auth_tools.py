@@ -8,8 +8,83 @@ Server Authentication Tools
 # Library
 from enum import Enum
 
+import base64
+import hashlib
+import hmac
+import os
+from time import time
+from dotenv import load_dotenv
+
 
 class Identify(Enum):
     USER = "user"
     FAMILY = "family"
     MEMBER = "member"
+
+
+# ========== 서명된 이미지 URL ==========
+# 서명 키 불러오기 ("키 ID:비밀 값"을 쉼표로 구분, 첫 번째 키로 서명하고 모든 키로 검증)
+load_dotenv()
+signing_keys: dict[str, bytes] = {
+    key_id.strip(): secret.strip().encode()
+    for key_id, _, secret in (item.partition(":") for item in os.getenv("URL_SIGNING_KEYS", "").split(","))
+    if key_id.strip() and secret.strip()
+}
+active_key_id: str = next(iter(signing_keys), "")
+signed_url_expire_time: int = int(os.getenv("SIGNED_URL_EXPIRE_TIME", 600))
+
+
+class SignatureScope(Enum):
+    READ = "read"
+
+
+# 서명 대상 문자열에 HMAC을 계산하는 기능
+def compute_signature(key_id: str, scope: str, user_id: str, file_name: str, expires: int) -> str:
+    message: str = "\n".join([scope, user_id, file_name, str(expires), key_id])
+    digest: bytes = hmac.new(signing_keys[key_id], message.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+# 이미지 접근용 서명을 만드는 기능
+def sign_image_access(user_id: str, file_name: str, scope: SignatureScope = SignatureScope.READ,
+                      expire_time: int = None) -> dict:
+    """
+    이미지 소유자, 파일명, 만료 시각, 권한 범위를 담은 서명을 만드는 기능
+    :param user_id: 이미지 소유자의 ID
+    :param file_name: 이미지 파일명
+    :param scope: 서명이 허용하는 권한 범위
+    :param expire_time: 유효 시간 (초, 없으면 기본 유효 시간)
+    :return: URL Query로 사용할 exp, kid, scope, sig dict (서명 키가 없으면 빈 dict)
+    """
+    if not active_key_id:
+        return {}
+
+    expires: int = int(time()) + (expire_time or signed_url_expire_time)
+
+    return {
+        "exp": expires,
+        "kid": active_key_id,
+        "scope": scope.value,
+        "sig": compute_signature(active_key_id, scope.value, user_id, file_name, expires)
+    }
+
+
+# 이미지 접근용 서명을 검증하는 기능
+def verify_image_access(user_id: str, file_name: str, expires: int, key_id: str, scope: str, signature: str,
+                        required_scope: SignatureScope = SignatureScope.READ) -> bool:
+    """
+    DB에 접근하지 않고 HMAC만으로 서명된 이미지 접근을 검증하는 기능
+    :param user_id: 이미지 소유자의 ID
+    :param file_name: 이미지 파일명
+    :param expires: 만료 시각 (epoch)
+    :param key_id: 서명에 사용된 키 ID
+    :param scope: 서명이 허용하는 권한 범위
+    :param signature: 서명 값
+    :param required_scope: 요청에 필요한 권한 범위
+    :return: 유효한 서명인지 여부 bool
+    """
+    if key_id not in signing_keys or scope != required_scope.value or expires < time():
+        return False
+
+    expected: str = compute_signature(key_id, scope, user_id, file_name, expires)
+    return hmac.compare_digest(expected, signature)
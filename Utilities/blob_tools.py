@@ -0,0 +1,193 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Blob Storage Tools
+"""
+
+# Libraries
+from sqlalchemy import Column, String, BigInteger, INT
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+
+from fastapi.concurrency import run_in_threadpool
+
+from datetime import datetime
+
+import os
+from dotenv import load_dotenv
+
+from Utilities.logging_tools import *
+from Utilities.index_tools import IndexBase, index_instance
+from Utilities.layout_tools import make_shard_path
+from Utilities.upload_tools import remove_quietly
+from Utilities.storage_tools import storage_backend
+from Utilities.variant_tools import remove_source_variants
+
+logger = get_logger("Blob")
+
+# 내용 주소 기반 저장공간 설정 불러오기
+load_dotenv()
+image_storage: str = os.getenv("IMAGE_STORAGE")
+blob_directory: str = ".blobs"
+blob_storage: str = os.path.join(image_storage, blob_directory)
+os.makedirs(blob_storage, exist_ok=True)
+
+
+class BlobsTable(IndexBase):
+    """
+    내용(SHA-256)별로 한 번만 저장된 이미지 파일과 참조 수
+    """
+    __tablename__ = "blobs"
+
+    sha256 = Column(String(64), primary_key=True, nullable=False)
+    path = Column(String(512), nullable=False)
+    size = Column(BigInteger, nullable=False)
+    refcount = Column(INT, nullable=False, default=1)
+
+    def __repr__(self):
+        return (f"" +
+                f"<Blob(sha256='{self.sha256}', " +
+                f"path='{self.path}', " +
+                f"size='{self.size}', " +
+                f"refcount='{self.refcount}')>"
+                )
+
+
+index_instance.create_tables([BlobsTable.__table__])
+
+
+# 내용의 SHA-256으로 저장 경로를 만드는 기능
+def get_blob_path(sha256: str, moment: datetime | None = None) -> str:
+    """
+    설정된 저장공간 구조(STORAGE_LAYOUT)에 따라 디렉터리를 나누어 새 Blob의 경로를 만드는 기능
+    기존 Blob의 경로는 blobs 테이블에 저장되어 있으므로 구조를 바꿔도 그대로 찾을 수 있음
+    :param sha256: 내용의 SHA-256
+    :param moment: 저장 시각 (없으면 현재 시각)
+    :return: 저장공간 기준 상대 경로 str (.blobs/ab/cd/abcd... 또는 .blobs/2025/01/31/abcd...)
+    """
+    return os.path.join(blob_directory, make_shard_path(sha256, moment), sha256)
+
+
+# 저장공간 경로가 내용 주소 기반 저장공간에 있는지 확인하는 기능
+def is_blob_path(relative_path: str) -> bool:
+    return relative_path.startswith(blob_directory + os.sep)
+
+
+# 업로드가 끝난 임시 파일을 내용 주소 기반 저장공간에 등록하는 기능
+def store_blob(temp_path: str, sha256: str, size: int) -> str:
+    """
+    같은 내용이 이미 있으면 참조 수만 늘리고 임시 파일을 지우며, 없으면 정보를 먼저 등록한 후 임시 파일을 새 Blob으로 저장하는 기능
+    정보(참조 수)를 먼저 등록하여 저장하는 동안 같은 내용의 마지막 참조가 해제되어도 파일이 삭제되지 않도록 하고,
+    색인 쓰기 Transaction은 저장(S3 저장소는 Network 전송) 전에 끝내 다른 Worker의 색인 쓰기를 막지 않음
+    :param temp_path: 기록이 끝난 임시 파일 경로 (저장공간과 같은 파일 시스템)
+    :param sha256: 내용의 SHA-256
+    :param size: 파일 크기
+    :return: 저장공간 기준 Blob 상대 경로 str
+    """
+    relative_path: str = get_blob_path(sha256)
+    created: bool = False
+
+    try:
+        database_pre_session = index_instance.get_pre_session()
+        with database_pre_session() as session:
+            try:
+                updated: int = session.query(BlobsTable).filter(BlobsTable.sha256 == sha256).update({
+                    BlobsTable.refcount: BlobsTable.refcount + 1
+                }, synchronize_session=False)
+
+                if updated:
+                    relative_path = session.query(BlobsTable.path).filter(BlobsTable.sha256 == sha256).scalar()
+                else:
+                    session.add(BlobsTable(sha256=sha256, path=relative_path, size=size, refcount=1))
+                    created = True
+
+                session.commit()
+            except IntegrityError:
+                # 다른 Worker가 같은 내용을 먼저 등록한 경우 참조 수만 늘림
+                session.rollback()
+                created = False
+                session.query(BlobsTable).filter(BlobsTable.sha256 == sha256).update({
+                    BlobsTable.refcount: BlobsTable.refcount + 1
+                }, synchronize_session=False)
+                relative_path = session.query(BlobsTable.path).filter(BlobsTable.sha256 == sha256).scalar()
+                session.commit()
+            except SQLAlchemyError:
+                session.rollback()
+                raise
+
+        # 다른 요청이 등록한 내용이 아직 저장되는 중이면 같은 내용이므로 함께 저장함
+        if created or storage_backend.stat(relative_path) is None:
+            try:
+                storage_backend.put_file(temp_path, relative_path)
+            except Exception:
+                release_blob(sha256)
+                raise
+    finally:
+        remove_quietly(temp_path)
+
+    return relative_path
+
+
+# Blob의 참조를 하나 줄이고 더 이상 참조가 없으면 삭제하는 기능
+def release_blob(sha256: str) -> bool:
+    """
+    Blob의 참조 수를 줄이고, 0이 되면 정보를 삭제한 후 파일과 파생 이미지를 삭제하는 기능
+    정보 삭제가 반영된 후에만 파일을 삭제하여, 반영에 실패해도 남은 참조가 없는 파일을 가리키지 않도록 함
+    :param sha256: 내용의 SHA-256
+    :return: 파일까지 삭제되었는지 여부 bool
+    """
+    removed_path: str | None = None
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            session.query(BlobsTable).filter(BlobsTable.sha256 == sha256).update({
+                BlobsTable.refcount: BlobsTable.refcount - 1
+            }, synchronize_session=False)
+
+            blob_data = session.query(BlobsTable).filter(BlobsTable.sha256 == sha256).first()
+
+            if blob_data is not None and blob_data.refcount <= 0:
+                removed_path = blob_data.path
+                session.delete(blob_data)
+
+            session.commit()
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error releasing blob: {str(error)}")
+            return False
+
+    if removed_path is None:
+        return False
+
+    removed: bool = False
+    with database_pre_session() as session:
+        try:
+            # 같은 내용을 다시 등록하지 못하도록 색인 쓰기 잠금을 얻은 채 다시 확인하고 파일을 삭제
+            # (SQLite는 SELECT FOR UPDATE를 지원하지 않으므로 행이 없어도 잠금을 얻는 쓰기 문장을 사용)
+            # 그 사이에 같은 내용이 다시 등록되었으면 새 Blob의 파일이므로 파일과 파생 이미지를 삭제하지 않음
+            registered: int = session.query(BlobsTable).filter(BlobsTable.sha256 == sha256).update({
+                BlobsTable.refcount: BlobsTable.refcount
+            }, synchronize_session=False)
+
+            if not registered:
+                storage_backend.delete(removed_path)
+                removed = True
+
+            session.commit()
+        except Exception as error:
+            session.rollback()
+            logger.error(f"Blob removal failed: {str(error)}")
+
+    if removed:
+        remove_source_variants(sha256)
+    return removed
+
+
+# ========== Event Loop를 막지 않는 Blob 기능 ==========
+async def async_store_blob(temp_path: str, sha256: str, size: int) -> str:
+    return await run_in_threadpool(store_blob, temp_path, sha256, size)
+
+
+async def async_release_blob(sha256: str) -> bool:
+    return await run_in_threadpool(release_blob, sha256)
@@ -0,0 +1,518 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Cache Tools
+"""
+
+# Libraries
+from collections import OrderedDict
+from threading import Lock, get_ident
+from time import monotonic, time
+from typing import Any, Callable, Hashable
+
+import hashlib
+import json
+import os
+
+
+class TTLCache:
+    """
+    항목마다 만료 시간을 가지는 LRU 방식의 메모리 Cache
+    Thread Pool에서 동시에 접근하므로 모든 작업은 Lock 안에서 수행됨
+    """
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._items: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Cache에서 값을 불러오는 기능 (만료된 항목은 삭제됨)
+        :param key: Cache 키
+        :param default: 값이 없는 경우 반환할 값
+        :return: 저장된 값 Any
+        """
+        with self._lock:
+            item = self._items.get(key)
+
+            if item is None or item[1] <= monotonic():
+                if item is not None:
+                    del self._items[key]
+                self.misses += 1
+                return default
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        """
+        Cache에 값을 저장하는 기능 (최대 크기를 넘으면 가장 오래 사용되지 않은 항목 삭제)
+        :param key: Cache 키
+        :param value: 저장할 값
+        :param ttl: 이 항목에만 적용할 유효 시간 (없으면 기본 유효 시간 적용)
+        :return: None
+        """
+        expire_at: float = monotonic() + (self.ttl if ttl is None else min(ttl, self.ttl))
+
+        with self._lock:
+            self._items[key] = (value, expire_at)
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Cache에서 항목을 삭제하는 기능
+        :param key: Cache 키
+        :return: None
+        """
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Cache의 모든 항목을 삭제하는 기능
+        :return: None
+        """
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> dict:
+        """
+        Cache 사용 현황을 반환하는 기능
+        :return: 항목 수, 적중/실패 횟수 dict
+        """
+        with self._lock:
+            return {
+                "size": len(self._items),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+class InvalidationJournal:
+    """
+    여러 Worker가 함께 쓰는 무효화 기록 (공유 디렉터리의 추가 전용 파일에 한 줄씩 기록)
+    한 Worker가 삭제한 항목을 다른 Worker가 다음 조회 때 읽어 자신의 메모리 Cache에서도 삭제하도록 알림
+    조회마다 파일 상태(stat)만 확인하고, 새 기록이 있을 때만 읽음
+    """
+    def __init__(self, path: str, max_bytes: int = 1024 * 1024):
+        """
+        :param path: 기록 파일 경로
+        :param max_bytes: 기록 파일의 최대 크기 (넘으면 정리할 때 새 파일로 교체)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._inode, self._offset = self.get_position()  # 시작하기 전의 기록은 메모리 Cache가 비어 있으므로 읽지 않음
+
+    # 기록 파일의 inode와 크기를 확인하는 기능 (파일이 없으면 0, 0)
+    def get_position(self) -> tuple[int, int]:
+        try:
+            stat_result = os.stat(self.path)
+        except OSError:
+            return 0, 0
+        return stat_result.st_ino, stat_result.st_size
+
+    def publish(self, token: str) -> None:
+        """
+        무효화 기록을 추가하는 기능 (O_APPEND로 한 번에 기록하여 여러 Worker가 동시에 기록해도 섞이지 않음)
+        :param token: 무효화할 항목 표시 (공백 없는 문자열)
+        :return: None
+        """
+        try:
+            descriptor: int = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(descriptor, (token + "\n").encode())
+            finally:
+                os.close(descriptor)
+        except OSError:
+            pass
+
+    def poll(self) -> list[str] | None:
+        """
+        마지막으로 확인한 이후 추가된 무효화 기록을 불러오는 기능
+        :return: 새 무효화 기록 list[str] (기록 파일이 교체되어 놓친 기록이 있을 수 있으면 None)
+        """
+        inode, size = self.get_position()
+
+        with self._lock:
+            if inode == self._inode and size == self._offset:
+                return []
+
+            if inode != self._inode:
+                reset: bool = self._inode != 0
+                self._inode, self._offset = inode, 0
+                if reset:
+                    self._offset = size
+                    return None
+            elif size < self._offset:
+                self._offset = size
+                return None
+
+            try:
+                with open(self.path, "rb") as buffer:
+                    buffer.seek(self._offset)
+                    data: bytes = buffer.read(size - self._offset)
+            except OSError:
+                return []
+
+            # 기록 중인 마지막 줄은 다음에 읽음
+            end: int = data.rfind(b"\n") + 1
+            self._offset += end
+            return data[:end].decode(errors="ignore").split()
+
+    def remove_expired(self) -> int:
+        """
+        기록 파일이 최대 크기를 넘으면 빈 파일로 교체하는 기능 (다른 Worker는 교체를 확인하면 메모리 Cache를 비움)
+        :return: 삭제한 항목 수 int (항상 0)
+        """
+        if self.get_position()[1] <= self.max_bytes:
+            return 0
+
+        temp_path: str = f"{self.path}.{os.getpid()}_{get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb"):
+                pass
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+        return 0
+
+
+class SharedTTLCache(TTLCache):
+    """
+    Worker Process마다 가진 메모리 Cache(L1) 뒤에 모든 Worker가 함께 읽는 파일 Cache(L2)를 둔 Cache
+    L2는 공유 메모리(/dev/shm) 디렉터리에 항목마다 하나의 파일([만료 시각(epoch), 값] JSON)로 저장되므로,
+    한 Worker가 DB에서 불러온 값을 다른 Worker는 DB를 거치지 않고 사용함 (디스크를 기다리지 않으므로 Event Loop에서 바로 읽음)
+    L2는 성능을 위한 보조 저장소이므로 읽기/쓰기 오류는 L2가 없는 것으로 처리함
+    삭제는 무효화 기록(InvalidationJournal)으로 알려, 다른 Worker의 L1에 남은 항목도 다음 조회 때 삭제됨
+    """
+    def __init__(self, max_size: int, ttl: float, directory: str, encode: Callable = None, decode: Callable = None):
+        """
+        :param max_size: Worker별 메모리 Cache의 최대 항목 수
+        :param ttl: 유효 시간 (초)
+        :param directory: 공유 Cache 파일을 저장할 디렉터리
+        :param encode: 값을 JSON으로 저장할 수 있는 값으로 바꾸는 기능 (Nullable)
+        :param decode: JSON에서 불러온 값을 원래 값으로 바꾸는 기능 (Nullable)
+        """
+        super().__init__(max_size, ttl)
+        self.directory = directory
+        self.encode = encode or (lambda value: value)
+        self.decode = decode or (lambda value: value)
+        self.shared_hits: int = 0  # L1에서는 찾지 못했지만(misses에 포함) L2에서 찾은 횟수
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self.journal = InvalidationJournal(os.path.join(self.directory, "invalidations"))
+        self._digests: dict[str, Hashable] = {}  # 무효화 기록의 Hash로 L1의 키를 찾기 위한 목록
+
+    # 키의 Hash (세션 ID 등이 파일 이름과 무효화 기록에 드러나지 않도록 사용)
+    @staticmethod
+    def get_digest(key: Hashable) -> str:
+        return hashlib.sha256(str(key).encode()).hexdigest()
+
+    # 키에 해당하는 공유 Cache 파일 경로
+    def get_path(self, key: Hashable) -> str:
+        digest: str = self.get_digest(key)
+        return os.path.join(self.directory, digest[:2], digest)
+
+    # L1에 저장하고 무효화 기록으로 찾을 수 있도록 Hash를 남기는 기능
+    def set_local(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        super().set(key, value, ttl)
+        with self._lock:
+            self._digests[self.get_digest(key)] = key
+
+            # L1에서 밀려난 항목의 Hash가 쌓이지 않도록 정리
+            if len(self._digests) > self.max_size * 2:
+                self._digests = {digest: item for digest, item in self._digests.items() if item in self._items}
+
+    # 다른 Worker가 삭제한 항목을 L1에서도 삭제하는 기능
+    def sync(self) -> None:
+        tokens: list[str] | None = self.journal.poll()
+        if not tokens and tokens is not None:
+            return
+
+        with self._lock:
+            if tokens is None or "*" in tokens:
+                self._items.clear()
+                self._digests.clear()
+                return
+
+            for token in tokens:
+                key = self._digests.pop(token, None)
+                if key is not None:
+                    self._items.pop(key, None)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        self.sync()
+
+        missing = object()
+        value = super().get(key, missing)
+        if value is not missing:
+            return value
+
+        try:
+            with open(self.get_path(key), "r") as buffer:
+                expire_at, stored_value = json.load(buffer)
+        except (OSError, ValueError, TypeError):
+            return default
+
+        remaining: float = expire_at - time()
+        if remaining <= 0:
+            return default
+
+        value = self.decode(stored_value)
+        self.set_local(key, value, ttl=remaining)
+        with self._lock:
+            self.shared_hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        self.set_local(key, value, ttl)
+
+        # 임시 파일에 기록한 후 바꾸어 다른 Worker가 기록 중인 파일을 읽지 않도록 함
+        file_path: str = self.get_path(key)
+        temp_path: str = f"{file_path}.{os.getpid()}_{get_ident()}.tmp"
+        expire_at: float = time() + (self.ttl if ttl is None else min(ttl, self.ttl))
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(temp_path, "w") as buffer:
+                json.dump([expire_at, self.encode(value)], buffer)
+            os.replace(temp_path, file_path)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def invalidate(self, key: Hashable) -> None:
+        super().invalidate(key)
+        try:
+            os.remove(self.get_path(key))
+        except OSError:
+            pass
+        self.journal.publish(self.get_digest(key))
+
+    def clear(self) -> None:
+        super().clear()
+        self.remove_expired(expire_before=float("inf"))
+        self.journal.publish("*")
+
+    def remove_expired(self, expire_before: float = None) -> int:
+        """
+        공유 Cache에서 만료된 항목과 남아있는 임시 파일을 삭제하는 기능
+        :param expire_before: 이 시각(epoch) 이전에 만료되는 항목을 삭제 (없으면 현재 시각)
+        :return: 삭제한 항목 수 int
+        """
+        expire_before = time() if expire_before is None else expire_before
+        removed: int = 0
+        self.journal.remove_expired()
+
+        for root, _, file_names in os.walk(self.directory):
+            for file_name in file_names:
+                file_path: str = os.path.join(root, file_name)
+                try:
+                    if file_path == self.journal.path:
+                        continue
+                    if file_name.endswith(".tmp"):
+                        if os.stat(file_path).st_mtime < time() - 60:
+                            os.remove(file_path)
+                        continue
+
+                    with open(file_path, "r") as buffer:
+                        expire_at: float = json.load(buffer)[0]
+                    if expire_at < expire_before:
+                        os.remove(file_path)
+                        removed += 1
+                except (OSError, ValueError, TypeError, IndexError):
+                    continue
+
+        return removed
+
+    def stats(self) -> dict:
+        """
+        Cache 사용 현황을 반환하는 기능
+        :return: 항목 수, 적중/실패 횟수, 공유 Cache 적중 횟수 dict
+        """
+        stats: dict = super().stats()
+        with self._lock:
+            stats["shared_hits"] = self.shared_hits
+        return stats
+
+
+class ByteLRUCache:
+    """
+    항목 수 대신 전체 크기(Byte)로 한도를 정하는 LRU 방식의 메모리 Cache
+    항목마다 묶음 표시(tag)를 붙여 같은 묶음의 항목을 한 번에 삭제할 수 있음
+    """
+    def __init__(self, max_bytes: int, max_item_bytes: int):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.resident_bytes: int = 0
+        self._items: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    # 주어진 크기의 항목을 저장할 수 있는지 확인하는 기능
+    def accepts(self, size: int) -> bool:
+        return 0 < size <= min(self.max_item_bytes, self.max_bytes)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Cache에서 값을 불러오는 기능
+        :param key: Cache 키
+        :param default: 값이 없는 경우 반환할 값
+        :return: 저장된 값 Any
+        """
+        with self._lock:
+            item = self._items.get(key)
+
+            if item is None:
+                self.misses += 1
+                return default
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key: Hashable, value: Any, size: int, tag: Hashable = None) -> bool:
+        """
+        Cache에 값을 저장하는 기능 (전체 크기를 넘으면 가장 오래 사용되지 않은 항목부터 삭제)
+        :param key: Cache 키
+        :param value: 저장할 값
+        :param size: 값의 크기 (Byte)
+        :param tag: 묶음 표시 (Nullable)
+        :return: 저장 여부 bool (한 항목의 최대 크기를 넘으면 저장하지 않음)
+        """
+        if not self.accepts(size):
+            return False
+
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self.resident_bytes -= previous[1]
+
+            self._items[key] = (value, size, tag)
+            self.resident_bytes += size
+
+            while self.resident_bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._items.popitem(last=False)
+                self.resident_bytes -= evicted_size
+
+        return True
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Cache에서 항목을 삭제하는 기능
+        :param key: Cache 키
+        :return: None
+        """
+        with self._lock:
+            item = self._items.pop(key, None)
+            if item is not None:
+                self.resident_bytes -= item[1]
+
+    def invalidate_tag(self, tag: Hashable) -> None:
+        """
+        같은 묶음 표시를 가진 모든 항목을 삭제하는 기능
+        :param tag: 묶음 표시
+        :return: None
+        """
+        with self._lock:
+            for key in [key for key, item in self._items.items() if item[2] == tag]:
+                self.resident_bytes -= self._items.pop(key)[1]
+
+    def clear(self) -> None:
+        """
+        Cache의 모든 항목을 삭제하는 기능
+        :return: None
+        """
+        with self._lock:
+            self._items.clear()
+            self.resident_bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Cache 사용 현황을 반환하는 기능
+        :return: 항목 수, 사용 중인 크기, 적중/실패 횟수 dict
+        """
+        with self._lock:
+            return {
+                "size": len(self._items),
+                "bytes": self.resident_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+class WriteBehindBuffer:
+    """
+    바로 기록하지 않고 모아두었다가 한 번에 반영하기 위한 키 버퍼
+    키마다 가장 최근에 기록된 시각(epoch)을 보관함
+    """
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: dict = {}
+        self._lock = Lock()
+
+    def touch(self, key: Hashable, timestamp: float) -> bool:
+        """
+        키의 최근 기록 시각을 남기는 기능
+        :param key: 기록할 키
+        :param timestamp: 기록 시각 (epoch)
+        :return: 버퍼가 가득 차서 반영이 필요한지 여부 bool
+        """
+        with self._lock:
+            if timestamp > self._items.get(key, 0):
+                self._items[key] = timestamp
+            return len(self._items) >= self.max_size
+
+    def pending(self, key: Hashable) -> float:
+        """
+        아직 반영되지 않은 키의 최근 기록 시각을 불러오는 기능
+        :param key: 확인할 키
+        :return: 최근 기록 시각 (없으면 0) float
+        """
+        with self._lock:
+            return self._items.get(key, 0)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        버퍼에서 키를 제거하는 기능
+        :param key: 제거할 키
+        :return: None
+        """
+        with self._lock:
+            self._items.pop(key, None)
+
+    def drain(self) -> dict:
+        """
+        버퍼의 모든 항목을 꺼내고 비우는 기능
+        :return: 키와 기록 시각 dict
+        """
+        with self._lock:
+            items, self._items = self._items, {}
+            return items
+
+    def restore(self, items: dict) -> None:
+        """
+        반영에 실패한 항목을 다시 버퍼에 넣는 기능 (더 최근 기록은 유지)
+        :param items: 되돌릴 키와 기록 시각 dict
+        :return: None
+        """
+        with self._lock:
+            for key, timestamp in items.items():
+                if timestamp > self._items.get(key, 0):
+                    self._items[key] = timestamp
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
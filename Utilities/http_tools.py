@@ -0,0 +1,64 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server HTTP Tools
+"""
+
+# Libraries
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+
+
+# 내용 식별자로 강한 ETag를 만드는 기능
+def make_etag(content_id: str) -> str:
+    """
+    이미지 내용의 SHA-256이나 파생 이미지 키로 강한 ETag를 만드는 기능
+    :param content_id: 내용을 식별하는 값
+    :return: ETag Header 값 str
+    """
+    return f'"{content_id}"'
+
+
+# UTC 시각을 HTTP 날짜 형식으로 바꾸는 기능
+def make_http_date(moment: datetime) -> str:
+    """
+    색인에 저장된 UTC 시각을 Last-Modified Header 형식으로 바꾸는 기능
+    :param moment: UTC 시각 (tzinfo가 없으면 UTC로 간주)
+    :return: HTTP 날짜 str
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return formatdate(moment.timestamp(), usegmt=True)
+
+
+# 클라이언트의 Cache가 최신인지 확인하는 기능
+def is_not_modified(headers, etag: str, last_modified: datetime) -> bool:
+    """
+    If-None-Match, If-Modified-Since Header로 클라이언트의 Cache가 최신인지 확인하는 기능
+    If-None-Match가 있으면 If-Modified-Since는 무시함 (RFC 9110)
+    :param headers: 요청 Header
+    :param etag: 현재 내용의 ETag
+    :param last_modified: 현재 내용의 수정 시각 (UTC)
+    :return: 304 Not Modified로 응답해도 되는지 여부 bool
+    """
+    if_none_match: str = headers.get("if-none-match")
+
+    if if_none_match is not None:
+        candidates: list[str] = [value.strip() for value in if_none_match.split(",")]
+        return "*" in candidates or any(value.removeprefix("W/") == etag for value in candidates)
+
+    if_modified_since: str = headers.get("if-modified-since")
+
+    if if_modified_since is not None:
+        try:
+            since: datetime = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        return int(last_modified.timestamp()) <= int(since.timestamp())
+
+    return False
@@ -0,0 +1,290 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Image Tools
+"""
+
+# Libraries
+from PIL import Image, ImageOps, ImageSequence, features
+
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from io import BytesIO
+from time import perf_counter
+import hashlib
+import multiprocessing
+import struct
+import os
+
+import filetype
+from dotenv import load_dotenv
+
+from Utilities.worker_tools import get_cpu_count, server_workers
+
+# 이미지 처리 설정 불러오기
+load_dotenv()
+file_chunk_size: int = 256 * 1024
+image_workers: int = int(os.getenv("IMAGE_WORKERS", 0)) or max(get_cpu_count() // server_workers, 1)
+pillow_formats: dict[str, str] = {
+    "image/jpeg": "JPEG",
+    "image/png": "PNG",
+    "image/gif": "GIF",
+    "image/webp": "WEBP",
+    "image/avif": "AVIF"
+}
+transcode_quality: int = int(os.getenv("TRANSCODE_QUALITY", 80))
+
+process_pool: ProcessPoolExecutor | None = None
+
+
+class InvalidImage(Exception):
+    """
+    이미지를 끝까지 디코딩할 수 없거나 허용되지 않는 이미지인 경우 발생하는 예외
+    """
+    pass
+
+
+class ResizeFit(str, Enum):
+    CONTAIN = "contain"  # 비율을 유지하며 주어진 크기 안에 맞춤
+    COVER = "cover"  # 비율을 유지하며 주어진 크기를 채우고 넘치는 부분은 잘라냄
+
+
+# 이미지 처리용 Process Pool을 불러오는 기능
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    CPU를 많이 사용하는 이미지 처리를 위한 Process Pool을 불러오는 기능 (처음 사용할 때 생성)
+    :return: 이미지 처리용 Process Pool ProcessPoolExecutor
+    """
+    global process_pool
+
+    if process_pool is None:
+        process_pool = ProcessPoolExecutor(
+            max_workers=image_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    return process_pool
+
+
+# 이미지 처리용 Process Pool을 종료하는 기능
+def shutdown_process_pool() -> None:
+    global process_pool
+
+    if process_pool is not None:
+        process_pool.shutdown(wait=True, cancel_futures=True)
+        process_pool = None
+
+
+# 이미지 크기를 변환하는 기능 (Process Pool에서 실행)
+def resize_image(data: bytes, mime: str, width: int | None, height: int | None, fit: ResizeFit) -> bytes:
+    """
+    이미지의 크기를 변환하는 기능 (원본보다 크게 확대하지 않음)
+    :param data: 원본 이미지 데이터
+    :param mime: 원본 이미지 형식
+    :param width: 변환할 가로 크기 (Nullable)
+    :param height: 변환할 세로 크기 (Nullable)
+    :param fit: 크기를 맞추는 방식
+    :return: 원본과 같은 형식으로 변환된 이미지 데이터 bytes
+    """
+    with Image.open(BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        width = min(width or image.width, image.width)
+        height = min(height or image.height, image.height)
+
+        if fit == ResizeFit.COVER:
+            image = ImageOps.fit(image, (width, height), method=Image.Resampling.LANCZOS)
+        else:
+            image.thumbnail((width, height), resample=Image.Resampling.LANCZOS)
+
+        image_format: str = pillow_formats[mime]
+        if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        output = BytesIO()
+        image.save(output, format=image_format, optimize=True)
+        return output.getvalue()
+
+
+# 현재 환경에서 해당 형식으로 저장할 수 있는지 확인하는 기능
+def is_format_supported(mime: str) -> bool:
+    if mime not in pillow_formats:
+        return False
+    return features.check(pillow_formats[mime].lower()) if mime in ("image/webp", "image/avif") else True
+
+
+# 이미지를 다른 형식으로 변환하는 기능 (Process Pool에서 실행)
+def transcode_image(data: bytes, mime: str) -> bytes:
+    """
+    이미지를 WebP, AVIF 등 더 작은 형식으로 변환하는 기능 (EXIF 회전 정보는 픽셀에 반영)
+    :param data: 원본 이미지 데이터
+    :param mime: 변환할 이미지 형식
+    :return: 변환된 이미지 데이터 bytes
+    """
+    with Image.open(BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+
+        if image.mode not in ("RGB", "RGBA", "L"):
+            image = image.convert("RGBA" if "transparency" in image.info or "A" in image.mode else "RGB")
+
+        output = BytesIO()
+        image.save(output, format=pillow_formats[mime], quality=transcode_quality)
+        return output.getvalue()
+
+
+# 파일의 크기와 SHA-256을 계산하는 기능
+def hash_file(file_path: str) -> tuple[int, str]:
+    digest = hashlib.sha256()
+    file_size: int = 0
+
+    with open(file_path, "rb") as buffer:
+        while chunk := buffer.read(file_chunk_size):
+            digest.update(chunk)
+            file_size += len(chunk)
+
+    return file_size, digest.hexdigest()
+
+
+# 이미지 전체를 디코딩하여 검사하고 메타데이터 없이 다시 저장하는 기능 (Process Pool에서 실행)
+def sanitize_image(source_path: str, output_path: str, mime: str, max_pixels: int, rewrite: bool) -> dict:
+    """
+    이미지의 형식과 가로/세로 크기를 확인한 후 모든 Frame을 디코딩하여 잘린 파일이나 형식이 다른 파일을 거절하고,
+    정지 이미지는 EXIF(GPS 등)와 이미지 뒤에 붙은 데이터 없이 다시 저장하는 기능
+    (JPEG은 회전 정보가 없으면 원본의 양자화 Table을 유지하여 화질 손실을 줄이고, 회전 정보가 있으면 픽셀에 반영)
+    :param source_path: 검사할 이미지 경로
+    :param output_path: 다시 저장할 경로
+    :param mime: 업로드 시 확인한 이미지 형식
+    :param max_pixels: 허용되는 최대 픽셀 수 (가로 x 세로 x Frame 수)
+    :param rewrite: 다시 저장할지 여부
+    :return: 다시 저장했는지 여부, 크기, SHA-256, 가로/세로 크기, 단계별 처리 시간 dict
+    """
+    started: float = perf_counter()
+
+    try:
+        with Image.open(source_path) as image:
+            if image.format != pillow_formats.get(mime):
+                raise InvalidImage(f"Format mismatch: {image.format} is not {mime}")
+
+            width, height = image.size
+            frame_count: int = getattr(image, "n_frames", 1)
+            if width * height * frame_count > max_pixels:
+                raise InvalidImage(f"Too many pixels: {width}x{height}x{frame_count}")
+
+            for frame in ImageSequence.Iterator(image):
+                frame.load()
+            decoded: float = perf_counter()
+
+            # 움직이는 이미지는 검사만 하고 다시 저장하지 않음
+            rewritten: bool = rewrite and frame_count == 1
+            if rewritten:
+                image.seek(0)
+                options: dict = {"icc_profile": image.info.get("icc_profile")} if image.info.get("icc_profile") else {}
+
+                if image.format == "JPEG" and image.getexif().get(0x0112, 1) == 1:
+                    image.save(output_path, format="JPEG", quality="keep", subsampling="keep", **options)
+                else:
+                    output = ImageOps.exif_transpose(image)
+                    width, height = output.size
+                    if image.format == "JPEG":
+                        options.update(quality=95)
+                    elif image.format == "WEBP":
+                        options.update(quality=90)
+                    output.save(output_path, format=image.format, **options)
+            encoded: float = perf_counter()
+    except InvalidImage:
+        raise
+    except (OSError, SyntaxError, ValueError, EOFError, Image.DecompressionBombError) as error:
+        raise InvalidImage(f"Can not decode image: {str(error)}")
+
+    file_size, sha256 = hash_file(output_path if rewritten else source_path)
+
+    return {
+        "rewritten": rewritten,
+        "size": file_size,
+        "sha256": sha256,
+        "width": width,
+        "height": height,
+        "decode_seconds": decoded - started,
+        "encode_seconds": encoded - decoded
+    }
+
+
+# 이미지 파일의 가로, 세로 크기를 Header에서 읽는 기능
+def read_image_size(file_path: str) -> tuple[int, int] | None:
+    """
+    이미지 전체를 디코딩하지 않고 Header만 읽어 가로, 세로 크기를 알아내는 기능
+    PNG, GIF, WebP, JPEG 형식을 지원함
+    :param file_path: 이미지 파일 경로
+    :return: (가로, 세로) tuple[int, int] 또는 알 수 없으면 None
+    """
+    try:
+        with open(file_path, "rb") as buffer:
+            head: bytes = buffer.read(32)
+
+            if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+                return struct.unpack(">II", head[16:24])
+
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+                return struct.unpack("<HH", head[6:10])
+
+            if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+                chunk_type: bytes = head[12:16]
+                if chunk_type == b"VP8 ":
+                    head += buffer.read(32)
+                    width, height = struct.unpack("<HH", head[26:30])
+                    return width & 0x3FFF, height & 0x3FFF
+                if chunk_type == b"VP8L":
+                    bits: int = int.from_bytes(head[21:25], "little")
+                    return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+                if chunk_type == b"VP8X":
+                    return int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1
+                return None
+
+            if head[:2] == b"\xff\xd8":  # JPEG는 SOF Marker가 나올 때까지 Segment를 건너뜀
+                buffer.seek(2)
+                while True:
+                    marker: bytes = buffer.read(2)
+                    if len(marker) < 2 or marker[0] != 0xFF:
+                        return None
+                    while marker[1] == 0xFF:  # Padding 건너뛰기
+                        marker = marker[1:] + buffer.read(1)
+                    if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+                        continue
+                    length: int = struct.unpack(">H", buffer.read(2))[0]
+                    if marker[1] in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+                        height, width = struct.unpack(">xHH", buffer.read(5))
+                        return width, height
+                    buffer.seek(length - 2, 1)
+    except (OSError, struct.error):
+        return None
+
+    return None
+
+
+# 저장된 파일의 메타데이터를 계산하는 기능
+def inspect_image_file(file_path: str, checker_size: int = 2048) -> dict:
+    """
+    저장된 파일을 읽어 형식, 크기, SHA-256, 가로/세로 크기를 계산하는 기능
+    :param file_path: 이미지 파일 경로
+    :param checker_size: 형식 검사에 사용할 앞부분 크기
+    :return: 파일 메타데이터 dict (형식을 알 수 없으면 mime은 None)
+    """
+    digest = hashlib.sha256()
+    file_size: int = 0
+
+    with open(file_path, "rb") as buffer:
+        file_type = filetype.guess(buffer.read(checker_size))
+        buffer.seek(0)
+        while chunk := buffer.read(file_chunk_size):
+            digest.update(chunk)
+            file_size += len(chunk)
+
+    dimensions = read_image_size(file_path) or (None, None)
+
+    return {
+        "mime": file_type.mime if file_type else None,
+        "size": file_size,
+        "sha256": digest.hexdigest(),
+        "width": dimensions[0],
+        "height": dimensions[1]
+    }
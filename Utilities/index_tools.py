@@ -0,0 +1,523 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Image Index Tools
+"""
+
+# Libraries
+from sqlalchemy import create_engine, event, inspect, text, Column, String, INT, BigInteger, Boolean, DateTime, Index, and_, or_
+from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+
+from fastapi.concurrency import run_in_threadpool
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import argparse
+import base64
+import fcntl
+import heapq
+import json
+import os
+from dotenv import load_dotenv
+
+from Utilities.logging_tools import *
+from Utilities.worker_tools import split_connection_budget, make_shared_cache
+from Utilities.image_tools import inspect_image_file
+from Database.models import Order
+
+logger = get_logger("Index")
+
+# 이미지 색인 설정 불러오기
+load_dotenv()
+image_storage: str = os.getenv("IMAGE_STORAGE")
+index_url: str = os.getenv("IMAGE_INDEX_URL", f"sqlite:///{os.path.join(image_storage, '.index.sqlite3')}")
+index_cache_ttl: int = int(os.getenv("IMAGE_INDEX_CACHE_TTL", 30))
+index_cache_size: int = int(os.getenv("IMAGE_INDEX_CACHE_SIZE", 20000))
+index_pool_size: int = int(os.getenv("IMAGE_INDEX_POOL_SIZE", 5))
+index_max_overflow: int = int(os.getenv("IMAGE_INDEX_MAX_OVERFLOW", 10))
+index_connection_budget: int = int(os.getenv("IMAGE_INDEX_CONNECTION_BUDGET", 32))
+index_rename_attempts: int = 10  # 같은 이름의 이미지가 이미 있는 경우 번호를 붙여 다시 추가하는 최대 횟수
+
+# Create table base
+IndexBase = declarative_base()
+
+
+class ImagesTable(IndexBase):
+    """
+    저장된 이미지의 메타데이터
+    """
+    __tablename__ = "images"
+
+    owner_id = Column(String(16), primary_key=True, nullable=False)
+    file_name = Column(String(255), primary_key=True, nullable=False)
+    path = Column(String(512), nullable=False)
+    mime = Column(String(32), nullable=False)
+    size = Column(BigInteger, nullable=False)
+    sha256 = Column(String(64), nullable=False)
+    width = Column(INT, nullable=True)
+    height = Column(INT, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    modified_at = Column(DateTime, nullable=True)  # 검사 후 메타데이터를 지운 내용으로 바뀐 시각 (Last-Modified)
+    pending = Column(Boolean, nullable=False, default=False, server_default=text("0"))  # 검사가 끝나지 않아 공개하지 않음
+
+    # 업로드 시각 순서로 목록을 불러오기 위한 색인
+    __table_args__ = (
+        Index("ix_images_owner_created", "owner_id", "created_at", "file_name"),
+    )
+
+    def __repr__(self):
+        return (f"" +
+                f"<Image(owner_id='{self.owner_id}', " +
+                f"file_name='{self.file_name}', " +
+                f"path='{self.path}', " +
+                f"mime='{self.mime}', " +
+                f"size='{self.size}', " +
+                f"sha256='{self.sha256}', " +
+                f"width='{self.width}', " +
+                f"height='{self.height}', " +
+                f"created_at='{self.created_at}', " +
+                f"modified_at='{self.modified_at}', " +
+                f"pending='{self.pending}')>"
+                )
+
+
+# 색인 레코드를 공유 Cache(JSON)에 저장할 수 있는 값으로 바꾸는 기능
+def encode_cached_record(image_data: dict) -> dict:
+    return {
+        **image_data,
+        "created_at": image_data["created_at"].isoformat(),
+        "modified_at": image_data["modified_at"] and image_data["modified_at"].isoformat()
+    }
+
+
+# 공유 Cache(JSON)에서 불러온 값을 색인 레코드로 바꾸는 기능
+def decode_cached_record(image_data: dict) -> dict:
+    return {
+        **image_data,
+        "created_at": datetime.fromisoformat(image_data["created_at"]),
+        "modified_at": image_data["modified_at"] and datetime.fromisoformat(image_data["modified_at"])
+    }
+
+
+class ImageIndex:
+    def __init__(self, url: str):
+        # SQLite를 사용하는 경우 여러 Worker가 동시에 읽을 수 있도록 WAL 모드 사용
+        if url.startswith("sqlite"):
+            self.engine = create_engine(url, connect_args={"check_same_thread": False, "timeout": 30})
+
+            @event.listens_for(self.engine, "connect")
+            def set_sqlite_pragma(connection, _):
+                cursor = connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.close()
+        else:
+            # 여러 Worker로 실행되는 경우 전체 Connection 수가 한도를 넘지 않도록 Worker별 Pool 크기를 줄임
+            pool_size, max_overflow = split_connection_budget(
+                index_pool_size, index_max_overflow, index_connection_budget
+            )
+            self.engine = create_engine(
+                url, pool_size=pool_size, max_overflow=max_overflow, pool_recycle=120, pool_pre_ping=True
+            )
+
+        self.create_tables([ImagesTable.__table__])
+
+        self.pre_session = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # 여러 Worker로 실행되는 경우 한 Worker에서 삭제된 이미지를 다른 Worker도 바로 알 수 있도록 공유 Cache 사용
+        self.cache = make_shared_cache(
+            "index", index_cache_size, index_cache_ttl, encode=encode_cached_record, decode=decode_cached_record
+        )
+
+    # 여러 Worker가 동시에 시작해도 테이블을 한 번씩만 만들도록 잠그는 기능
+    @contextmanager
+    def schema_lock(self):
+        with open(os.path.join(image_storage, ".index.lock"), "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield
+
+    # 테이블을 만드는 기능 (이미 만들어진 테이블에는 나중에 추가된 열과 색인을 추가)
+    def create_tables(self, tables: list) -> None:
+        with self.schema_lock():
+            IndexBase.metadata.create_all(self.engine, tables=tables)
+            for table in tables:
+                self.add_missing_columns(table)
+                for table_index in table.indexes:
+                    table_index.create(self.engine, checkfirst=True)
+
+    # 이미 만들어진 테이블에 없는 열을 추가하는 기능 (나중에 추가되는 열은 Nullable이거나 기본값이 있어야 함)
+    def add_missing_columns(self, table) -> None:
+        existing: set[str] = {column["name"] for column in inspect(self.engine).get_columns(table.name)}
+        with self.engine.begin() as connection:
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                column_type: str = column.type.compile(dialect=self.engine.dialect)
+                default: str = f" DEFAULT {column.server_default.arg}" if column.server_default is not None else ""
+                connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}{default}"))
+                logger.info(f"Index column added: {table.name}.{column.name}")
+
+    # 색인 연결을 위한 Pre Session을 반환하는 기능
+    def get_pre_session(self):
+        return self.pre_session
+
+
+index_instance = ImageIndex(index_url)
+
+
+# 색인 레코드를 dict로 변환하는 기능
+def serialize_image_record(image_data: ImagesTable) -> dict:
+    return {
+        "owner_id": image_data.owner_id,
+        "file_name": image_data.file_name,
+        "path": image_data.path,
+        "mime": image_data.mime,
+        "size": image_data.size,
+        "sha256": image_data.sha256,
+        "width": image_data.width,
+        "height": image_data.height,
+        "created_at": image_data.created_at,
+        "modified_at": image_data.modified_at,
+        "pending": bool(image_data.pending)
+    }
+
+
+# 이미지 메타데이터를 색인에 추가하기
+def add_image_record(image_data: dict, rename: bool = False) -> dict:
+    """
+    업로드된 이미지의 메타데이터를 색인에 추가하는 기능
+    같은 이름이 이미 있으면 덮어쓰지 않음 (덮어쓰면 기존 이미지가 가진 Blob의 참조를 해제할 수 없음)
+    :param image_data: owner_id, file_name, path, mime, size, sha256, width, height, created_at
+                       (modified_at, pending은 생략 가능) dict
+    :param rename: 같은 이름이 이미 있으면 이름 뒤에 번호를 붙여 다시 추가할지 여부
+    :return: 추가된 메타데이터 dict (rename이면 file_name이 바뀔 수 있음, 실패하면 빈 dict)
+    """
+    image_data = {"modified_at": None, "pending": False, **image_data}
+    file_stem, ext = os.path.splitext(image_data["file_name"])
+
+    database_pre_session = index_instance.get_pre_session()
+    for attempt in range(index_rename_attempts if rename else 1):
+        record: dict = {**image_data, "file_name": f"{file_stem}_{attempt}{ext}" if attempt else image_data["file_name"]}
+
+        with database_pre_session() as session:
+            try:
+                session.add(ImagesTable(**record))
+                session.commit()
+                index_instance.cache.set((record["owner_id"], record["file_name"]), record)
+                return record
+            except IntegrityError:
+                session.rollback()
+                logger.warning(f"Image record already exists: {record['owner_id']}/{record['file_name']}")
+            except SQLAlchemyError as error:
+                session.rollback()
+                logger.error(f"Error adding image record: {str(error)}")
+                return {}
+
+    return {}
+
+
+# 이미지 메타데이터를 색인에서 불러오기
+def get_image_record(owner_id: str, file_name: str) -> dict:
+    """
+    이미지의 메타데이터를 메모리 Cache 또는 색인에서 불러오는 기능
+    :param owner_id: 이미지 소유자의 ID
+    :param file_name: 이미지 파일명
+    :return: 이미지 메타데이터 dict (없으면 빈 dict)
+    """
+    cached_data: dict = index_instance.cache.get((owner_id, file_name))
+    if cached_data is not None:
+        return cached_data
+
+    result: dict = {}
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            image_data = session.query(ImagesTable).filter(
+                ImagesTable.owner_id == owner_id,
+                ImagesTable.file_name == file_name
+            ).first()
+
+            if image_data is not None:
+                result = serialize_image_record(image_data)
+                index_instance.cache.set((owner_id, file_name), result)
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error getting image record: {str(error)}")
+            result = {}
+        finally:
+            return result
+
+
+# 이미지 메타데이터를 색인에서 삭제하기
+def delete_image_record(owner_id: str, file_name: str) -> int | None:
+    """
+    이미지의 메타데이터를 색인과 메모리 Cache에서 삭제하는 기능
+    동시에 같은 이미지를 삭제하는 경우 한 요청만 1을 받으므로, 1을 받은 경우에만 Blob의 참조를 줄여야 함
+    :param owner_id: 이미지 소유자의 ID
+    :param file_name: 이미지 파일명
+    :return: 삭제된 행 수 int (이미 삭제되었으면 0, 실패하면 None)
+    """
+    result: int | None = None
+    index_instance.cache.invalidate((owner_id, file_name))
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            result = session.query(ImagesTable).filter(
+                ImagesTable.owner_id == owner_id,
+                ImagesTable.file_name == file_name
+            ).delete(synchronize_session=False)
+            session.commit()
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error deleting image record: {str(error)}")
+            result = None
+        finally:
+            return result
+
+
+# 색인에 없는 기존 파일을 색인에 등록하기
+def register_existing_file(owner_id: str, file_name: str) -> dict:
+    """
+    색인 도입 이전에 저장된 파일을 읽어서 메타데이터를 색인에 등록하는 기능
+    :param owner_id: 이미지 소유자의 ID
+    :param file_name: 이미지 파일명
+    :return: 등록된 메타데이터 dict (이미지가 아니거나 실패하면 빈 dict)
+    """
+    relative_path: str = os.path.join(owner_id, file_name)
+    file_path: str = os.path.join(image_storage, relative_path)
+
+    try:
+        file_data: dict = inspect_image_file(file_path)
+        created_at = datetime.fromtimestamp(os.stat(file_path).st_mtime, tz=timezone.utc)
+    except OSError as error:
+        logger.error(f"Error inspecting existing file: {str(error)}")
+        return {}
+
+    if file_data["mime"] is None:
+        return {}
+
+    image_data: dict = {
+        "owner_id": owner_id,
+        "file_name": file_name,
+        "path": relative_path,
+        **file_data,
+        "created_at": created_at.replace(tzinfo=None),
+        "modified_at": None,
+        "pending": False
+    }
+
+    # 다른 요청이 먼저 등록한 경우 등록된 정보를 사용
+    return add_image_record(image_data) or get_image_record(owner_id, file_name)
+
+
+# 이미지 소유자와 파일명으로 저장된 이미지를 찾는 기능
+def resolve_image_record(owner_id: str, file_name: str) -> dict:
+    """
+    조회와 삭제에서 공통으로 사용하는 경로 해석 기능
+    색인을 먼저 확인하고, 없으면 색인 도입 이전의 경로(image_storage/<owner_id>/<file_name>)를 확인하여 등록함
+    :param owner_id: 이미지 소유자의 ID
+    :param file_name: 이미지 파일명
+    :return: 이미지 메타데이터 dict (없으면 빈 dict)
+    """
+    image_data: dict = get_image_record(owner_id, file_name)
+
+    if not image_data and os.path.isfile(os.path.join(image_storage, owner_id, file_name)):
+        image_data = register_existing_file(owner_id, file_name)
+
+    return image_data
+
+
+# 목록 위치(Cursor)를 문자열로 만드는 기능
+def encode_list_cursor(image_data: dict) -> str:
+    key: list = [image_data["created_at"].isoformat(), image_data["owner_id"], image_data["file_name"]]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+# 문자열로 된 목록 위치(Cursor)를 읽는 기능
+def decode_list_cursor(cursor: str) -> tuple[datetime, str, str]:
+    """
+    목록 위치(Cursor)를 (업로드 시각, 소유자 ID, 파일명)으로 바꾸는 기능
+    :param cursor: encode_list_cursor로 만든 문자열
+    :return: 마지막으로 받은 이미지의 정렬 기준 tuple[datetime, str, str] (잘못된 값이면 ValueError 발생)
+    """
+    try:
+        created_at, owner_id, file_name = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(created_at), str(owner_id), str(file_name)
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"Invalid cursor: {cursor}") from error
+
+
+# 여러 소유자의 이미지를 업로드 시각 순서로 불러오기
+def list_image_records(owner_ids: list[str], order: Order = Order.DESC, limit: int = 30,
+                       cursor: str | None = None) -> tuple[list[dict], str | None]:
+    """
+    (업로드 시각, 소유자 ID, 파일명) 순서의 Keyset Pagination으로 이미지 목록을 불러오는 기능
+    소유자마다 색인 범위에서 limit + 1개만 읽은 후 합치므로, 쌓인 이미지 수와 관계없이 한 Page의 비용이 일정함
+    :param owner_ids: 이미지 소유자 ID 목록
+    :param order: 정렬 방향
+    :param limit: 한 Page의 이미지 수
+    :param cursor: 이전 Page의 다음 위치 (Nullable)
+    :return: 이미지 메타데이터 목록과 다음 Page 위치 tuple[list[dict], str | None] (실패하면 빈 목록)
+    """
+    last_key = decode_list_cursor(cursor) if cursor else None
+    descending: bool = order == Order.DESC
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            owner_pages: list[list[dict]] = []
+
+            for owner_id in sorted(set(owner_ids)):
+                query = session.query(ImagesTable).filter(
+                    ImagesTable.owner_id == owner_id,
+                    ImagesTable.pending.is_(False)
+                )
+
+                if last_key is not None:
+                    query = query.filter(keyset_condition(owner_id, last_key, descending))
+
+                if descending:
+                    query = query.order_by(ImagesTable.created_at.desc(), ImagesTable.file_name.desc())
+                else:
+                    query = query.order_by(ImagesTable.created_at.asc(), ImagesTable.file_name.asc())
+
+                owner_pages.append([serialize_image_record(image_data) for image_data in query.limit(limit + 1)])
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error listing image records: {str(error)}")
+            return [], None
+
+    # 소유자별 목록을 정렬 순서를 유지하며 합치기
+    merged: list[dict] = list(heapq.merge(
+        *owner_pages,
+        key=lambda image_data: (image_data["created_at"], image_data["owner_id"], image_data["file_name"]),
+        reverse=descending
+    ))[:limit + 1]
+
+    if len(merged) > limit:
+        return merged[:limit], encode_list_cursor(merged[limit - 1])
+    return merged, None
+
+
+# 검사가 끝나지 않은 채 남은 이미지 불러오기
+def list_pending_image_records(created_before: datetime, limit: int = 100) -> list[dict]:
+    """
+    검사 중 서버가 종료되는 등으로 공개되지 않은 채 남은 이미지를 불러오는 기능
+    :param created_before: 이 시각 이전에 업로드된 이미지만 불러옴 (검사 중인 이미지 제외)
+    :param limit: 최대 개수
+    :return: 이미지 메타데이터 목록 list[dict] (실패하면 빈 목록)
+    """
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            return [serialize_image_record(image_data) for image_data in session.query(ImagesTable).filter(
+                ImagesTable.pending.is_(True),
+                ImagesTable.created_at < created_before
+            ).limit(limit)]
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error listing pending image records: {str(error)}")
+            return []
+
+
+# 한 소유자의 이미지 중 목록 위치 다음에 오는 이미지를 고르는 조건
+def keyset_condition(owner_id: str, last_key: tuple[datetime, str, str], descending: bool):
+    last_created_at, last_owner_id, last_file_name = last_key
+
+    if descending:
+        if owner_id == last_owner_id:
+            return or_(
+                ImagesTable.created_at < last_created_at,
+                and_(ImagesTable.created_at == last_created_at, ImagesTable.file_name < last_file_name)
+            )
+        return ImagesTable.created_at <= last_created_at if owner_id < last_owner_id \
+            else ImagesTable.created_at < last_created_at
+
+    if owner_id == last_owner_id:
+        return or_(
+            ImagesTable.created_at > last_created_at,
+            and_(ImagesTable.created_at == last_created_at, ImagesTable.file_name > last_file_name)
+        )
+    return ImagesTable.created_at >= last_created_at if owner_id > last_owner_id \
+        else ImagesTable.created_at > last_created_at
+
+
+# ========== Event Loop를 막지 않는 색인 기능 ==========
+async def async_add_image_record(image_data: dict, rename: bool = False) -> dict:
+    return await run_in_threadpool(add_image_record, image_data, rename)
+
+
+async def async_get_image_record(owner_id: str, file_name: str) -> dict:
+    cached_data: dict = index_instance.cache.get((owner_id, file_name))
+    if cached_data is not None:
+        return cached_data
+
+    return await run_in_threadpool(get_image_record, owner_id, file_name)
+
+
+async def async_delete_image_record(owner_id: str, file_name: str) -> int | None:
+    return await run_in_threadpool(delete_image_record, owner_id, file_name)
+
+
+async def async_register_existing_file(owner_id: str, file_name: str) -> dict:
+    return await run_in_threadpool(register_existing_file, owner_id, file_name)
+
+
+async def async_list_image_records(owner_ids: list[str], order: Order = Order.DESC, limit: int = 30,
+                                   cursor: str | None = None) -> tuple[list[dict], str | None]:
+    return await run_in_threadpool(list_image_records, owner_ids, order, limit, cursor)
+
+
+async def async_list_pending_image_records(created_before: datetime, limit: int = 100) -> list[dict]:
+    return await run_in_threadpool(list_pending_image_records, created_before, limit)
+
+
+async def async_resolve_image_record(owner_id: str, file_name: str) -> dict:
+    cached_data: dict = index_instance.cache.get((owner_id, file_name))
+    if cached_data is not None:
+        return cached_data
+
+    return await run_in_threadpool(resolve_image_record, owner_id, file_name)
+
+
+# 색인 Cache 사용 현황 불러오기
+def get_index_cache_stats() -> dict:
+    return index_instance.cache.stats()
+
+
+# 저장공간 전체를 색인에 등록하기
+def backfill_index() -> int:
+    """
+    저장공간을 순회하며 색인에 없는 기존 파일을 모두 등록하는 기능
+    :return: 새로 등록한 파일 수 int
+    """
+    registered: int = 0
+
+    for owner_id in sorted(os.listdir(image_storage)):
+        owner_storage: str = os.path.join(image_storage, owner_id)
+        if owner_id.startswith(".") or not os.path.isdir(owner_storage):
+            continue
+
+        for file_name in sorted(os.listdir(owner_storage)):
+            if file_name.startswith(".") or get_image_record(owner_id, file_name):
+                continue
+
+            if register_existing_file(owner_id, file_name):
+                registered += 1
+            else:
+                logger.warning(f"Skipped file: {os.path.join(owner_id, file_name)}")
+
+    return registered
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Care-bot Image Provider index tools")
+    parser.add_argument("command", choices=["backfill"])
+    arguments = parser.parse_args()
+
+    if arguments.command == "backfill":
+        logger.info(f"Backfilled images: {backfill_index()}")
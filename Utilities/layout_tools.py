@@ -0,0 +1,48 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Storage Layout Tools
+"""
+
+# Libraries
+from datetime import datetime, timezone
+from enum import Enum
+
+import re
+import os
+from dotenv import load_dotenv
+
+
+class StorageLayout(str, Enum):
+    HASH = "hash"  # SHA-256 앞부분으로 디렉터리를 나눔 (ab/cd/)
+    DATE = "date"  # 저장한 날짜(UTC)로 디렉터리를 나눔 (2025/01/31/)
+
+
+# 저장공간 구조 설정 불러오기
+load_dotenv()
+storage_layout: StorageLayout = StorageLayout(os.getenv("STORAGE_LAYOUT", StorageLayout.HASH.value))
+
+
+# 파일을 나누어 저장할 하위 디렉터리 경로를 만드는 기능
+def make_shard_path(sha256: str, moment: datetime | None = None, layout: StorageLayout = storage_layout) -> str:
+    """
+    저장공간 구조에 따라 한 디렉터리에 파일이 몰리지 않도록 하위 디렉터리 경로를 만드는 기능
+    :param sha256: 파일 내용의 SHA-256
+    :param moment: 저장 시각 (없으면 현재 시각, DATE 구조에서만 사용)
+    :param layout: 저장공간 구조
+    :return: 하위 디렉터리 상대 경로 str
+    """
+    if layout == StorageLayout.DATE:
+        moment = moment or datetime.now(tz=timezone.utc)
+        return os.path.join(f"{moment.year:04d}", f"{moment.month:02d}", f"{moment.day:02d}")
+
+    return os.path.join(sha256[:2], sha256[2:4])
+
+
+# 하위 디렉터리 경로가 저장공간 구조에 맞는지 확인하는 기능
+def matches_layout(shard_path: str, sha256: str, layout: StorageLayout = storage_layout) -> bool:
+    if layout == StorageLayout.DATE:
+        return re.fullmatch(r"\d{4}/\d{2}/\d{2}", shard_path.replace(os.sep, "/")) is not None
+
+    return shard_path == make_shard_path(sha256, layout=StorageLayout.HASH)
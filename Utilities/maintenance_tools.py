@@ -0,0 +1,154 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Maintenance Tools
+"""
+
+# Libraries
+from sqlalchemy.exc import SQLAlchemyError
+
+from datetime import datetime, timedelta, timezone
+
+import time
+import os
+from dotenv import load_dotenv
+
+import Database
+from Database.models import Role
+
+from Utilities.logging_tools import *
+from Utilities.upload_tools import remove_quietly, temp_suffix
+from Utilities.index_tools import ImagesTable, index_instance, image_storage, delete_image_record
+from Utilities.blob_tools import blob_storage, is_blob_path, release_blob
+from Utilities.variant_tools import variant_storage
+from Utilities.storage_tools import storage_backend, storage_cache_max_age
+
+logger = get_logger("Maintenance")
+
+# 유지보수 작업 설정 불러오기
+load_dotenv()
+temp_file_max_age: int = int(os.getenv("TEMP_FILE_MAX_AGE", 60 * 60))
+temp_cleanup_interval: int = int(os.getenv("TEMP_CLEANUP_INTERVAL", 10 * 60))
+retention_interval: int = int(os.getenv("RETENTION_INTERVAL", 60 * 60))
+retention_days: int = int(os.getenv("RETENTION_DAYS", 0))
+retention_roles: list[Role] = [
+    Role(role.strip()) for role in os.getenv("RETENTION_ROLES", "").split(",") if role.strip()
+]
+retention_file_prefix: str = os.getenv("RETENTION_FILE_PREFIX", "")
+retention_batch: int = int(os.getenv("RETENTION_BATCH", 200))
+
+
+# 임시 파일이 만들어지는 디렉터리 목록
+def get_temp_directories() -> list[str]:
+    """
+    업로드(.upload_*.tmp)와 파생 이미지(.variant_*.tmp) 임시 파일이 만들어지는 디렉터리 목록
+    색인 도입 이전에는 사용자 디렉터리에 임시 파일을 만들었으므로 함께 확인함
+    :return: 디렉터리 경로 목록 list[str]
+    """
+    directories: list[str] = [blob_storage]
+
+    for root in (image_storage, variant_storage):
+        for entry in os.scandir(root):
+            if entry.is_dir() and (root == variant_storage or not entry.name.startswith(".")):
+                directories.append(entry.path)
+
+    return directories
+
+
+# 비정상 종료 등으로 남아있는 임시 파일을 삭제하는 기능
+def cleanup_orphan_temp_files(max_age: int = temp_file_max_age) -> int:
+    """
+    기록 도중 Process가 종료되어 남은 임시 파일 중 일정 시간이 지난 파일을 삭제하는 기능
+    :param max_age: 임시 파일을 유지하는 시간 (초)
+    :return: 삭제한 파일 수 int
+    """
+    removed: int = 0
+    expired_before: float = time.time() - max_age
+
+    for directory in get_temp_directories():
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+
+        for entry in entries:
+            try:
+                if entry.name.startswith(".") and entry.name.endswith(temp_suffix) \
+                        and entry.is_file() and entry.stat().st_mtime < expired_before:
+                    remove_quietly(entry.path)
+                    removed += 1
+            except OSError:
+                continue
+
+    return removed
+
+
+# S3 저장소를 사용하는 경우 오랫동안 읽지 않은 원본의 로컬 사본을 삭제하는 기능
+def cleanup_storage_cache(max_age: int = storage_cache_max_age) -> int:
+    """
+    Host별로 내려받은 원본(Blob)의 로컬 사본 중 오래된 것을 삭제하는 기능 (원본은 저장소에 남아 있음)
+    :param max_age: 마지막으로 읽은 후 유지할 시간 (초)
+    :return: 삭제한 파일 수 int
+    """
+    if not storage_backend.remote:
+        return 0
+
+    return storage_backend.prune_local_copies(blob_storage, max_age)
+
+
+# 보관 기간이 지난 이미지를 삭제하는 기능
+def purge_expired_images(days: int = retention_days, roles: list[Role] = None,
+                         file_prefix: str = retention_file_prefix, batch_size: int = retention_batch) -> int:
+    """
+    지정한 역할의 사용자가 올린 이미지 중 보관 기간이 지난 이미지를 일정 개수씩 삭제하는 기능
+    (예: Care-bot이 올린 오래된 알림 촬영 이미지)
+    :param days: 보관 기간 (일, 0 이하이면 삭제하지 않음)
+    :param roles: 대상 사용자 역할 목록 (없으면 RETENTION_ROLES 사용)
+    :param file_prefix: 대상 파일명의 시작 문자열 (빈 값이면 모든 파일)
+    :param batch_size: 한 번에 불러올 이미지 수
+    :return: 삭제한 이미지 수 int
+    """
+    roles = retention_roles if roles is None else roles
+    if days <= 0 or not roles:
+        return 0
+
+    owner_ids: list[str] = Database.get_account_ids_by_role(roles)
+    if not owner_ids:
+        return 0
+
+    expired_before = datetime.now(tz=timezone.utc).replace(tzinfo=None) - timedelta(days=days)
+    removed: int = 0
+
+    database_pre_session = index_instance.get_pre_session()
+    while True:
+        with database_pre_session() as session:
+            try:
+                query = session.query(ImagesTable.owner_id, ImagesTable.file_name, ImagesTable.path,
+                                      ImagesTable.sha256).filter(
+                    ImagesTable.owner_id.in_(owner_ids),
+                    ImagesTable.created_at < expired_before
+                )
+                if file_prefix:
+                    query = query.filter(ImagesTable.file_name.startswith(file_prefix, autoescape=True))
+                expired_images = query.limit(batch_size).all()
+            except SQLAlchemyError as error:
+                session.rollback()
+                logger.error(f"Error loading expired images: {str(error)}")
+                return removed
+
+        for owner_id, file_name, path, sha256 in expired_images:
+            deleted: int | None = delete_image_record(owner_id, file_name)
+            if deleted is None:
+                return removed
+            if deleted == 0:
+                continue  # 다른 요청이 먼저 삭제하여 참조도 이미 줄어든 경우
+
+            if is_blob_path(path):
+                release_blob(sha256)
+            else:
+                remove_quietly(os.path.join(image_storage, path))
+            removed += 1
+
+        if len(expired_images) < batch_size:
+            return removed
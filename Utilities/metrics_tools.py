@@ -0,0 +1,411 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Metrics Tools
+
+Prometheus 형식의 측정값을 모으는 도구
+측정값은 Worker Process마다 메모리에 모아두고, 주기적으로(또는 /metrics 요청 시) METRICS_DIR에
+Process별 Snapshot 파일로 기록한 후 모든 Worker의 Snapshot을 합쳐서 제공함
+"""
+
+# Libraries
+from sqlalchemy.pool import QueuePool
+
+from contextlib import contextmanager
+from threading import Lock
+from typing import Callable
+
+import bisect
+import json
+import tempfile
+import time
+import os
+from dotenv import load_dotenv
+
+from Utilities.logging_tools import *
+
+logger = get_logger("Metrics")
+
+# 측정 설정 불러오기
+load_dotenv()
+metrics_token: str = os.getenv("METRICS_TOKEN", "")  # /metrics 요청에 필요한 Bearer Token
+metrics_enabled: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true" and bool(metrics_token)
+if os.getenv("METRICS_ENABLED", "").lower() == "true" and not metrics_token:  # Token 없이 측정값을 공개하지 않음
+    logger.warning("Metrics are disabled: METRICS_TOKEN is not set")
+metrics_directory: str = os.getenv("METRICS_DIR", os.path.join(tempfile.gettempdir(), "carebot-image-metrics"))
+metrics_flush_interval: float = float(os.getenv("METRICS_FLUSH_INTERVAL", 5))
+os.makedirs(metrics_directory, exist_ok=True)
+
+default_buckets: tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Counter:
+    """
+    증가만 하는 측정값 (요청 수, 전송량 등)
+    """
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.values: dict[tuple, float] = {}
+        self.lock = Lock()
+
+    def inc(self, labels: tuple = (), amount: float = 1.0) -> None:
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "type": "counter",
+                "help": self.documentation,
+                "labels": list(self.label_names),
+                "samples": [[list(labels), value] for labels, value in self.values.items()]
+            }
+
+
+class Histogram:
+    """
+    값의 분포를 구간별로 세는 측정값 (처리 시간 등)
+    """
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = default_buckets):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        self.values: dict[tuple, list] = {}  # labels -> [구간별 개수..., 합계, 전체 개수]
+        self.lock = Lock()
+
+    def observe(self, labels: tuple, value: float) -> None:
+        position: int = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            counts = self.values.get(labels)
+            if counts is None:
+                counts = self.values[labels] = [0] * (len(self.buckets) + 2)
+            if position < len(self.buckets):
+                counts[position] += 1
+            counts[-2] += value
+            counts[-1] += 1
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "type": "histogram",
+                "help": self.documentation,
+                "labels": list(self.label_names),
+                "buckets": list(self.buckets),
+                "samples": [[list(labels), list(counts)] for labels, counts in self.values.items()]
+            }
+
+
+class MetricsRegistry:
+    """
+    측정값과 수집 기능(Collector)을 등록하고 Snapshot을 만드는 저장소
+    """
+    def __init__(self):
+        self.metrics: dict[str, Counter | Histogram] = {}
+        self.collectors: list[Callable[[], list[tuple[str, str, str, dict, float]]]] = []
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self.metrics.setdefault(name, Counter(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: tuple[str, ...] = (),
+                  buckets: tuple[float, ...] = default_buckets) -> Histogram:
+        return self.metrics.setdefault(name, Histogram(name, documentation, label_names, buckets))
+
+    # Snapshot을 만들 때 현재 값을 읽어오는 기능을 등록 (Cache 크기, Connection Pool 상태 등)
+    def register_collector(self, collector: Callable[[], list[tuple[str, str, str, dict, float]]]) -> None:
+        """
+        :param collector: (이름, 형식(counter/gauge), 설명, Label dict, 값) 목록을 반환하는 함수
+        """
+        self.collectors.append(collector)
+
+    def snapshot(self) -> dict:
+        result: dict = {name: metric.snapshot() for name, metric in self.metrics.items()}
+
+        for collector in self.collectors:
+            try:
+                samples = collector()
+            except Exception as error:
+                logger.error(f"Metrics collector failed: {str(error)}")
+                continue
+
+            for name, metric_type, documentation, labels, value in samples:
+                entry: dict = result.setdefault(name, {
+                    "type": metric_type,
+                    "help": documentation,
+                    "labels": list(labels.keys()),
+                    "samples": []
+                })
+                entry["samples"].append([[str(label) for label in labels.values()], float(value)])
+
+        return result
+
+
+registry = MetricsRegistry()
+
+# 공통 측정값
+request_counter = registry.counter(
+    "image_http_requests_total", "HTTP requests by route, method and status", ("route", "method", "status")
+)
+request_histogram = registry.histogram(
+    "image_http_request_duration_seconds", "HTTP request latency by route", ("route", "method")
+)
+bytes_in_counter = registry.counter("image_http_received_bytes_total", "Request body bytes received", ("route",))
+bytes_out_counter = registry.counter("image_http_sent_bytes_total", "Response body bytes sent", ("route",))
+stage_histogram = registry.histogram(
+    "image_stage_duration_seconds", "Time spent in each request stage", ("stage",)
+)
+pool_wait_histogram = registry.histogram(
+    "image_db_pool_wait_seconds", "Time spent waiting for a DB connection", ("pool",)
+)
+
+
+# 요청 처리 단계의 시간을 재는 기능
+@contextmanager
+def stage_timer(stage: str):
+    """
+    with stage_timer("session"): 처럼 사용하여 해당 단계의 처리 시간을 기록하는 기능
+    :param stage: 단계 이름 (session, account, acl, sniff, disk 등)
+    """
+    if not metrics_enabled:
+        yield
+        return
+
+    started: float = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage_histogram.observe((stage,), time.perf_counter() - started)
+
+
+class TimedQueuePool(QueuePool):
+    """
+    Connection을 얻을 때까지 기다린 시간을 기록하는 Connection Pool
+    create_engine(poolclass=TimedQueuePool)로 사용하며, Pool이 가득 찬 경우의 대기 시간이 그대로 기록됨
+    """
+    metric_name: str = "database"
+
+    def _do_get(self):
+        if not metrics_enabled:
+            return super()._do_get()
+
+        started: float = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait_histogram.observe((self.metric_name,), time.perf_counter() - started)
+
+
+# Connection Pool 상태를 수집하도록 등록하는 기능
+def register_pool_metrics(name: str, engine) -> None:
+    """
+    :param name: Pool 이름 (Label 값)
+    :param engine: SQLAlchemy Engine
+    """
+    def collect() -> list[tuple[str, str, str, dict, float]]:
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            return []
+
+        labels: dict = {"pool": name}
+        return [
+            ("image_db_pool_size", "gauge", "Configured DB connection pool size", labels, pool.size()),
+            ("image_db_pool_checked_out", "gauge", "DB connections currently checked out", labels, pool.checkedout()),
+            ("image_db_pool_overflow", "gauge", "DB connections opened beyond the pool size", labels,
+             max(pool.overflow(), 0))
+        ]
+
+    registry.register_collector(collect)
+
+
+# Cache 사용 현황을 수집하도록 등록하는 기능
+def register_cache_metrics(name: str, cache) -> None:
+    """
+    적중률은 hits / (hits + misses)로 계산 (여러 Worker의 값을 더한 후 계산할 수 있도록 횟수로 제공)
+    :param name: Cache 이름 (Label 값)
+    :param cache: stats()로 size, hits, misses(와 bytes)를 제공하는 Cache
+    """
+    def collect() -> list[tuple[str, str, str, dict, float]]:
+        stats: dict = cache.stats()
+        labels: dict = {"cache": name}
+        samples: list[tuple[str, str, str, dict, float]] = [
+            ("image_cache_hits_total", "counter", "Cache hits", labels, stats["hits"]),
+            ("image_cache_misses_total", "counter", "Cache misses", labels, stats["misses"]),
+            ("image_cache_entries", "gauge", "Entries currently held in cache", labels, stats["size"])
+        ]
+        if "bytes" in stats:  # 크기로 한도를 정하는 Cache는 사용 중인 크기도 제공
+            samples.append(("image_cache_resident_bytes", "gauge", "Bytes currently held in cache", labels,
+                            stats["bytes"]))
+        if "shared_hits" in stats:  # Worker 공유 Cache는 Worker별 Cache에 없어 공유 Cache에서 찾은 횟수도 제공
+            samples.append(("image_cache_shared_hits_total", "counter", "Cache misses served by the shared tier",
+                            labels, stats["shared_hits"]))
+        return samples
+
+    registry.register_collector(collect)
+
+
+# Scheduler 작업 실행 기록을 수집하도록 등록하는 기능
+def register_scheduler_metrics(scheduler) -> None:
+    def collect() -> list[tuple[str, str, str, dict, float]]:
+        samples: list[tuple[str, str, str, dict, float]] = []
+        for name, stats in scheduler.stats()["jobs"].items():
+            labels: dict = {"job": name}
+            samples.extend([
+                ("image_scheduler_runs_total", "counter", "Scheduled job runs", labels, stats["runs"]),
+                ("image_scheduler_failures_total", "counter", "Scheduled job failures", labels, stats["failures"]),
+                ("image_scheduler_last_duration_seconds", "gauge", "Duration of the last job run", labels,
+                 stats["last_duration"])
+            ])
+        return samples
+
+    registry.register_collector(collect)
+
+
+class MetricsMiddleware:
+    """
+    Route별 요청 수, 처리 시간, 송수신 Byte를 기록하는 ASGI Middleware
+    Route는 경로 Template(/access/{user_id}/{file_name})으로 기록하여 Label 수가 늘어나지 않도록 함
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics_enabled:
+            return await self.app(scope, receive, send)
+
+        started: float = time.perf_counter()
+        traffic: dict = {"in": 0, "out": 0, "status": 500}
+
+        async def counted_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                traffic["in"] += len(message.get("body", b""))
+            return message
+
+        async def counted_send(message):
+            if message["type"] == "http.response.start":
+                traffic["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                traffic["out"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, counted_receive, counted_send)
+        finally:
+            route = scope.get("route")
+            route_path: str = getattr(route, "path", "unmatched")
+            method: str = scope["method"]
+
+            request_counter.inc((route_path, method, str(traffic["status"])))
+            request_histogram.observe((route_path, method), time.perf_counter() - started)
+            if traffic["in"]:
+                bytes_in_counter.inc((route_path,), traffic["in"])
+            if traffic["out"]:
+                bytes_out_counter.inc((route_path,), traffic["out"])
+
+
+# 현재 Worker의 Snapshot을 파일로 기록하는 기능
+def write_snapshot() -> None:
+    file_path: str = os.path.join(metrics_directory, f"{os.getpid()}.json")
+    temp_path: str = f"{file_path}.tmp"
+
+    with open(temp_path, "w") as buffer:
+        json.dump({"pid": os.getpid(), "time": time.time(), "metrics": registry.snapshot()}, buffer)
+    os.replace(temp_path, file_path)
+
+
+# 종료된 Worker인지 확인하는 기능
+def is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# 종료하는 Worker의 Snapshot을 삭제하는 기능
+def remove_snapshot() -> None:
+    try:
+        os.remove(os.path.join(metrics_directory, f"{os.getpid()}.json"))
+    except OSError:
+        pass
+
+
+# Label 값을 Prometheus 형식으로 바꾸는 기능
+def format_labels(names: list[str], values: list[str], extra: dict | None = None) -> str:
+    pairs: list[str] = [
+        f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for name, value in [*zip(names, values), *(extra or {}).items()]
+    ]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+# 모든 Worker의 Snapshot을 합쳐서 Prometheus 형식으로 만드는 기능
+def render_metrics() -> str:
+    """
+    현재 Worker의 Snapshot을 기록한 후 살아있는 모든 Worker의 Snapshot을 합쳐 Prometheus Text 형식으로 만드는 기능
+    Counter와 Histogram은 모든 Worker의 값을 더하고, Gauge는 Worker(pid)별로 구분하여 제공함
+    :return: Prometheus Text Exposition 형식 str
+    """
+    write_snapshot()
+
+    merged: dict[str, dict] = {}
+    for file_name in os.listdir(metrics_directory):
+        if not file_name.endswith(".json"):
+            continue
+
+        file_path: str = os.path.join(metrics_directory, file_name)
+        try:
+            with open(file_path) as buffer:
+                snapshot: dict = json.load(buffer)
+        except (OSError, ValueError):
+            continue
+
+        if not is_process_alive(snapshot["pid"]):
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+            continue
+
+        for name, metric in snapshot["metrics"].items():
+            entry: dict = merged.setdefault(name, {**metric, "samples": {}})
+
+            for labels, value in metric["samples"]:
+                key: tuple = tuple(labels)
+                if metric["type"] == "gauge":
+                    entry["samples"][(*key, str(snapshot["pid"]))] = value
+                elif metric["type"] == "histogram":
+                    previous = entry["samples"].get(key)
+                    entry["samples"][key] = [a + b for a, b in zip(previous, value)] if previous else list(value)
+                else:
+                    entry["samples"][key] = entry["samples"].get(key, 0.0) + value
+
+    lines: list[str] = []
+    for name in sorted(merged):
+        metric: dict = merged[name]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+
+        for key, value in sorted(metric["samples"].items()):
+            if metric["type"] == "gauge":
+                lines.append(f"{name}{format_labels(metric['labels'], list(key[:-1]), {'pid': key[-1]})} {value}")
+            elif metric["type"] == "histogram":
+                cumulative: int = 0
+                for bound, count in zip(metric["buckets"], value[:-2]):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{format_labels(metric['labels'], list(key), {'le': str(bound)})} {cumulative}")
+                lines.append(f"{name}_bucket{format_labels(metric['labels'], list(key), {'le': '+Inf'})} {value[-1]}")
+                lines.append(f"{name}_sum{format_labels(metric['labels'], list(key))} {value[-2]}")
+                lines.append(f"{name}_count{format_labels(metric['labels'], list(key))} {value[-1]}")
+            else:
+                lines.append(f"{name}{format_labels(metric['labels'], list(key))} {value}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,301 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Storage Migration Tools
+
+서비스를 멈추지 않고 저장공간의 파일을 현재 구조(STORAGE_LAYOUT)로 옮기는 도구
+1. 새 경로에 Hard Link(다른 파일 시스템이면 복사)를 만들고
+2. 색인의 경로를 새 경로로 바꾼 다음
+3. 다른 Worker의 색인 Cache가 만료될 때까지 기다린 후 이전 경로를 삭제함
+따라서 옮기는 동안에도 이전 경로로 계속 이미지를 제공할 수 있음
+S3 저장소(STORAGE_BACKEND=s3)를 사용하는 경우 사용자별 파일은 저장소로 올리고, Blob의 경로는 바꾸지 않음
+"""
+
+# Libraries
+from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
+
+import argparse
+import shutil
+import time
+import uuid
+import os
+
+from Utilities.logging_tools import *
+from Utilities.upload_tools import remove_quietly, temp_prefix, temp_suffix
+from Utilities.index_tools import (
+    ImagesTable,
+    index_instance,
+    image_storage,
+    index_cache_ttl,
+    get_image_record,
+    register_existing_file
+)
+from Utilities.blob_tools import (
+    BlobsTable,
+    blob_directory,
+    blob_storage,
+    get_blob_path,
+    is_blob_path,
+    store_blob,
+    release_blob
+)
+from Utilities.layout_tools import matches_layout
+from Utilities.storage_tools import storage_backend
+
+logger = get_logger("Migration")
+
+# 색인 Cache가 만료될 때까지 이전 경로를 유지하는 시간 (초)
+default_grace_period: int = index_cache_ttl + 5
+
+
+# 파일을 대상 디렉터리의 임시 경로에 연결하는 기능 (다른 파일 시스템이면 복사)
+def link_to_temp(source_path: str, directory: str) -> str:
+    os.makedirs(directory, exist_ok=True)
+    temp_path: str = os.path.join(directory, f"{temp_prefix}{uuid.uuid4().hex}{temp_suffix}")
+
+    try:
+        os.link(source_path, temp_path)
+    except OSError:
+        shutil.copy2(source_path, temp_path)
+
+    return temp_path
+
+
+# 파일을 새 경로에 연결하는 기능
+def link_or_copy(source_path: str, target_path: str) -> None:
+    os.replace(link_to_temp(source_path, os.path.dirname(target_path)), target_path)
+
+
+# 색인 도입 이전의 사용자별 파일을 내용 주소 기반 저장공간으로 옮기는 기능
+def migrate_legacy_file(owner_id: str, file_name: str) -> str | None:
+    """
+    사용자 디렉터리(image_storage/<owner_id>/<file_name>)에 있는 파일을 Blob으로 등록하고 색인 경로를 바꾸는 기능
+    :param owner_id: 이미지 소유자의 ID
+    :param file_name: 이미지 파일명
+    :return: 유예 시간 후 삭제할 이전 경로 str (옮기지 않은 경우 None)
+    """
+    legacy_path: str = os.path.join(owner_id, file_name)
+    image_data: dict = get_image_record(owner_id, file_name) or register_existing_file(owner_id, file_name)
+
+    if not image_data:
+        logger.warning(f"Skipped file: {legacy_path}")
+        return None
+
+    # 이전 실행에서 색인은 바뀌었지만 삭제되지 않고 남은 파일
+    if image_data["path"] != legacy_path:
+        return os.path.join(image_storage, legacy_path)
+
+    temp_path: str = link_to_temp(os.path.join(image_storage, legacy_path), blob_storage)
+    blob_path: str = store_blob(temp_path, image_data["sha256"], image_data["size"])
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            # 옮기는 도중 이미지가 삭제되었다면 경로를 바꾸지 않음
+            updated: int = session.query(ImagesTable).filter(
+                ImagesTable.owner_id == owner_id,
+                ImagesTable.file_name == file_name,
+                ImagesTable.path == legacy_path
+            ).update({ImagesTable.path: blob_path}, synchronize_session=False)
+            session.commit()
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error migrating image record: {str(error)}")
+            updated = 0
+
+    index_instance.cache.invalidate((owner_id, file_name))
+
+    if not updated:
+        release_blob(image_data["sha256"])
+        return None
+
+    return os.path.join(image_storage, legacy_path)
+
+
+# Blob을 현재 저장공간 구조의 경로로 옮기는 기능
+def relocate_blob(sha256: str, current_path: str) -> str | None:
+    """
+    Blob을 새 경로에 연결하고 blobs, images 테이블의 경로를 함께 바꾸는 기능
+    :param sha256: 내용의 SHA-256
+    :param current_path: 현재 저장공간 기준 상대 경로
+    :return: 유예 시간 후 삭제할 이전 경로 str (옮기지 않은 경우 None)
+    """
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        first_created_at = session.query(func.min(ImagesTable.created_at)).filter(
+            ImagesTable.sha256 == sha256
+        ).scalar()
+
+    target_path: str = get_blob_path(sha256, first_created_at)
+    if target_path == current_path:
+        return None
+
+    link_or_copy(os.path.join(image_storage, current_path), os.path.join(image_storage, target_path))
+
+    with database_pre_session() as session:
+        try:
+            # 옮기는 도중 Blob이 삭제되었다면 새로 만든 연결만 제거
+            updated: int = session.query(BlobsTable).filter(
+                BlobsTable.sha256 == sha256,
+                BlobsTable.path == current_path
+            ).update({BlobsTable.path: target_path}, synchronize_session=False)
+
+            if updated:
+                session.query(ImagesTable).filter(
+                    ImagesTable.sha256 == sha256,
+                    ImagesTable.path == current_path
+                ).update({ImagesTable.path: target_path}, synchronize_session=False)
+
+            session.commit()
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error relocating blob: {str(error)}")
+            updated = 0
+
+    if not updated:
+        remove_quietly(os.path.join(image_storage, target_path))
+        return None
+
+    index_instance.cache.clear()
+    return os.path.join(image_storage, current_path)
+
+
+# 유예 시간 동안 업로드된 이미지가 이전 경로를 참조하지 않도록 정리하는 기능
+def sweep_blob_references(moved: dict[str, str]) -> None:
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            for sha256, old_path in moved.items():
+                new_path = session.query(BlobsTable.path).filter(BlobsTable.sha256 == sha256).scalar()
+                if new_path and new_path != old_path:
+                    session.query(ImagesTable).filter(
+                        ImagesTable.sha256 == sha256,
+                        ImagesTable.path == old_path
+                    ).update({ImagesTable.path: new_path}, synchronize_session=False)
+            session.commit()
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error sweeping blob references: {str(error)}")
+
+
+# 유예 시간이 지난 후 이전 경로를 삭제하는 기능
+def remove_previous_paths(previous_paths: list[str], grace_period: float) -> None:
+    if not previous_paths:
+        return
+
+    time.sleep(grace_period)
+
+    for file_path in previous_paths:
+        remove_quietly(file_path)
+
+        # 비어 있는 상위 디렉터리 정리 (저장공간과 Blob 저장공간의 최상위는 유지)
+        directory: str = os.path.dirname(file_path)
+        while os.path.abspath(directory) not in (os.path.abspath(image_storage), os.path.abspath(blob_storage)):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                break
+            directory = os.path.dirname(directory)
+
+
+# 사용자 디렉터리에 남아있는 색인 도입 이전의 파일 목록
+def find_legacy_files():
+    for owner_id in sorted(os.listdir(image_storage)):
+        owner_storage: str = os.path.join(image_storage, owner_id)
+        if owner_id.startswith(".") or not os.path.isdir(owner_storage):
+            continue
+
+        for entry in sorted(os.scandir(owner_storage), key=lambda item: item.name):
+            if entry.is_file() and not entry.name.startswith("."):
+                yield owner_id, entry.name
+
+
+# 현재 저장공간 구조와 맞지 않는 Blob 목록
+def find_misplaced_blobs(batch_size: int):
+    last_sha256: str = ""
+    database_pre_session = index_instance.get_pre_session()
+
+    while True:
+        with database_pre_session() as session:
+            rows = session.query(BlobsTable.sha256, BlobsTable.path).filter(
+                BlobsTable.sha256 > last_sha256
+            ).order_by(BlobsTable.sha256).limit(batch_size).all()
+
+        if not rows:
+            return
+
+        for sha256, path in rows:
+            if is_blob_path(path) and not matches_layout(os.path.dirname(os.path.relpath(path, blob_directory)), sha256):
+                yield sha256, path
+
+        last_sha256 = rows[-1][0]
+
+
+# 저장공간 전체를 현재 구조로 옮기는 기능
+def migrate_storage(batch_size: int = 500, grace_period: float = default_grace_period, dry_run: bool = False) -> dict:
+    """
+    사용자 디렉터리의 파일과 구조가 다른 Blob을 일정 개수씩 옮기는 기능
+    :param batch_size: 한 번에 옮긴 후 이전 경로를 삭제할 파일 수
+    :param grace_period: 이전 경로를 삭제하기 전까지 기다리는 시간 (초)
+    :param dry_run: 실제로 옮기지 않고 대상 수만 확인
+    :return: 종류별로 옮긴 파일 수 dict
+    """
+    result: dict = {"legacy": 0, "relocated": 0}
+
+    previous_paths: list[str] = []
+    for owner_id, file_name in find_legacy_files():
+        if dry_run:
+            result["legacy"] += 1
+            continue
+
+        previous_path: str | None = migrate_legacy_file(owner_id, file_name)
+        if previous_path:
+            previous_paths.append(previous_path)
+            result["legacy"] += 1
+
+        if len(previous_paths) >= batch_size:
+            remove_previous_paths(previous_paths, grace_period)
+            previous_paths = []
+
+    remove_previous_paths(previous_paths, grace_period)
+
+    # S3 저장소는 디렉터리 구조가 성능에 영향을 주지 않으므로 Blob을 옮기지 않음
+    if storage_backend.remote:
+        logger.info("Skipped blob relocation for remote storage")
+        return result
+
+    moved: dict[str, str] = {}
+    for sha256, current_path in find_misplaced_blobs(batch_size):
+        if dry_run:
+            result["relocated"] += 1
+            continue
+
+        previous_path = relocate_blob(sha256, current_path)
+        if previous_path:
+            moved[sha256] = current_path
+            result["relocated"] += 1
+
+        if len(moved) >= batch_size:
+            time.sleep(grace_period)
+            sweep_blob_references(moved)
+            remove_previous_paths([os.path.join(image_storage, path) for path in moved.values()], 0)
+            moved = {}
+
+    if moved:
+        time.sleep(grace_period)
+        sweep_blob_references(moved)
+        remove_previous_paths([os.path.join(image_storage, path) for path in moved.values()], 0)
+
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Care-bot Image Provider storage migration")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--grace-period", type=float, default=default_grace_period)
+    parser.add_argument("--dry-run", action="store_true")
+    arguments = parser.parse_args()
+
+    logger.info(f"Migrated files: {migrate_storage(arguments.batch_size, arguments.grace_period, arguments.dry_run)}")
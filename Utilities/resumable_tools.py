@@ -0,0 +1,305 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Resumable Upload Tools
+"""
+
+# Libraries
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.exc import SQLAlchemyError
+
+from fastapi.concurrency import run_in_threadpool
+
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
+
+import fcntl
+import uuid
+import os
+from dotenv import load_dotenv
+
+from Utilities.logging_tools import *
+from Utilities.index_tools import IndexBase, index_instance
+from Utilities.upload_tools import UploadTooLarge, remove_quietly, upload_chunk_size
+
+logger = get_logger("Resumable")
+
+# 이어 올리기 설정 불러오기
+load_dotenv()
+image_storage: str = os.getenv("IMAGE_STORAGE")
+partial_storage: str = os.path.join(image_storage, ".partial")
+os.makedirs(partial_storage, exist_ok=True)
+resumable_upload_expire: int = int(os.getenv("RESUMABLE_UPLOAD_EXPIRE", 24 * 60 * 60))
+resumable_cleanup_interval: int = int(os.getenv("RESUMABLE_CLEANUP_INTERVAL", 10 * 60))
+
+
+class UploadsTable(IndexBase):
+    """
+    이어 올리기 중인 업로드 정보 (받은 크기는 임시 파일의 크기로 판단)
+    """
+    __tablename__ = "uploads"
+
+    upload_id = Column(String(32), primary_key=True, nullable=False)
+    owner_id = Column(String(16), nullable=False)
+    file_name = Column(String(255), nullable=False)
+    length = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return (f"" +
+                f"<Upload(upload_id='{self.upload_id}', " +
+                f"owner_id='{self.owner_id}', " +
+                f"file_name='{self.file_name}', " +
+                f"length='{self.length}', " +
+                f"created_at='{self.created_at}', " +
+                f"updated_at='{self.updated_at}')>"
+                )
+
+
+index_instance.create_tables([UploadsTable.__table__])
+
+
+class UploadOffsetMismatch(Exception):
+    """
+    클라이언트가 보낸 위치(Upload-Offset)가 서버가 받은 크기와 다른 경우 발생하는 예외
+    """
+    def __init__(self, offset: int):
+        super().__init__(f"Upload offset mismatch: {offset}")
+        self.offset = offset
+
+
+class UploadLocked(Exception):
+    """
+    같은 업로드에 다른 요청이 기록 중인 경우 발생하는 예외
+    """
+    pass
+
+
+# 업로드 정보를 dict로 변환하는 기능
+def serialize_upload_session(upload_data: UploadsTable) -> dict:
+    return {
+        "upload_id": upload_data.upload_id,
+        "owner_id": upload_data.owner_id,
+        "file_name": upload_data.file_name,
+        "length": upload_data.length,
+        "created_at": upload_data.created_at,
+        "updated_at": upload_data.updated_at
+    }
+
+
+# 업로드 임시 파일 경로
+def get_partial_path(upload_id: str) -> str:
+    return os.path.join(partial_storage, f"{upload_id}.part")
+
+
+# 이어 올리기 업로드를 만드는 기능
+def create_upload_session(owner_id: str, file_name: str, length: int) -> dict:
+    """
+    이어 올리기 업로드 정보와 빈 임시 파일을 만드는 기능
+    :param owner_id: 업로드하는 사용자의 ID
+    :param file_name: 업로드할 파일의 이름
+    :param length: 업로드할 전체 크기
+    :return: 업로드 정보 dict (실패하면 빈 dict)
+    """
+    result: dict = {}
+    current_datatime = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    upload_data = UploadsTable(
+        upload_id=uuid.uuid4().hex,
+        owner_id=owner_id,
+        file_name=file_name,
+        length=length,
+        created_at=current_datatime,
+        updated_at=current_datatime
+    )
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            open(get_partial_path(upload_data.upload_id), "xb").close()
+            session.add(upload_data)
+            session.commit()
+            result = serialize_upload_session(upload_data)
+        except (SQLAlchemyError, OSError) as error:
+            session.rollback()
+            remove_quietly(get_partial_path(upload_data.upload_id))
+            logger.error(f"Error creating upload session: {str(error)}")
+            result = {}
+        finally:
+            return result
+
+
+# 이어 올리기 업로드 정보를 불러오는 기능
+def get_upload_session(upload_id: str, owner_id: str) -> dict:
+    """
+    업로드 정보와 현재까지 받은 크기를 불러오는 기능 (다른 사용자의 업로드는 없는 것으로 처리)
+    :param upload_id: 업로드 ID
+    :param owner_id: 요청한 사용자의 ID
+    :return: 업로드 정보 dict (offset 포함, 없으면 빈 dict)
+    """
+    result: dict = {}
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            upload_data = session.query(UploadsTable).filter(
+                UploadsTable.upload_id == upload_id,
+                UploadsTable.owner_id == owner_id
+            ).first()
+
+            if upload_data is not None:
+                result = serialize_upload_session(upload_data)
+                result["offset"] = os.path.getsize(get_partial_path(upload_id))
+        except (SQLAlchemyError, OSError) as error:
+            session.rollback()
+            logger.error(f"Error getting upload session: {str(error)}")
+            result = {}
+        finally:
+            return result
+
+
+# 이어 올리기 업로드 정보를 삭제하는 기능
+def delete_upload_session(upload_id: str) -> bool:
+    result: bool = False
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            session.query(UploadsTable).filter(UploadsTable.upload_id == upload_id).delete()
+            session.commit()
+            remove_quietly(get_partial_path(upload_id))
+            result = True
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error deleting upload session: {str(error)}")
+            result = False
+        finally:
+            return result
+
+
+# 업로드의 마지막 기록 시각을 갱신하는 기능
+def touch_upload_session(upload_id: str) -> None:
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            session.query(UploadsTable).filter(UploadsTable.upload_id == upload_id).update({
+                UploadsTable.updated_at: datetime.now(tz=timezone.utc).replace(tzinfo=None)
+            }, synchronize_session=False)
+            session.commit()
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error touching upload session: {str(error)}")
+
+
+# 다른 요청(다른 Worker 포함)이 동시에 기록하지 못하도록 임시 파일을 잠그고 여는 기능
+def open_partial_file(upload_id: str):
+    buffer = os.fdopen(os.open(get_partial_path(upload_id), os.O_WRONLY | os.O_APPEND), "ab")
+
+    try:
+        fcntl.flock(buffer.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        buffer.close()
+        raise UploadLocked(upload_id)
+
+    return buffer
+
+
+# 임시 파일의 잠금을 풀고 닫는 기능
+def close_partial_file(buffer) -> None:
+    try:
+        buffer.flush()
+        fcntl.flock(buffer.fileno(), fcntl.LOCK_UN)
+    finally:
+        buffer.close()
+
+
+# 업로드 조각을 임시 파일 끝에 이어서 기록하는 기능
+async def append_upload_chunk(upload_data: dict, offset: int, stream: AsyncIterator[bytes]) -> int:
+    """
+    요청 본문을 고정 크기 단위로 임시 파일 끝에 기록하는 기능
+    연결이 중간에 끊어져도 그때까지 받은 데이터는 유지되어 다음 요청에서 이어서 올릴 수 있음
+    :param upload_data: 업로드 정보
+    :param offset: 클라이언트가 알고 있는 현재 위치 (Upload-Offset)
+    :param stream: 요청 본문
+    :return: 기록 후 위치 int
+    """
+    buffer = await run_in_threadpool(open_partial_file, upload_data["upload_id"])
+
+    try:
+        current_offset: int = os.fstat(buffer.fileno()).st_size
+        if current_offset != offset:
+            raise UploadOffsetMismatch(current_offset)
+
+        pending = bytearray()
+        try:
+            async for chunk in stream:
+                if current_offset + len(pending) + len(chunk) > upload_data["length"]:
+                    raise UploadTooLarge(current_offset + len(pending) + len(chunk))
+
+                pending.extend(chunk)
+                if len(pending) >= upload_chunk_size:
+                    await run_in_threadpool(buffer.write, bytes(pending))
+                    current_offset += len(pending)
+                    pending.clear()
+        finally:
+            # 연결이 끊어지거나 크기를 넘은 경우에도 그때까지 받은 데이터는 기록
+            if pending:
+                await run_in_threadpool(buffer.write, bytes(pending))
+                current_offset += len(pending)
+
+        return current_offset
+    finally:
+        await run_in_threadpool(close_partial_file, buffer)
+        await run_in_threadpool(touch_upload_session, upload_data["upload_id"])
+
+
+# 오래된 이어 올리기 업로드를 정리하는 기능
+def cleanup_stale_uploads(expire_time: int = resumable_upload_expire) -> int:
+    """
+    마지막 기록 이후 일정 시간이 지난 업로드와 정보가 없는 임시 파일을 삭제하는 기능
+    :param expire_time: 업로드를 유지하는 시간 (초)
+    :return: 삭제한 업로드 수 int
+    """
+    expired_before = datetime.now(tz=timezone.utc).replace(tzinfo=None) - timedelta(seconds=expire_time)
+    removed: int = 0
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            upload_ids: list[str] = [data[0] for data in session.query(UploadsTable.upload_id).filter(
+                UploadsTable.updated_at < expired_before
+            ).all()]
+            known_ids: set[str] = {data[0] for data in session.query(UploadsTable.upload_id).all()}
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error loading stale uploads: {str(error)}")
+            return 0
+
+    for upload_id in upload_ids:
+        if delete_upload_session(upload_id):
+            removed += 1
+
+    # 정보 없이 남아있는 임시 파일 정리 (만든 직후의 파일은 유지)
+    expired_timestamp: float = expired_before.replace(tzinfo=timezone.utc).timestamp()
+    for entry in os.scandir(partial_storage):
+        try:
+            if entry.name.removesuffix(".part") not in known_ids and entry.stat().st_mtime < expired_timestamp:
+                remove_quietly(entry.path)
+        except OSError:
+            continue
+
+    return removed
+
+
+# ========== Event Loop를 막지 않는 이어 올리기 기능 ==========
+async def async_create_upload_session(owner_id: str, file_name: str, length: int) -> dict:
+    return await run_in_threadpool(create_upload_session, owner_id, file_name, length)
+
+
+async def async_get_upload_session(upload_id: str, owner_id: str) -> dict:
+    return await run_in_threadpool(get_upload_session, upload_id, owner_id)
+
+
+async def async_delete_upload_session(upload_id: str) -> bool:
+    return await run_in_threadpool(delete_upload_session, upload_id)
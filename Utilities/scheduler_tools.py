@@ -0,0 +1,163 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Scheduler Tools
+"""
+
+# Libraries
+from fastapi.concurrency import run_in_threadpool
+
+from typing import Callable
+
+import asyncio
+import fcntl
+import inspect
+import random
+import time
+import os
+
+from Utilities.logging_tools import *
+
+logger = get_logger("Scheduler")
+
+
+class ScheduledJob:
+    """
+    주기적으로 실행할 작업과 실행 기록
+    """
+    def __init__(self, name: str, function: Callable, interval: float, jitter: float, leader_only: bool):
+        self.name = name
+        self.function = function
+        self.interval = interval
+        self.jitter = jitter  # 여러 Worker의 실행 시점이 겹치지 않도록 주기를 ±비율만큼 흔듦
+        self.leader_only = leader_only  # Leader Worker 하나에서만 실행할지 여부
+        self.task: asyncio.Task | None = None
+
+        # 실행 기록
+        self.runs: int = 0
+        self.failures: int = 0
+        self.skipped: int = 0
+        self.last_duration: float = 0.0
+        self.total_duration: float = 0.0
+        self.max_duration: float = 0.0
+        self.last_run_at: float | None = None
+        self.last_result = None
+        self.last_error: str | None = None
+
+    # 작업 실행 기록을 dict로 변환하는 기능
+    def stats(self) -> dict:
+        return {
+            "interval": self.interval,
+            "leader_only": self.leader_only,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "last_duration": self.last_duration,
+            "average_duration": self.total_duration / self.runs if self.runs else 0.0,
+            "max_duration": self.max_duration,
+            "last_run_at": self.last_run_at,
+            "last_result": self.last_result,
+            "last_error": self.last_error
+        }
+
+
+class Scheduler:
+    """
+    주기적인 유지보수 작업을 실행하는 Scheduler
+    여러 Worker가 실행되는 경우 파일 잠금을 먼저 얻은 Worker가 Leader가 되어 leader_only 작업을 실행하며,
+    Leader가 종료되면 잠금이 풀려 다른 Worker가 이어받음
+    """
+    def __init__(self, lock_path: str):
+        self.lock_path = lock_path
+        self.lock_file = None
+        self.jobs: dict[str, ScheduledJob] = {}
+
+    # 작업을 등록하는 기능
+    def add_job(self, name: str, function: Callable, interval: float, jitter: float = 0.1,
+                leader_only: bool = True) -> None:
+        """
+        주기적으로 실행할 작업을 등록하는 기능 (start 이전에 호출)
+        :param name: 작업 이름
+        :param function: 실행할 함수 (일반 함수는 Thread Pool에서 실행)
+        :param interval: 실행 주기 (초, 0 이하이면 등록하지 않음)
+        :param jitter: 실행 주기를 흔드는 비율
+        :param leader_only: Leader Worker 하나에서만 실행할지 여부
+        :return: None
+        """
+        if interval <= 0:
+            return
+
+        self.jobs[name] = ScheduledJob(name, function, interval, jitter, leader_only)
+
+    # 현재 Worker가 Leader인지 확인하는 기능 (아니면 Leader가 되기를 시도)
+    def is_leader(self) -> bool:
+        if self.lock_file is not None:
+            return True
+
+        lock_file = open(self.lock_path, "a")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+
+        self.lock_file = lock_file
+        logger.info(f"Scheduler leader elected: {os.getpid()}")
+        return True
+
+    # 작업을 한 번 실행하는 기능
+    async def run_job(self, job: ScheduledJob) -> None:
+        if job.leader_only and not self.is_leader():
+            job.skipped += 1
+            return
+
+        started: float = time.perf_counter()
+        try:
+            if inspect.iscoroutinefunction(job.function):
+                job.last_result = await job.function()
+            else:
+                job.last_result = await run_in_threadpool(job.function)
+            job.last_error = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            job.failures += 1
+            job.last_error = str(error)
+            logger.error(f"Scheduled job failed: {job.name} ({str(error)})")
+        finally:
+            job.last_duration = time.perf_counter() - started
+            job.total_duration += job.last_duration
+            job.max_duration = max(job.max_duration, job.last_duration)
+            job.last_run_at = time.time()
+            job.runs += 1
+
+    # 작업을 주기적으로 실행하는 기능
+    async def run_forever(self, job: ScheduledJob) -> None:
+        while True:
+            await asyncio.sleep(job.interval * (1 + random.uniform(-job.jitter, job.jitter)))
+            await self.run_job(job)
+
+    # 등록된 모든 작업을 시작하는 기능
+    def start(self) -> None:
+        for job in self.jobs.values():
+            job.task = asyncio.create_task(self.run_forever(job), name=f"scheduler:{job.name}")
+
+    # 모든 작업을 멈추고 Leader 잠금을 푸는 기능
+    async def stop(self) -> None:
+        tasks: list[asyncio.Task] = [job.task for job in self.jobs.values() if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.lock_file is not None:
+            fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_UN)
+            self.lock_file.close()
+            self.lock_file = None
+
+    # 작업별 실행 기록을 불러오는 기능
+    def stats(self) -> dict:
+        return {
+            "leader": self.lock_file is not None,
+            "jobs": {name: job.stats() for name, job in self.jobs.items()}
+        }
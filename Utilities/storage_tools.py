@@ -0,0 +1,384 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Storage Backend Tools
+
+원본 이미지(Blob)를 저장하는 위치를 바꿀 수 있도록 하는 도구
+- local: IMAGE_STORAGE 디렉터리에 그대로 저장 (기존 동작)
+- s3: S3 호환 저장소(AWS S3, MinIO 등)에 저장하고, IMAGE_STORAGE는 Host별 로컬 사본(Cache)으로 사용
+  여러 Host에서 같은 이미지를 제공할 수 있으며, 파생 이미지와 이어받기 업로드 조각은 Host별로 유지됨
+  색인은 기본적으로 Host별 파일(IMAGE_STORAGE/.index.sqlite3)이므로 IMAGE_INDEX_URL을 공유 DB(MariaDB)로 설정해야 함
+키는 저장공간 기준 상대 경로(.blobs/ab/cd/abcd...)이며, Blob 테이블의 path와 같음
+"""
+
+# Libraries
+from fastapi.concurrency import run_in_threadpool
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Iterator
+
+import threading
+import tempfile
+import time
+import os
+from dotenv import load_dotenv
+
+from Utilities.logging_tools import *
+from Utilities.upload_tools import remove_quietly, temp_prefix, temp_suffix, upload_chunk_size
+
+logger = get_logger("Storage")
+
+# 저장공간 설정 불러오기
+load_dotenv()
+image_storage: str = os.getenv("IMAGE_STORAGE")
+storage_backend_type: str = os.getenv("STORAGE_BACKEND", "local").lower()
+s3_bucket: str = os.getenv("S3_BUCKET", "")
+s3_endpoint_url: str | None = os.getenv("S3_ENDPOINT_URL") or None
+s3_region: str | None = os.getenv("S3_REGION") or None
+s3_access_key: str | None = os.getenv("S3_ACCESS_KEY_ID") or None
+s3_secret_key: str | None = os.getenv("S3_SECRET_ACCESS_KEY") or None
+s3_prefix: str = os.getenv("S3_PREFIX", "")
+s3_max_connections: int = int(os.getenv("S3_MAX_CONNECTIONS", 32))
+s3_multipart_threshold: int = int(os.getenv("S3_MULTIPART_THRESHOLD", 8)) * 1024 * 1024
+s3_multipart_chunk_size: int = int(os.getenv("S3_MULTIPART_CHUNK_SIZE", 8)) * 1024 * 1024
+storage_cache_max_age: int = int(os.getenv("STORAGE_CACHE_MAX_AGE", 7 * 24 * 60 * 60))
+storage_cache_cleanup_interval: int = int(os.getenv("STORAGE_CACHE_CLEANUP_INTERVAL", 60 * 60))
+
+
+class StorageBackend(ABC):
+    """
+    저장공간 공통 기능
+    동기 기능은 Thread Pool(스케줄러, Process Pool 작업 등)에서 사용하고, 요청 처리에서는 async_* 기능을 사용함
+    """
+    remote: bool = False  # 로컬 사본이 원본이 아닌지 여부 (사본을 정리해도 되는지)
+
+    def __init__(self, root: str):
+        """
+        :param root: 로컬 저장공간 (또는 로컬 사본) 경로
+        """
+        self.root = root
+
+    # 키에 해당하는 로컬 경로 (파일이 있는지는 확인하지 않음)
+    def local_path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    @abstractmethod
+    def put_file(self, source_path: str, key: str) -> None:
+        """
+        기록이 끝난 파일을 저장하는 기능 (원본 파일은 옮겨지거나 로컬 사본이 됨)
+        :param source_path: 저장공간과 같은 파일 시스템에 있는 파일 경로
+        :param key: 저장공간 기준 상대 경로
+        :return: None
+        """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        """
+        저장된 파일을 읽는 기능
+        :param key: 저장공간 기준 상대 경로
+        :return: 파일 데이터 bytes (없으면 FileNotFoundError 발생)
+        """
+
+    # 저장된 파일의 크기 (없으면 None)
+    @abstractmethod
+    def stat(self, key: str) -> int | None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def iter_chunks(self, key: str, chunk_size: int = upload_chunk_size) -> Iterator[bytes]: ...
+
+    @abstractmethod
+    def localize(self, key: str) -> str:
+        """
+        파일을 로컬 경로에서 읽을 수 있도록 준비하는 기능 (FileResponse, 크기 변환, 압축 파일 등)
+        :param key: 저장공간 기준 상대 경로
+        :return: 로컬 파일 경로 str (없으면 FileNotFoundError 발생)
+        """
+
+    def prune_local_copies(self, directory: str, max_age: int) -> int:
+        return 0
+
+    # ========== Event Loop를 막지 않는 저장공간 기능 ==========
+    async def async_put_file(self, source_path: str, key: str) -> None:
+        await run_in_threadpool(self.put_file, source_path, key)
+
+    async def async_get(self, key: str) -> bytes:
+        return await run_in_threadpool(self.get, key)
+
+    async def async_stat(self, key: str) -> int | None:
+        return await run_in_threadpool(self.stat, key)
+
+    async def async_delete(self, key: str) -> None:
+        await run_in_threadpool(self.delete, key)
+
+    async def async_localize(self, key: str) -> str:
+        return await run_in_threadpool(self.localize, key)
+
+    async def stream(self, key: str, chunk_size: int = upload_chunk_size) -> AsyncIterator[bytes]:
+        """
+        파일을 조각 단위로 읽어 전달하는 기능 (읽기는 Thread Pool에서 실행)
+        :param key: 저장공간 기준 상대 경로
+        :param chunk_size: 조각 크기
+        :return: 파일 데이터 조각 AsyncIterator[bytes]
+        """
+        iterator: Iterator[bytes] = await run_in_threadpool(self.iter_chunks, key, chunk_size)
+        try:
+            while chunk := await run_in_threadpool(next, iterator, b""):
+                yield chunk
+        finally:
+            await run_in_threadpool(iterator.close)
+
+
+class LocalStorage(StorageBackend):
+    """
+    IMAGE_STORAGE 디렉터리에 저장하는 기능 (하나의 Host 또는 공유 Volume)
+    """
+    def put_file(self, source_path: str, key: str) -> None:
+        file_path: str = self.local_path(key)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        os.replace(source_path, file_path)
+
+    def get(self, key: str) -> bytes:
+        with open(self.local_path(key), "rb") as buffer:
+            return buffer.read()
+
+    def stat(self, key: str) -> int | None:
+        try:
+            return os.stat(self.local_path(key)).st_size
+        except FileNotFoundError:
+            return None
+
+    def delete(self, key: str) -> None:
+        remove_quietly(self.local_path(key))
+
+    def iter_chunks(self, key: str, chunk_size: int = upload_chunk_size) -> Iterator[bytes]:
+        with open(self.local_path(key), "rb") as buffer:
+            while chunk := buffer.read(chunk_size):
+                yield chunk
+
+    def localize(self, key: str) -> str:
+        return self.local_path(key)
+
+    # 경로 계산만 하므로 Thread Pool을 거치지 않음
+    async def async_localize(self, key: str) -> str:
+        return self.local_path(key)
+
+
+class S3Storage(StorageBackend):
+    """
+    S3 호환 저장소에 저장하는 기능
+    저장한 파일은 로컬 사본으로 남기고(Write-through), 다른 Host에서 저장한 파일은 처음 읽을 때 내려받아 사본을 만듦
+    Client는 Connection Pool(S3_MAX_CONNECTIONS)을 모든 Thread가 함께 사용하며, 큰 파일은 Multipart로 올림
+    """
+    remote = True
+
+    def __init__(self, root: str, bucket: str, endpoint_url: str | None = None, region: str | None = None,
+                 access_key: str | None = None, secret_key: str | None = None, prefix: str = "",
+                 max_connections: int = s3_max_connections, multipart_threshold: int = s3_multipart_threshold,
+                 multipart_chunk_size: int = s3_multipart_chunk_size):
+        """
+        :param root: 로컬 사본을 저장할 경로
+        :param bucket: Bucket 이름
+        :param endpoint_url: S3 호환 저장소 주소 (AWS S3이면 None)
+        :param region: Region 이름
+        :param access_key: Access Key ID (None이면 boto3 기본 인증 정보 사용)
+        :param secret_key: Secret Access Key
+        :param prefix: 모든 키 앞에 붙일 경로
+        :param max_connections: Connection Pool 크기
+        :param multipart_threshold: Multipart Upload를 사용하는 최소 크기 (bytes)
+        :param multipart_chunk_size: Multipart Upload의 조각 크기 (bytes)
+        """
+        super().__init__(root)
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url
+        self.region = region
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.prefix = prefix.strip("/")
+        self.max_connections = max_connections
+        self.multipart_threshold = multipart_threshold
+        self.multipart_chunk_size = multipart_chunk_size
+        self.client_lock = threading.Lock()
+        self.client = None
+        self.transfer_config = None
+
+    # 처음 사용할 때 Client를 만드는 기능 (boto3는 S3를 사용하는 경우에만 필요)
+    def get_client(self):
+        if self.client is not None:
+            return self.client
+
+        with self.client_lock:
+            if self.client is None:
+                import boto3
+                from boto3.s3.transfer import TransferConfig
+                from botocore.config import Config
+
+                self.transfer_config = TransferConfig(
+                    multipart_threshold=self.multipart_threshold,
+                    multipart_chunksize=self.multipart_chunk_size
+                )
+                self.client = boto3.session.Session().client(
+                    "s3",
+                    endpoint_url=self.endpoint_url,
+                    region_name=self.region,
+                    aws_access_key_id=self.access_key,
+                    aws_secret_access_key=self.secret_key,
+                    config=Config(
+                        max_pool_connections=self.max_connections,
+                        retries={"max_attempts": 3, "mode": "standard"},
+                        s3={"addressing_style": "path" if self.endpoint_url else "auto"}
+                    )
+                )
+
+        return self.client
+
+    # 저장공간 기준 상대 경로를 Object Key로 바꾸는 기능
+    def object_key(self, key: str) -> str:
+        object_key: str = key.replace(os.sep, "/")
+        return f"{self.prefix}/{object_key}" if self.prefix else object_key
+
+    # Object가 없는 경우의 오류인지 확인하는 기능
+    @staticmethod
+    def is_not_found(error: Exception) -> bool:
+        response: dict = getattr(error, "response", None) or {}
+        return response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+    # 로컬 사본의 사용 시각을 갱신하는 기능 (없으면 False)
+    @staticmethod
+    def touch(file_path: str) -> bool:
+        try:
+            os.utime(file_path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def put_file(self, source_path: str, key: str) -> None:
+        client = self.get_client()
+        client.upload_file(source_path, self.bucket, self.object_key(key), Config=self.transfer_config)
+
+        file_path: str = self.local_path(key)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        os.replace(source_path, file_path)
+
+    def get(self, key: str) -> bytes:
+        file_path: str = self.local_path(key)
+        if self.touch(file_path):
+            with open(file_path, "rb") as buffer:
+                return buffer.read()
+
+        try:
+            response: dict = self.get_client().get_object(Bucket=self.bucket, Key=self.object_key(key))
+        except Exception as error:
+            if self.is_not_found(error):
+                raise FileNotFoundError(key) from error
+            raise
+
+        with response["Body"] as body:
+            return body.read()
+
+    def stat(self, key: str) -> int | None:
+        try:
+            response: dict = self.get_client().head_object(Bucket=self.bucket, Key=self.object_key(key))
+        except Exception as error:
+            if self.is_not_found(error):
+                return None
+            raise
+
+        return response["ContentLength"]
+
+    def delete(self, key: str) -> None:
+        self.get_client().delete_object(Bucket=self.bucket, Key=self.object_key(key))
+        remove_quietly(self.local_path(key))
+
+    def iter_chunks(self, key: str, chunk_size: int = upload_chunk_size) -> Iterator[bytes]:
+        try:
+            response: dict = self.get_client().get_object(Bucket=self.bucket, Key=self.object_key(key))
+        except Exception as error:
+            if self.is_not_found(error):
+                raise FileNotFoundError(key) from error
+            raise
+
+        with response["Body"] as body:
+            yield from body.iter_chunks(chunk_size)
+
+    def localize(self, key: str) -> str:
+        file_path: str = self.local_path(key)
+        if self.touch(file_path):
+            return file_path
+
+        # 임시 파일에 내려받은 후 옮겨서 다른 요청이 내려받는 도중의 파일을 읽지 않도록 함
+        # (임시 파일은 오래된 임시 파일 정리 대상인 최상위 디렉터리(.blobs 등)에 만듦)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=self.local_path(key.split(os.sep, 1)[0]), prefix=temp_prefix, suffix=temp_suffix
+        )
+        os.close(descriptor)
+
+        try:
+            self.get_client().download_file(
+                self.bucket, self.object_key(key), temp_path, Config=self.transfer_config
+            )
+            os.replace(temp_path, file_path)
+        except Exception as error:
+            remove_quietly(temp_path)
+            if self.is_not_found(error):
+                raise FileNotFoundError(key) from error
+            raise
+
+        return file_path
+
+    def prune_local_copies(self, directory: str, max_age: int) -> int:
+        """
+        오랫동안 읽지 않은 로컬 사본을 삭제하는 기능 (원본은 저장소에 남아 있으므로 다시 내려받을 수 있음)
+        :param directory: 로컬 사본이 있는 디렉터리
+        :param max_age: 마지막으로 읽은 후 유지할 시간 (초)
+        :return: 삭제한 파일 수 int
+        """
+        expired_before: float = time.time() - max_age
+        removed: int = 0
+
+        for root, _, file_names in os.walk(directory):
+            for file_name in file_names:
+                if file_name.startswith(temp_prefix):
+                    continue
+
+                file_path: str = os.path.join(root, file_name)
+                try:
+                    if os.stat(file_path).st_mtime < expired_before:
+                        os.remove(file_path)
+                        removed += 1
+                except FileNotFoundError:
+                    continue
+                except OSError as error:
+                    logger.error(f"Local copy removal failed: {str(error)}")
+
+        return removed
+
+
+# 설정에 맞는 저장공간을 만드는 기능
+def create_storage_backend() -> StorageBackend:
+    if storage_backend_type == "local":
+        return LocalStorage(image_storage)
+
+    if storage_backend_type == "s3":
+        if not s3_bucket:
+            raise ValueError("S3_BUCKET is required when STORAGE_BACKEND=s3")
+        if not os.getenv("IMAGE_INDEX_URL"):
+            logger.warning("IMAGE_INDEX_URL is not set: the image index is local to this host (IMAGE_STORAGE/.index.sqlite3)")
+
+        return S3Storage(
+            image_storage, s3_bucket,
+            endpoint_url=s3_endpoint_url,
+            region=s3_region,
+            access_key=s3_access_key,
+            secret_key=s3_secret_key,
+            prefix=s3_prefix
+        )
+
+    raise ValueError(f"Unknown STORAGE_BACKEND: {storage_backend_type}")
+
+
+storage_backend: StorageBackend = create_storage_backend()
@@ -0,0 +1,152 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Upload Tools
+"""
+
+# Libraries
+from fastapi import UploadFile, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+
+from typing import Callable
+
+import hashlib
+import os
+import tempfile
+from dotenv import load_dotenv
+
+from Utilities.logging_tools import *
+
+logger = get_logger("Upload")
+
+# 업로드 단위 크기 불러오기
+load_dotenv()
+upload_chunk_size: int = int(os.getenv("UPLOAD_CHUNK_SIZE", 256 * 1024))
+multipart_overhead: int = 64 * 1024  # Multipart 경계, 파일별 Header 등 파일 내용 외의 본문 크기 허용치
+temp_prefix: str = ".upload_"
+temp_suffix: str = ".tmp"
+
+
+class UploadTooLarge(Exception):
+    """
+    업로드 중 허용된 최대 크기를 넘어선 경우 발생하는 예외
+    """
+    def __init__(self, size: int):
+        super().__init__(f"Upload exceeded the limit: {size} bytes")
+        self.size = size
+
+
+# 임시 파일을 조용히 삭제하는 기능
+def remove_quietly(file_path: str) -> None:
+    """
+    파일이 존재하는 경우에만 삭제하고, 오류는 기록만 하는 기능
+    :param file_path: 삭제할 파일 경로
+    :return: None
+    """
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+    except OSError as error:
+        logger.error(f"Temporary file removal failed: {str(error)}")
+
+
+# 업로드 크기 제한을 넘은 경우의 응답 내용
+def make_too_large_detail(limit: int, size: int) -> dict:
+    return {
+        "type": "too large",
+        "message": f"Image size exceeds the limit({limit // 1024 // 1024}MB max).",
+        "input": {
+            "file_size": f"{size // 1024 // 1024}MB"
+        }
+    }
+
+
+class UploadSizeMiddleware:
+    """
+    업로드 요청 본문의 크기를 받는 도중에 검사하는 ASGI Middleware
+    UploadFile은 본문 전체를 받아 임시 파일로 저장한 후 Route에 전달되므로, Route에서 검사하면 한도를 넘는 본문도 모두 받게 됨
+    Content-Length가 한도를 넘으면 본문을 받기 전에, Content-Length가 없으면(chunked) 받은 크기가 한도를 넘는 순간 413으로 응답함
+    """
+    def __init__(self, app, limiter: Callable[[dict], int | None]):
+        """
+        :param app: ASGI Application
+        :param limiter: 요청 본문의 최대 크기를 정하는 함수 (scope를 받고, 제한하지 않으면 None 반환)
+        """
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope, receive, send):
+        limit: int | None = self.limiter(scope) if scope["type"] == "http" else None
+        if limit is None:
+            return await self.app(scope, receive, send)
+
+        content_length: bytes | None = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            logger.warning(f"Request body too large: {scope['method']} {scope['path']} ({int(content_length)} bytes)")
+            response = JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={"detail": make_too_large_detail(limit, int(content_length))}
+            )
+            return await response(scope, receive, send)
+
+        received: int = 0
+
+        # 받은 크기가 한도를 넘으면 본문 해석을 멈추고 413으로 응답 (FastAPI는 HTTPException을 그대로 응답으로 바꿈)
+        async def limited_receive() -> dict:
+            nonlocal received
+            message: dict = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    logger.warning(f"Request body too large: {scope['method']} {scope['path']} ({received}+ bytes)")
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=make_too_large_detail(limit, received)
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+# 조각을 파일에 쓰고 Hash에 반영하는 기능
+def write_chunk(buffer, digest, chunk: bytes) -> None:
+    buffer.write(chunk)
+    digest.update(chunk)
+
+
+# 업로드 파일을 고정 크기 단위로 임시 파일에 기록하는 기능
+async def stream_upload(file: UploadFile, directory: str, max_size: int, head: bytes = b"") -> tuple[str, int, str]:
+    """
+    업로드 된 파일을 고정 크기 단위로 읽어 임시 파일에 기록하고 SHA-256을 함께 계산하는 기능
+    디스크 쓰기는 Thread Pool에서 수행되어 Event Loop를 막지 않으며, 파일별 크기 제한은 기록하는 도중에 검사됨
+    (UploadFile은 요청 본문을 모두 받은 후 전달되므로, 받는 도중의 요청 전체 크기 제한은 UploadSizeMiddleware에서 검사)
+    :param file: 업로드 된 파일
+    :param directory: 임시 파일을 만들 경로 (최종 저장 경로와 같은 파일 시스템이어야 함)
+    :param max_size: 허용되는 최대 파일 크기 (Byte)
+    :param head: 형식 검사를 위해 미리 읽어둔 파일의 앞부분
+    :return: 임시 파일 경로, 전체 파일 크기, SHA-256 tuple[str, int, str]
+    """
+    descriptor, temp_path = await run_in_threadpool(
+        tempfile.mkstemp, dir=directory, prefix=temp_prefix, suffix=temp_suffix
+    )
+    total_size: int = 0
+    digest = hashlib.sha256()
+
+    try:
+        with os.fdopen(descriptor, "wb") as buffer:
+            chunk: bytes = head if head else await file.read(upload_chunk_size)
+            while chunk:
+                total_size += len(chunk)
+                if total_size > max_size:
+                    raise UploadTooLarge(total_size)
+
+                await run_in_threadpool(write_chunk, buffer, digest, chunk)
+                chunk = await file.read(upload_chunk_size)
+    except BaseException:
+        await run_in_threadpool(remove_quietly, temp_path)
+        raise
+
+    return temp_path, total_size, digest.hexdigest()
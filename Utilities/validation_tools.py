@@ -0,0 +1,132 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Image Validation Tools
+
+앞부분 형식 검사만으로는 걸러지지 않는 잘린 파일, 다른 파일이 붙은 파일, 픽셀 수가 지나치게 많은 파일을
+전체 디코딩으로 검사하고, 위치 정보(GPS EXIF) 등 메타데이터를 지운 파일로 다시 저장하는 도구
+디코딩과 저장은 Core 수만큼의 Process Pool에서 실행되어 Event Loop를 막지 않음
+"""
+
+# Libraries
+from sqlalchemy.exc import SQLAlchemyError
+
+from fastapi.concurrency import run_in_threadpool
+
+from enum import Enum
+
+import asyncio
+import tempfile
+import os
+from dotenv import load_dotenv
+
+from Utilities.logging_tools import *
+from Utilities.upload_tools import remove_quietly, temp_prefix, temp_suffix
+from Utilities.image_tools import get_process_pool, sanitize_image
+from Utilities.index_tools import ImagesTable, index_instance
+from Utilities.blob_tools import blob_storage
+from Utilities.metrics_tools import stage_histogram, stage_timer
+
+logger = get_logger("Validation")
+
+
+class ValidationMode(str, Enum):
+    OFF = "off"  # 앞부분 형식 검사만 수행
+    SYNC = "sync"  # 저장하기 전에 검사 (검사가 끝난 후 201 응답)
+    ASYNC = "async"  # 먼저 저장하고 201 응답 후 Background에서 검사 (실패하면 삭제)
+
+
+# 검사 설정 불러오기
+load_dotenv()
+image_validation: ValidationMode = ValidationMode(os.getenv("IMAGE_VALIDATION", "off").lower())
+max_image_pixels: int = int(os.getenv("MAX_IMAGE_PIXELS", 40_000_000))
+strip_image_metadata: bool = os.getenv("STRIP_IMAGE_METADATA", "true").lower() == "true"
+validation_recovery_interval: int = int(os.getenv("VALIDATION_RECOVERY_INTERVAL", 10 * 60))
+
+
+# 이미지를 검사하고 메타데이터 없이 다시 저장하는 기능
+async def validate_image_file(source_path: str, mime: str, remove_source: bool) -> dict:
+    """
+    Process Pool에서 이미지 전체를 디코딩하여 검사하고, 메타데이터를 지운 파일을 저장공간의 임시 파일로 만드는 기능
+    :param source_path: 검사할 이미지 경로
+    :param mime: 업로드 시 확인한 이미지 형식
+    :param remove_source: 다시 저장한 경우 원래 파일을 삭제할지 여부 (업로드 임시 파일인 경우)
+    :return: 검사를 통과한 파일의 path, size, sha256, width, height dict (통과하지 못하면 InvalidImage 발생)
+    """
+    descriptor, output_path = await run_in_threadpool(
+        tempfile.mkstemp, dir=blob_storage, prefix=temp_prefix, suffix=temp_suffix
+    )
+    os.close(descriptor)
+
+    try:
+        with stage_timer("validate"):
+            loop = asyncio.get_running_loop()
+            result: dict = await loop.run_in_executor(
+                get_process_pool(), sanitize_image,
+                source_path, output_path, mime, max_image_pixels, strip_image_metadata
+            )
+    except BaseException:
+        await run_in_threadpool(remove_quietly, output_path)
+        raise
+
+    stage_histogram.observe(("validate_decode",), result["decode_seconds"])
+    stage_histogram.observe(("validate_encode",), result["encode_seconds"])
+
+    if not result["rewritten"]:
+        await run_in_threadpool(remove_quietly, output_path)
+        output_path = source_path
+    elif remove_source:
+        await run_in_threadpool(remove_quietly, source_path)
+
+    return {
+        "path": output_path,
+        "size": result["size"],
+        "sha256": result["sha256"],
+        "width": result["width"],
+        "height": result["height"]
+    }
+
+
+# 검사 후 다시 저장된 내용으로 색인 정보를 바꾸는 기능
+def replace_image_content(owner_id: str, file_name: str, previous_sha256: str, image_data: dict) -> bool:
+    """
+    이미지가 아직 이전 내용을 가리키는 경우에만 경로, 크기, SHA-256, 가로/세로 크기, 변경 시각을 바꾸고 공개하는 기능
+    :param owner_id: 이미지 소유자의 ID
+    :param file_name: 이미지 파일명
+    :param previous_sha256: 검사 전 내용의 SHA-256
+    :param image_data: 바꿀 path, size, sha256, width, height, modified_at dict
+    :return: 바뀌었는지 여부 bool (그 사이 삭제된 경우 False)
+    """
+    result: bool = False
+    index_instance.cache.invalidate((owner_id, file_name))
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            updated: int = session.query(ImagesTable).filter(
+                ImagesTable.owner_id == owner_id,
+                ImagesTable.file_name == file_name,
+                ImagesTable.sha256 == previous_sha256
+            ).update({
+                ImagesTable.path: image_data["path"],
+                ImagesTable.size: image_data["size"],
+                ImagesTable.sha256: image_data["sha256"],
+                ImagesTable.width: image_data["width"],
+                ImagesTable.height: image_data["height"],
+                ImagesTable.modified_at: image_data["modified_at"],
+                ImagesTable.pending: False
+            }, synchronize_session=False)
+            session.commit()
+            result = updated > 0
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error replacing image content: {str(error)}")
+            result = False
+        finally:
+            return result
+
+
+async def async_replace_image_content(owner_id: str, file_name: str, previous_sha256: str,
+                                      image_data: dict) -> bool:
+    return await run_in_threadpool(replace_image_content, owner_id, file_name, previous_sha256, image_data)
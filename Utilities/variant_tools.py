@@ -0,0 +1,371 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Image Variant Tools
+"""
+
+# Libraries
+from sqlalchemy import Column, String, BigInteger, DateTime, func
+from sqlalchemy.exc import SQLAlchemyError
+
+from fastapi.concurrency import run_in_threadpool
+
+from datetime import datetime, timezone
+import asyncio
+import hashlib
+import os
+import tempfile
+from dotenv import load_dotenv
+
+from Utilities.logging_tools import *
+from Utilities.worker_tools import make_shared_cache
+from Utilities.index_tools import IndexBase, index_instance
+from Utilities.image_tools import get_process_pool, is_format_supported, transcode_image
+
+logger = get_logger("Variant")
+
+# 파생 이미지 Cache 설정 불러오기
+load_dotenv()
+image_storage: str = os.getenv("IMAGE_STORAGE")
+variant_storage: str = os.path.join(image_storage, ".variants")
+variant_cache_bytes: int = int(os.getenv("VARIANT_CACHE_SIZE", 1024)) * 1024 * 1024
+variant_touch_interval: int = int(os.getenv("VARIANT_TOUCH_INTERVAL", 60))
+variant_extensions: dict[str, str] = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/avif": ".avif"
+}
+os.makedirs(variant_storage, exist_ok=True)
+
+# 업로드 후 Background에서 만들 변환 형식 (비워두면 변환하지 않음)
+transcode_formats: list[str] = [
+    mime.strip() for mime in os.getenv("TRANSCODE_FORMATS", "image/webp,image/avif").split(",")
+    if mime.strip() and is_format_supported(mime.strip())
+]
+transcode_sources: tuple[str, ...] = ("image/jpeg", "image/png")
+
+# 같은 파생 이미지를 동시에 여러 번 만들지 않도록 진행 중인 작업을 공유
+pending_variants: dict[str, asyncio.Future] = {}
+
+
+class VariantsTable(IndexBase):
+    """
+    원본 이미지에서 만들어진 파생 이미지 정보
+    """
+    __tablename__ = "variants"
+
+    key = Column(String(64), primary_key=True, nullable=False)
+    source = Column(String(64), nullable=True, index=True)  # 원본 이미지의 SHA-256 (원본이 삭제되면 함께 삭제)
+    path = Column(String(512), nullable=False)
+    mime = Column(String(32), nullable=False)
+    size = Column(BigInteger, nullable=False)
+    last_access = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return (f"" +
+                f"<Variant(key='{self.key}', " +
+                f"source='{self.source}', " +
+                f"path='{self.path}', " +
+                f"mime='{self.mime}', " +
+                f"size='{self.size}', " +
+                f"last_access='{self.last_access}')>"
+                )
+
+
+index_instance.create_tables([VariantsTable.__table__])
+# 없는 경우도 저장하므로, 여러 Worker로 실행되는 경우 다른 Worker가 만든 파생 이미지를 알 수 있도록 공유 Cache 사용
+variant_cache = make_shared_cache("variant", 10000, variant_touch_interval)
+
+
+# 파생 이미지의 Cache 키를 만드는 기능
+def make_variant_key(source_hash: str, mime: str, *options) -> str:
+    """
+    원본 내용과 변환 옵션으로 파생 이미지의 Cache 키를 만드는 기능
+    :param source_hash: 원본 이미지의 SHA-256
+    :param mime: 파생 이미지의 형식
+    :param options: 변환 옵션
+    :return: 파생 이미지 키 str
+    """
+    return hashlib.sha256(":".join([source_hash, mime, *map(str, options)]).encode()).hexdigest()
+
+
+# 파생 이미지 정보를 불러오는 기능
+def get_variant_record(key: str) -> dict:
+    """
+    파생 이미지 정보를 불러오고, 오래 사용되지 않은 경우 최근 사용 시각을 갱신하는 기능
+    :param key: 파생 이미지 키
+    :return: 파생 이미지 정보 dict (없으면 빈 dict)
+    """
+    cached_data: dict = variant_cache.get(key)
+    if cached_data is not None:
+        return cached_data
+
+    result: dict = {}
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            variant_data = session.query(VariantsTable).filter(VariantsTable.key == key).first()
+
+            if variant_data is not None:
+                # 최근 사용 시각은 Cache 유효 시간마다 한 번만 갱신
+                variant_data.last_access = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+                session.commit()
+
+                result = {
+                    "key": variant_data.key,
+                    "path": variant_data.path,
+                    "mime": variant_data.mime,
+                    "size": variant_data.size
+                }
+
+            # 없는 경우도 Cache에 남겨서 매 요청마다 색인을 조회하지 않도록 함
+            variant_cache.set(key, result)
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error getting variant record: {str(error)}")
+            result = {}
+        finally:
+            return result
+
+
+# 파생 이미지를 저장하고 용량을 넘으면 오래된 파생 이미지를 정리하는 기능
+def save_variant(key: str, source_hash: str, mime: str, data: bytes) -> dict:
+    """
+    파생 이미지를 Cache 공간에 저장하고, 전체 용량이 제한을 넘으면 가장 오래 사용되지 않은 것부터 삭제하는 기능
+    :param key: 파생 이미지 키
+    :param source_hash: 원본 이미지의 SHA-256
+    :param mime: 파생 이미지 형식
+    :param data: 파생 이미지 데이터
+    :return: 저장된 파생 이미지 정보 dict (실패하면 빈 dict)
+    """
+    relative_path: str = os.path.join(key[:2], key + variant_extensions.get(mime, ""))
+    file_path: str = os.path.join(variant_storage, relative_path)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+    descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), prefix=".variant_", suffix=".tmp")
+    with os.fdopen(descriptor, "wb") as buffer:
+        buffer.write(data)
+    os.replace(temp_path, file_path)
+
+    result: dict = {"key": key, "path": relative_path, "mime": mime, "size": len(data)}
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            session.merge(VariantsTable(
+                **result,
+                source=source_hash,
+                last_access=datetime.now(tz=timezone.utc).replace(tzinfo=None)
+            ))
+            session.commit()
+
+            # 저장 전에 조회하여 남은 '없음' 항목을 모든 Worker에서 삭제한 후 저장
+            variant_cache.invalidate(key)
+            variant_cache.set(key, result)
+
+            # 전체 용량이 제한을 넘으면 가장 오래 사용되지 않은 파생 이미지부터 삭제
+            total_size: int = session.query(func.coalesce(func.sum(VariantsTable.size), 0)).scalar()
+            if total_size > variant_cache_bytes:
+                for variant_data in session.query(VariantsTable).order_by(VariantsTable.last_access.asc()):
+                    if total_size <= variant_cache_bytes or variant_data.key == key:
+                        break
+                    remove_variant_file(variant_data.path)
+                    variant_cache.invalidate(variant_data.key)
+                    session.delete(variant_data)
+                    total_size -= variant_data.size
+                session.commit()
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error saving variant record: {str(error)}")
+            result = {}
+        finally:
+            return result
+
+
+# 원본 이미지에서 만들어진 파생 이미지를 모두 삭제하는 기능
+def remove_source_variants(source_hash: str) -> int:
+    """
+    원본 이미지의 마지막 참조가 삭제된 경우 해당 원본의 파생 이미지 정보와 파일을 삭제하는 기능
+    :param source_hash: 원본 이미지의 SHA-256
+    :return: 삭제된 파생 이미지 수 int
+    """
+    removed_paths: list[str] = []
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            for variant_data in session.query(VariantsTable).filter(VariantsTable.source == source_hash):
+                removed_paths.append(variant_data.path)
+                variant_cache.invalidate(variant_data.key)
+                session.delete(variant_data)
+            session.commit()
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error removing variant records: {str(error)}")
+            return 0
+
+    # 정보가 삭제된 후에 파일을 삭제
+    for relative_path in removed_paths:
+        remove_variant_file(relative_path)
+
+    return len(removed_paths)
+
+
+# 파생 이미지 파일을 삭제하는 기능
+def remove_variant_file(relative_path: str) -> None:
+    try:
+        os.remove(os.path.join(variant_storage, relative_path))
+    except FileNotFoundError:
+        pass
+    except OSError as error:
+        logger.error(f"Variant removal failed: {str(error)}")
+
+
+# 파생 이미지의 전체 경로를 반환하는 기능
+def get_variant_path(variant_data: dict) -> str:
+    return os.path.join(variant_storage, variant_data["path"])
+
+
+# 파일을 읽는 기능
+def read_file(file_path: str) -> bytes:
+    with open(file_path, "rb") as buffer:
+        return buffer.read()
+
+
+# 파생 이미지를 불러오거나 새로 만드는 기능
+async def get_or_create_variant(key: str, source_hash: str, source_path: str, mime: str, function,
+                                *arguments) -> dict:
+    """
+    Cache에 저장된 파생 이미지를 불러오고, 없으면 Process Pool에서 새로 만들어 저장하는 기능
+    같은 키에 대한 요청이 동시에 들어오면 한 번만 만들고 결과를 공유함
+    :param key: 파생 이미지 키
+    :param source_hash: 원본 이미지의 SHA-256
+    :param source_path: 원본 이미지 경로
+    :param mime: 파생 이미지 형식
+    :param function: 원본 데이터를 받아 파생 이미지 데이터를 반환하는 기능 (Process Pool에서 실행)
+    :param arguments: function에 원본 데이터 다음으로 전달할 인자
+    :return: 파생 이미지 정보 dict (실패하면 빈 dict)
+    """
+    variant_data: dict = variant_cache.get(key)
+    if variant_data is None:
+        variant_data = await run_in_threadpool(get_variant_record, key)
+
+    if variant_data and await run_in_threadpool(os.path.isfile, get_variant_path(variant_data)):
+        return variant_data
+
+    if key in pending_variants:
+        return await asyncio.shield(pending_variants[key])
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future = loop.create_future()
+    pending_variants[key] = future
+    variant_data = {}
+
+    try:
+        source_data: bytes = await run_in_threadpool(read_file, source_path)
+        variant_bytes: bytes = await loop.run_in_executor(get_process_pool(), function, source_data, *arguments)
+        variant_data = await run_in_threadpool(save_variant, key, source_hash, mime, variant_bytes)
+        return variant_data
+    except Exception as error:
+        logger.error(f"Variant creation failed: {str(error)}")
+        return {}
+    finally:
+        # 만드는 요청이 취소되거나 BaseException으로 끝나도 기다리는 요청이 멈추지 않도록 결과를 정한 후 삭제
+        if not future.done():
+            future.set_result(variant_data)
+        del pending_variants[key]
+
+
+# 클라이언트가 받을 수 있는 형식을 Accept Header에서 읽는 기능
+def parse_accept(accept: str) -> set[str]:
+    """
+    Accept Header에서 q=0이 아닌 MIME 형식을 모두 읽는 기능
+    :param accept: Accept Header 값
+    :return: 받을 수 있는 MIME 형식 set[str]
+    """
+    accepted: set[str] = set()
+
+    for part in (accept or "").split(","):
+        media, *parameters = [value.strip() for value in part.split(";")]
+        quality: float = 1.0
+        for parameter in parameters:
+            if parameter.startswith("q="):
+                try:
+                    quality = float(parameter[2:])
+                except ValueError:
+                    quality = 0.0
+        if media and quality > 0:
+            accepted.add(media.lower())
+
+    return accepted
+
+
+# 업로드된 이미지의 변환 형식들을 미리 만드는 기능
+async def create_transcoded_variants(image_data: dict, source_path: str) -> None:
+    """
+    업로드된 이미지를 설정된 형식들로 변환하여 파생 이미지 Cache에 저장하는 기능 (Background Task)
+    :param image_data: 원본 이미지의 색인 정보
+    :param source_path: 원본 이미지 경로
+    :return: None
+    """
+    if image_data["mime"] not in transcode_sources:
+        return
+
+    for mime in transcode_formats:
+        if mime != image_data["mime"]:
+            key: str = make_variant_key(image_data["sha256"], mime, "transcode")
+            await get_or_create_variant(key, image_data["sha256"], source_path, mime, transcode_image, mime)
+
+
+# 클라이언트가 받을 수 있는 가장 작은 변환 형식을 고르는 기능
+async def select_transcoded_variant(image_data: dict, accept: str) -> dict:
+    """
+    이미 만들어진 변환 형식 중 클라이언트가 받을 수 있고 원본보다 작은 것 중 가장 작은 것을 고르는 기능
+    :param image_data: 원본 이미지의 색인 정보
+    :param accept: 클라이언트의 Accept Header 값
+    :return: 선택된 파생 이미지 정보 dict (원본이 가장 작으면 빈 dict)
+    """
+    accepted: set[str] = parse_accept(accept)
+    selected: dict = {}
+    selected_size: int = image_data["size"]
+
+    for mime in transcode_formats:
+        if mime not in accepted or mime == image_data["mime"]:
+            continue
+
+        key: str = make_variant_key(image_data["sha256"], mime, "transcode")
+        variant_data: dict = variant_cache.get(key)
+        if variant_data is None:
+            variant_data = await run_in_threadpool(get_variant_record, key)
+
+        if variant_data and variant_data["size"] < selected_size:
+            selected, selected_size = variant_data, variant_data["size"]
+
+    return selected
+
+
+# 파생 이미지 Cache 사용 현황 불러오기
+def get_variant_cache_stats() -> dict:
+    """
+    파생 이미지 Cache의 항목 수와 전체 용량을 불러오는 기능
+    :return: 파생 이미지 Cache 사용 현황 dict
+    """
+    result: dict = {"count": 0, "bytes": 0, "max_bytes": variant_cache_bytes}
+
+    database_pre_session = index_instance.get_pre_session()
+    with database_pre_session() as session:
+        try:
+            count, total_size = session.query(
+                func.count(VariantsTable.key),
+                func.coalesce(func.sum(VariantsTable.size), 0)
+            ).one()
+            result.update({"count": count, "bytes": total_size})
+        except SQLAlchemyError as error:
+            session.rollback()
+            logger.error(f"Error getting variant cache stats: {str(error)}")
+        finally:
+            return result
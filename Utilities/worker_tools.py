@@ -0,0 +1,169 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Server Worker Tools
+
+여러 Worker Process로 서버를 실행하기 위한 도구
+- Worker 수는 사용할 수 있는 Core 수(Container의 CPU 제한 포함)로 정하고 SERVER_WORKERS로 모든 Worker에 알림
+- DB Connection은 전체 한도(DB_CONNECTION_BUDGET)를 Worker 수로 나누어 Worker별 Pool 크기를 정함
+- 세션, 접근 권한, 이미지 색인 Cache는 모든 Worker가 함께 읽는 공유 메모리(/dev/shm) Cache를 둠
+- Worker별로만 두는 Cache(이미지 메모리 Cache)는 공유 무효화 기록으로 다른 Worker의 삭제를 알림
+
+사용 예시
+    python -m Utilities.worker_tools --host 0.0.0.0 --port 8000
+"""
+
+# Libraries
+from typing import Callable
+
+import argparse
+import math
+import shutil
+import tempfile
+import os
+from dotenv import load_dotenv
+
+from Utilities.logging_tools import *
+from Utilities.cache_tools import TTLCache, SharedTTLCache, InvalidationJournal
+
+logger = get_logger("Worker")
+
+
+# 사용할 수 있는 Core 수를 확인하는 기능
+def get_cpu_count() -> int:
+    """
+    Process가 사용할 수 있는 Core 수와 Container의 CPU 제한(cgroup) 중 작은 값을 확인하는 기능
+    :return: Core 수 int
+    """
+    try:
+        count: int = len(os.sched_getaffinity(0))
+    except AttributeError:
+        count = os.cpu_count() or 1
+
+    # cgroup v2 (cpu.max: "<quota> <period>"), cgroup v1 (cpu.cfs_quota_us, cpu.cfs_period_us)
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as buffer:
+            quota, period = buffer.read().split()
+    except (OSError, ValueError):
+        try:
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as quota_buffer, \
+                    open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as period_buffer:
+                quota, period = quota_buffer.read().strip(), period_buffer.read().strip()
+        except (OSError, ValueError):
+            return count
+
+    if quota not in ("max", "-1") and int(period) > 0:
+        count = min(count, max(math.ceil(int(quota) / int(period)), 1))
+
+    return count
+
+
+# Worker 설정 불러오기 (SERVER_WORKERS는 실행 도구가 설정하며, uvicorn으로 직접 실행하면 1)
+load_dotenv()
+server_workers: int = max(int(os.getenv("SERVER_WORKERS", 1)), 1)
+shared_cache_mode: str = os.getenv("SHARED_CACHE", "auto").lower()
+shared_cache_directory: str = os.getenv("SHARED_CACHE_DIR", "")
+shared_cache_enabled: bool = bool(shared_cache_directory) and (
+    shared_cache_mode == "true" or (shared_cache_mode == "auto" and server_workers > 1)
+)
+shared_cache_cleanup_interval: int = int(os.getenv("SHARED_CACHE_CLEANUP_INTERVAL", 5 * 60))
+
+
+# 전체 Connection 한도를 Worker별 Pool 크기로 나누는 기능
+def split_connection_budget(pool_size: int, max_overflow: int, budget: int,
+                            workers: int = server_workers) -> tuple[int, int]:
+    """
+    Worker별 몫이 설정된 Pool 크기보다 작으면 pool_size와 max_overflow의 비율을 유지하며 줄이는 기능
+    :param pool_size: Worker별 기본 Pool 크기 (최대값)
+    :param max_overflow: Worker별 추가 Connection 수 (최대값)
+    :param budget: 모든 Worker가 사용할 수 있는 전체 Connection 수 (0 이하이면 나누지 않음)
+    :param workers: Worker 수
+    :return: Worker별 (pool_size, max_overflow) tuple[int, int]
+    """
+    limit: int = pool_size + max_overflow
+    if budget <= 0 or limit <= 0:
+        return pool_size, max_overflow
+
+    share: int = max(budget // max(workers, 1), 1)
+    if share >= limit:
+        return pool_size, max_overflow
+
+    reduced_pool_size: int = max(round(share * pool_size / limit), 1)
+    return reduced_pool_size, share - reduced_pool_size
+
+
+# 설정에 따라 Worker 공유 Cache 또는 Worker별 Cache를 만드는 기능
+def make_shared_cache(name: str, max_size: int, ttl: float, encode: Callable = None,
+                      decode: Callable = None) -> TTLCache:
+    """
+    여러 Worker로 실행되는 경우 공유 메모리 Cache를 함께 사용하는 Cache를 만드는 기능
+    :param name: Cache 이름 (공유 디렉터리 이름)
+    :param max_size: Worker별 메모리 Cache의 최대 항목 수
+    :param ttl: 유효 시간 (초)
+    :param encode: 값을 JSON으로 저장할 수 있는 값으로 바꾸는 기능 (Nullable)
+    :param decode: JSON에서 불러온 값을 원래 값으로 바꾸는 기능 (Nullable)
+    :return: Cache TTLCache
+    """
+    if not shared_cache_enabled:
+        return TTLCache(max_size=max_size, ttl=ttl)
+
+    return SharedTTLCache(
+        max_size=max_size, ttl=ttl, directory=os.path.join(shared_cache_directory, name),
+        encode=encode, decode=decode
+    )
+
+
+# 여러 Worker로 실행되는 경우 Worker별 Cache의 삭제를 알리는 무효화 기록을 만드는 기능
+def make_invalidation_journal(name: str) -> InvalidationJournal | None:
+    """
+    :param name: 기록 이름 (공유 디렉터리의 파일 이름)
+    :return: 무효화 기록 InvalidationJournal (공유 Cache를 사용하지 않으면 None)
+    """
+    if not shared_cache_enabled:
+        return None
+
+    os.makedirs(shared_cache_directory, mode=0o700, exist_ok=True)
+    return InvalidationJournal(os.path.join(shared_cache_directory, f"{name}.invalidations"))
+
+
+# 공유 Cache에서 만료된 항목을 삭제하고 커진 무효화 기록을 교체하는 기능
+def cleanup_shared_caches(caches: list) -> int:
+    return sum(
+        cache.remove_expired() for cache in caches if isinstance(cache, (SharedTTLCache, InvalidationJournal))
+    )
+
+
+# 공유 Cache 디렉터리의 기본 위치 (공유 메모리가 없으면 임시 디렉터리)
+def get_default_shared_directory() -> str:
+    root: str = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(root, f"carebot-image-cache-{os.getpid()}")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Care-bot Image Provider server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=int(os.getenv("SERVER_WORKERS", 0)) or get_cpu_count())
+    arguments = parser.parse_args()
+
+    # 실행할 때마다 새 공유 Cache 디렉터리를 사용하고 종료할 때 삭제 (이전 실행의 세션 정보를 남기지 않음)
+    created_directory: str | None = None
+    if not os.getenv("SHARED_CACHE_DIR"):
+        created_directory = get_default_shared_directory()
+        os.makedirs(created_directory, mode=0o700, exist_ok=True)
+        os.environ["SHARED_CACHE_DIR"] = created_directory
+    os.environ["SERVER_WORKERS"] = str(arguments.workers)
+
+    connection_budget: int = int(os.getenv("DB_CONNECTION_BUDGET", 64))
+    if 0 < connection_budget < arguments.workers:
+        logger.warning(f"DB_CONNECTION_BUDGET({connection_budget}) is smaller than workers({arguments.workers})")
+    logger.info(f"Starting {arguments.workers} workers (cpu: {get_cpu_count()})")
+
+    try:
+        uvicorn.run("main:app", host=arguments.host, port=arguments.port, workers=arguments.workers)
+    finally:
+        if created_directory:
+            shutil.rmtree(created_directory, ignore_errors=True)
@@ -6,22 +6,127 @@ version : 0.1.0
 """
 
 # Libraries
-from fastapi import FastAPI, UploadFile, File, HTTPException, status, Request, Depends
+from fastapi import FastAPI, UploadFile, File, HTTPException, status, Request, Depends, Query, Header, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, JSONResponse, StreamingResponse, PlainTextResponse
+from fastapi.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+from pydantic import BaseModel
 from contextlib import asynccontextmanager
+from functools import partial
+
+import asyncio
+import hmac
 
 import filetype
 
 import Database
 from Database.models import *
+from Database.connector import database_instance
+from Database.authentication import activity_flush_interval, session_cleanup_interval, session_cache
+from Database.access import access_cache
+from Database.accounts import role_cache
 
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 
 import os
+from urllib.parse import quote, urlencode
 from dotenv import load_dotenv
 
 from Utilities.logging_tools import *
+from Utilities.upload_tools import *
+from Utilities.cache_tools import ByteLRUCache
+from Utilities.http_tools import make_etag, make_http_date, is_not_modified
+from Utilities.auth_tools import sign_image_access, verify_image_access, signed_url_expire_time
+from Utilities.image_tools import (
+    InvalidImage,
+    ResizeFit,
+    read_image_size,
+    inspect_image_file,
+    resize_image,
+    shutdown_process_pool
+)
+from Utilities.validation_tools import (
+    ValidationMode,
+    image_validation,
+    validation_recovery_interval,
+    validate_image_file,
+    async_replace_image_content
+)
+from Utilities.index_tools import (
+    index_instance,
+    async_add_image_record,
+    async_delete_image_record,
+    async_resolve_image_record,
+    async_list_image_records,
+    async_list_pending_image_records
+)
+from Utilities.archive_tools import ArchiveFormat, archive_media_types, stream_archive
+from Utilities.blob_tools import blob_storage, is_blob_path, async_store_blob, async_release_blob
+from Utilities.storage_tools import storage_backend, storage_cache_cleanup_interval
+from Utilities.resumable_tools import (
+    UploadOffsetMismatch,
+    UploadLocked,
+    resumable_upload_expire,
+    get_partial_path,
+    open_partial_file,
+    close_partial_file,
+    append_upload_chunk,
+    resumable_cleanup_interval,
+    cleanup_stale_uploads,
+    async_create_upload_session,
+    async_get_upload_session,
+    async_delete_upload_session
+)
+from Utilities.maintenance_tools import (
+    temp_cleanup_interval,
+    retention_interval,
+    retention_days,
+    retention_roles,
+    cleanup_orphan_temp_files,
+    cleanup_storage_cache,
+    purge_expired_images
+)
+from Utilities.scheduler_tools import Scheduler
+from Utilities.worker_tools import (
+    shared_cache_enabled,
+    shared_cache_cleanup_interval,
+    cleanup_shared_caches,
+    make_invalidation_journal
+)
+from Utilities.admission_tools import (
+    Priority,
+    AdmissionController,
+    AdmissionMiddleware,
+    AdmissionRejected,
+    upload_concurrency,
+    upload_high_reserved,
+    disk_write_concurrency,
+    disk_write_high_reserved,
+    register_admission_metrics
+)
+from Utilities.metrics_tools import (
+    MetricsMiddleware,
+    stage_timer,
+    metrics_enabled,
+    metrics_flush_interval,
+    metrics_token,
+    write_snapshot,
+    remove_snapshot,
+    render_metrics,
+    register_pool_metrics,
+    register_cache_metrics,
+    register_scheduler_metrics
+)
+from Utilities.variant_tools import (
+    make_variant_key,
+    get_or_create_variant,
+    get_variant_path,
+    transcode_formats,
+    create_transcoded_variants,
+    select_transcoded_variant,
+    variant_cache
+)
 
 logger = get_logger("Image")
 
@@ -31,15 +136,96 @@ logger = get_logger("Image")
 async def startup(app: FastAPI):
     # 시작된 경우
     logger.info("🚀 Start Care-bot Image Provider!!!")
+    scheduler.add_job("session-activity", Database.async_flush_session_activity, activity_flush_interval,
+                      leader_only=False)  # 최근 접근 기록은 Worker마다 따로 모으므로 모든 Worker에서 실행
+    scheduler.add_job("session-cleanup", Database.async_cleanup_login_sessions, session_cleanup_interval)
+    scheduler.add_job("upload-cleanup", cleanup_stale_uploads, resumable_cleanup_interval)
+    scheduler.add_job("temp-cleanup", cleanup_orphan_temp_files, temp_cleanup_interval)
+    if retention_days > 0 and retention_roles:
+        scheduler.add_job("retention", purge_expired_images, retention_interval)
+    if image_validation == ValidationMode.ASYNC:  # 검사 중 종료되어 공개되지 않은 이미지 다시 검사
+        scheduler.add_job("validation-recovery", recover_pending_images, validation_recovery_interval)
+    if shared_cache_enabled:  # Worker 공유 Cache에서 만료된 항목 정리
+        scheduler.add_job("shared-cache-cleanup", partial(
+            cleanup_shared_caches,
+            [session_cache, role_cache, access_cache, index_instance.cache, variant_cache, hot_image_journal]
+        ), shared_cache_cleanup_interval)
+    if storage_backend.remote:  # S3 저장소에서 내려받은 원본의 로컬 사본 정리
+        scheduler.add_job("storage-cache-cleanup", cleanup_storage_cache, storage_cache_cleanup_interval)
+    if metrics_enabled:  # 다른 Worker가 /metrics 요청을 받아도 이 Worker의 측정값이 포함되도록 주기적으로 기록
+        scheduler.add_job("metrics-flush", write_snapshot, metrics_flush_interval, leader_only=False)
+    scheduler.start()
 
     yield
 
     # 종료 된 경우
+    await scheduler.stop()
+    await Database.async_flush_session_activity()  # 남아있는 최근 접근 기록 반영
+    database_instance.shutdown()
+    shutdown_process_pool()
+    remove_snapshot()
     logger.info("🛑 Server shutdown")
 
 
 app = FastAPI(lifespan=startup)
 
+# 유지보수 작업 Scheduler (여러 Worker 중 잠금을 얻은 하나만 Leader로 동작)
+scheduler = Scheduler(os.getenv("SCHEDULER_LOCK_PATH", os.path.join(os.getenv("IMAGE_STORAGE"), ".scheduler.lock")))
+
+# ========== 업로드 유입 제어 ==========
+# 동시에 받는 업로드 수와 디스크 기록 수를 제한 (시스템 계정의 업로드는 남겨둔 자리와 먼저 들어갈 권한을 가짐)
+upload_admission = AdmissionController("upload", upload_concurrency, upload_high_reserved)
+disk_write_admission = AdmissionController("disk_write", disk_write_concurrency, disk_write_high_reserved)
+
+
+# 유입 제어 대상 요청인지 확인하는 기능 (업로드 생성, 전송, 마무리)
+def is_upload_request(scope: dict) -> bool:
+    return scope["method"] in ("POST", "PATCH") and (scope["path"] == "/upload" or scope["path"].startswith("/upload/"))
+
+
+# 업로드 요청의 우선 순위를 정하는 기능
+async def classify_upload(scope: dict) -> Priority:
+    """
+    시스템(Care-bot 기기) 계정의 업로드만 높은 우선 순위로 분류하는 기능
+    세션과 사용자 역할은 Cache에서 확인하며, 확인한 역할은 요청 정보에 남겨 업로드 권한 확인에서 다시 조회하지 않음
+    :param scope: ASGI 요청 정보
+    :return: 우선 순위 Priority
+    """
+    request = Request(scope)
+    request_id: str = await Database.async_check_current_user(request)
+
+    if not request_id:
+        return Priority.NORMAL
+
+    role: Role | None = await Database.async_get_account_role(request_id)
+    request.state.account = (request_id, role)
+    return Priority.HIGH if role == Role.SYSTEM else Priority.NORMAL
+
+
+app.add_middleware(  # type: ignore
+    AdmissionMiddleware,
+    controller=upload_admission,
+    matcher=is_upload_request,
+    classifier=classify_upload
+)
+register_admission_metrics(upload_admission)
+register_admission_metrics(disk_write_admission)
+
+
+# 업로드 요청 본문의 최대 크기를 정하는 기능 (이어 올리기 전송은 resumable_tools에서 받는 도중에 검사)
+def get_upload_body_limit(scope: dict) -> int | None:
+    if scope["method"] != "POST":
+        return None
+    if scope["path"] == "/upload":
+        return max_image_size + multipart_overhead
+    if scope["path"] == "/upload/batch":
+        return (max_image_size + multipart_overhead) * max_batch_files
+    return None
+
+
+# 유입 제어보다 먼저 검사하여 크기를 넘는 요청은 자리를 얻지 않고 거절
+app.add_middleware(UploadSizeMiddleware, limiter=get_upload_body_limit)  # type: ignore
+
 # ========== CORS 설정 ==========
 origins_url = [
     "http://localhost:3000",
@@ -65,6 +251,19 @@ app.add_middleware(  # type: ignore
 )
 
 
+# ========== 측정 설정 ==========
+# Route별 요청 수, 처리 시간, 송수신 Byte 측정
+app.add_middleware(MetricsMiddleware)  # type: ignore
+
+register_pool_metrics("database", database_instance.engine)
+register_pool_metrics("index", index_instance.engine)
+register_cache_metrics("session", session_cache)
+register_cache_metrics("access", access_cache)
+register_cache_metrics("index", index_instance.cache)
+register_cache_metrics("variant", variant_cache)
+register_scheduler_metrics(scheduler)
+
+
 # ========== 이미지 저장공간 설정 ==========
 load_dotenv()
 
@@ -75,13 +274,68 @@ checker_size: int = 2048
 allowed_types: list[str] = ["image/jpeg", "image/png", "image/gif", "image/webp"]
 max_image_size: int = int(os.getenv("MAX_IMAGE_SIZE")) * 1024 * 1024
 cache_duration: int = int(os.getenv("CACHE_DURATION"))
+max_variant_size: int = int(os.getenv("MAX_VARIANT_SIZE", 2048))
 
+# 일괄 업로드 설정 (요청당 최대 파일 수, 동시에 저장할 파일 수)
+max_batch_files: int = int(os.getenv("MAX_BATCH_FILES", 16))
+batch_upload_concurrency: int = int(os.getenv("BATCH_UPLOAD_CONCURRENCY", 4))
+max_batch_access: int = int(os.getenv("MAX_BATCH_ACCESS", 100))
+max_list_limit: int = int(os.getenv("MAX_LIST_LIMIT", 100))
 
-# ========== 이미지 관리 기능 ==========
-@app.post("/upload", status_code=status.HTTP_201_CREATED)
-async def upload_image(request: Request, file: UploadFile = File(...), request_id=Depends(Database.check_current_user)):
-    # 사용자 계정을 통해 접근하는지 점검
-    request_data: dict = Database.get_one_account(request_id)
+# 파일 전달 방식 설정 (direct: FastAPI가 직접 전달, accel: Nginx X-Accel-Redirect로 전달)
+delivery_mode: str = os.getenv("DELIVERY_MODE", "direct")
+accel_redirect_prefix: str = os.getenv("ACCEL_REDIRECT_PREFIX", "/_protected_images").rstrip("/")
+
+# 자주 조회되는 작은 이미지를 메모리에 보관하는 Cache 설정 (업로드 직후 여러 보호자가 조회하는 알림 이미지 등)
+hot_image_cache_size: int = int(os.getenv("HOT_IMAGE_CACHE_SIZE", 64)) * 1024 * 1024
+hot_image_max_size: int = int(os.getenv("HOT_IMAGE_MAX_SIZE", 512)) * 1024
+hot_image_cache = ByteLRUCache(max_bytes=hot_image_cache_size, max_item_bytes=hot_image_max_size)
+register_cache_metrics("hot_image", hot_image_cache)
+hot_image_journal = make_invalidation_journal("hot_image")  # 여러 Worker로 실행되는 경우 원본 삭제를 다른 Worker에 알림
+
+
+# 원본이 삭제된 이미지를 모든 Worker의 메모리 Cache에서 비우는 기능
+def invalidate_hot_image(source_hash: str) -> None:
+    hot_image_cache.invalidate_tag(source_hash)
+    if hot_image_journal is not None:
+        hot_image_journal.publish(source_hash)
+
+
+# 다른 Worker에서 삭제된 원본을 이 Worker의 메모리 Cache에서도 비우는 기능
+def sync_hot_image_cache() -> None:
+    if hot_image_journal is None:
+        return
+
+    tokens: list[str] | None = hot_image_journal.poll()
+    if tokens is None:
+        hot_image_cache.clear()
+        return
+
+    for token in tokens:
+        hot_image_cache.invalidate_tag(token)
+
+
+# ========== 요청 형식 ==========
+class ImageReference(BaseModel):
+    user_id: str
+    file_name: str
+
+
+class BatchAccessRequest(BaseModel):
+    images: list[ImageReference]
+    archive: ArchiveFormat | None = None
+
+
+# ========== 이미지 관리 보조 기능 ==========
+# 요청한 사용자의 계정과 접근 가능한 소유자 목록을 불러오는 기능
+async def load_access_scope(request_id: str) -> tuple[dict, frozenset[str]]:
+    """
+    요청한 사용자의 계정과 접근 권한 범위를 불러오는 기능 (계정이 없으면 403)
+    :param request_id: 요청한 사용자의 ID
+    :return: 요청한 사용자의 계정 정보와 접근 가능한 소유자 ID 집합 tuple[dict, frozenset[str]]
+    """
+    # 사용자 계정을 통해 접근하는지 확인
+    request_data: dict = await Database.async_get_one_account(request_id)
 
     if not request_data:
         logger.warning(f"Can not access image: {request_id}")
@@ -93,25 +347,298 @@ async def upload_image(request: Request, file: UploadFile = File(...), request_i
             }
         )
 
-    # 파일 크기 검사
-    content_length = request.headers.get("Content-Length")
-    if content_length is not None and int(content_length) > max_image_size:
+    # 접근 권한 범위 설정 (주 사용자는 소속된 가족 구성원, 보조 사용자는 소속된 주 사용자들의 이미지까지 접근 가능)
+    accessible_id: frozenset[str] = await Database.async_get_accessible_ids(request_id, request_data["role"])
+
+    return request_data, accessible_id
+
+
+# 접근 권한 범위 안에 해당 소유자가 있는지 확인하는 기능
+def can_read_image(request_data: dict, accessible_id: frozenset[str], user_id: str) -> bool:
+    return request_data["role"] == Role.SYSTEM or user_id in accessible_id
+
+
+# 요청한 사용자가 해당 소유자의 이미지를 볼 수 있는지 확인하는 기능
+async def authorize_image_read(request_id: str, user_id: str) -> dict:
+    """
+    요청한 사용자의 계정과 접근 권한 범위를 확인하는 기능 (권한이 없으면 403)
+    :param request_id: 요청한 사용자의 ID
+    :param user_id: 이미지 소유자의 ID
+    :return: 요청한 사용자의 계정 정보 dict
+    """
+    request_data, accessible_id = await load_access_scope(request_id)
+
+    # 요청한 사용자가 해당 이미지 경로에 접근 가능한지 점검
+    if not can_read_image(request_data, accessible_id, user_id):
+        logger.warning(f"Can not access image: {request_id}")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "type": "can not access",
+                "message": "You do not have permission"
+            }
+        )
+
+    return request_data
+
+
+# 서명된 이미지 URL을 만드는 기능
+def make_signed_image_url(user_id: str, file_name: str) -> str:
+    signature: dict = sign_image_access(user_id, file_name)
+    if not signature:
+        return ""
+    return f"{image_url}/access/{quote(user_id)}/{quote(file_name)}?{urlencode(signature)}"
+
+
+# 이미지 내용이 마지막으로 바뀐 시각 (검사 후 메타데이터를 지운 내용으로 바뀐 경우 그 시각)
+def get_last_modified(image_data: dict) -> datetime:
+    return image_data["modified_at"] or image_data["created_at"]
+
+
+# 304 Not Modified 응답을 만드는 기능
+def not_modified_response(content_id: str, image_data: dict, cache_headers: dict) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={
+            **cache_headers,
+            "ETag": make_etag(content_id),
+            "Last-Modified": make_http_date(get_last_modified(image_data))
+        }
+    )
+
+
+# 원본 이미지를 로컬 경로에서 읽을 수 있도록 준비하는 기능
+async def localize_image(image_data: dict) -> str:
+    """
+    저장공간에서 원본 이미지의 로컬 경로를 불러오는 기능 (S3 저장소는 로컬 사본이 없으면 내려받음)
+    :param image_data: 이미지의 색인 정보
+    :return: 로컬 파일 경로 str
+    """
+    try:
+        with stage_timer("storage"):
+            return await storage_backend.async_localize(image_data["path"])
+    except FileNotFoundError:
+        logger.error(f"Stored image not found: {image_data['path']}")
         raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            status_code=status.HTTP_404_NOT_FOUND,
             detail={
-                "type": "too large",
-                "message": f"Image size exceeds the limit({max_image_size // 1024 // 1024}MB max).",
-                "input": {
-                    "request_id": request_id,
-                    "file_name": file.filename,
-                    "file_size": f"{int(content_length) // 1024 // 1024}MB",
-                }
+                "type": "not found",
+                "message": "Image not found"
+            }
+        )
+    except Exception as error:
+        logger.error(f"Image access failed: {str(error)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "type": "internal server error",
+                "message": "An error occurred while accessing the image"
             }
         )
 
+
+# 기록이 끝난 임시 파일을 저장공간과 색인에 등록하는 기능
+async def register_uploaded_image(request_id: str, original_name: str, temp_path: str, file_size: int,
+                                  file_hash: str, mime: str, background_tasks: BackgroundTasks,
+                                  sequence: int | None = None) -> dict:
+    """
+    형식 검사가 끝난 임시 파일을 내용 주소 기반 저장공간에 옮기고 색인에 등록하는 기능
+    :param request_id: 업로드한 사용자의 ID
+    :param original_name: 업로드된 파일의 원래 이름
+    :param temp_path: 저장공간과 같은 파일 시스템에 기록된 임시 파일 경로
+    :param file_size: 파일 크기
+    :param file_hash: 파일 내용의 SHA-256
+    :param mime: 파일 형식
+    :param background_tasks: 응답 이후 실행할 작업 목록
+    :param sequence: 같은 요청 안에 같은 이름의 파일이 있는 경우 구분하기 위한 번호 (Nullable)
+    :return: 저장된 이미지 정보 dict
+    """
+    # 파일 이름 설정
+    filename, ext = os.path.splitext(original_name)
+    current_datatime = datetime.now(tz=timezone.utc)
+    time_header = current_datatime.strftime("%Y%m%d_%H%M%S") + f"_{current_datatime.microsecond // 1000:03d}"
+    if sequence is not None:
+        time_header += f"_{sequence}"
+    new_filename = f"{filename}_{time_header}{ext}"
+
+    # 설정에 따라 저장하기 전에 전체를 디코딩하여 검사 (메타데이터를 지운 파일로 바뀌므로 크기와 SHA-256도 바뀜)
+    if image_validation == ValidationMode.SYNC:
+        try:
+            validated_data: dict = await validate_image_file(temp_path, mime, remove_source=True)
+        except InvalidImage:
+            await run_in_threadpool(remove_quietly, temp_path)
+            raise
+
+        temp_path, file_size, file_hash = validated_data["path"], validated_data["size"], validated_data["sha256"]
+        dimensions = (validated_data["width"], validated_data["height"])
+    else:
+        with stage_timer("sniff"):
+            dimensions = await run_in_threadpool(read_image_size, temp_path) or (None, None)
+
+    # 같은 내용이 이미 저장되어 있으면 참조만 추가 (사용자별 파일 이름은 색인의 참조로만 관리)
+    with stage_timer("disk"):
+        blob_path: str = await async_store_blob(temp_path, file_hash, file_size)
+
+    # 이미지 메타데이터를 색인에 등록 (조회할 때 파일 형식을 다시 검사하지 않기 위함)
+    image_data: dict = {
+        "owner_id": request_id,
+        "file_name": new_filename,
+        "path": blob_path,
+        "mime": mime,
+        "size": file_size,
+        "sha256": file_hash,
+        "width": dimensions[0],
+        "height": dimensions[1],
+        "created_at": current_datatime.replace(tzinfo=None),
+        "modified_at": None,
+        "pending": image_validation == ValidationMode.ASYNC  # 검사가 끝날 때까지 조회와 목록에서 제외
+    }
+    # 같은 시각(ms)에 같은 이름으로 올린 이미지가 있으면 번호를 붙인 이름으로 등록
+    registered_data: dict = await async_add_image_record(image_data, rename=True)
+    if not registered_data:
+        await async_release_blob(file_hash)
+        raise RuntimeError(f"Can not register image: {new_filename}")
+    image_data, new_filename = registered_data, registered_data["file_name"]
+
+    # 응답 이후 Background에서 조회에 대비해 메모리 Cache에 보관하고, 더 작은 형식(WebP, AVIF)으로 변환
+    background_tasks.add_task(process_stored_image, image_data)
+
+    logger.info(f"Image uploaded: {new_filename}")
+
+    return {
+        "request_id": request_id,
+        "file_name": new_filename,
+        "file_type": mime,
+        "file_path": f"{image_url}/access/{request_id}/{new_filename}",
+        "signed_path": make_signed_image_url(request_id, new_filename)
+    }
+
+
+# 저장된 이미지를 응답 이후에 검사, Cache 보관, 변환하는 기능 (Background Task)
+async def process_stored_image(image_data: dict) -> None:
+    """
+    원본을 로컬 경로에서 읽을 수 있도록 준비한 후(S3 저장소는 다른 Host가 저장한 내용이면 내려받음) 후속 작업을 실행하는 기능
+    :param image_data: 저장된 이미지의 색인 정보
+    :return: None
+    """
+    try:
+        file_path: str = await storage_backend.async_localize(image_data["path"])
+    except Exception as error:
+        logger.error(f"Can not load stored image: {str(error)}")
+        return
+
+    if image_validation == ValidationMode.ASYNC:
+        await validate_stored_image(image_data, file_path)
+        return
+
+    if hot_image_cache.accepts(image_data["size"]):
+        await run_in_threadpool(
+            load_hot_image, image_data["sha256"], file_path, image_data["mime"], image_data["sha256"]
+        )
+    await create_transcoded_variants(image_data, file_path)
+
+
+# 이미지 파일을 읽어 메모리 Cache에 보관하는 기능
+def load_hot_image(content_id: str, file_path: str, media_type: str, source_hash: str) -> bytes | None:
+    """
+    작은 이미지 파일을 한 번 읽어 메모리 Cache에 보관하는 기능 (큰 파일은 읽지 않음)
+    내용 주소(SHA-256, 파생 이미지 키)를 키로 사용하므로 같은 키의 내용은 바뀌지 않음
+    :param content_id: 이미지 내용의 키 (ETag와 같은 값)
+    :param file_path: 이미지 파일 경로
+    :param media_type: 이미지 형식
+    :param source_hash: 원본 이미지의 SHA-256 (원본이 삭제될 때 파생 이미지까지 함께 비우기 위함)
+    :return: 이미지 데이터 bytes (Cache에 보관하지 않으면 None)
+    """
+    try:
+        with open(file_path, "rb") as buffer:
+            data: bytes = buffer.read(hot_image_max_size + 1)
+    except OSError as error:
+        logger.error(f"Can not cache image: {str(error)}")
+        return None
+
+    if not hot_image_cache.set(content_id, (data, media_type), len(data), tag=source_hash):
+        return None
+    return data
+
+
+# 저장된 이미지를 검사하고 메타데이터를 지운 내용으로 바꾸는 기능 (IMAGE_VALIDATION=async, Background Task)
+async def validate_stored_image(image_data: dict, file_path: str) -> None:
+    """
+    201 응답 이후 저장된 이미지를 전체 디코딩으로 검사하는 기능
+    통과하지 못하면 이미지를 삭제하고, 메타데이터를 지운 경우 새 내용으로 색인을 바꾼 후 이전 내용의 참조를 줄임
+    검사가 끝나기 전에는 이미지를 공개하지 않으므로(pending) 메타데이터가 남은 원본은 제공되지 않음
+    :param image_data: 저장된 이미지의 색인 정보
+    :param file_path: 저장된 이미지 경로
+    :return: None
+    """
+    owner_id, file_name, previous_hash = image_data["owner_id"], image_data["file_name"], image_data["sha256"]
+
+    try:
+        validated_data: dict = await validate_image_file(file_path, image_data["mime"], remove_source=False)
+    except InvalidImage as error:
+        logger.warning(f"Invalid image removed: {owner_id}/{file_name} ({str(error)})")
+        # 색인 정보를 실제로 삭제한 경우에만 참조를 줄임 (그 사이에 사용자가 삭제했으면 이미 줄어듦)
+        if await async_delete_image_record(owner_id, file_name) == 1 and await async_release_blob(previous_hash):
+            invalidate_hot_image(previous_hash)
+        return
+    except Exception as error:
+        logger.error(f"Image validation failed: {str(error)}")  # 공개하지 않은 채 두고 validation-recovery 작업에서 다시 검사
+        return
+
+    # 다시 저장하지 않은 경우 내용은 그대로 두고 공개만 함
+    if validated_data["sha256"] == previous_hash:
+        updated_data: dict = {**image_data, **validated_data, "path": image_data["path"], "pending": False}
+        if await async_replace_image_content(owner_id, file_name, previous_hash, updated_data):
+            await create_transcoded_variants(updated_data, file_path)
+        return
+
+    blob_path: str = await async_store_blob(validated_data["path"], validated_data["sha256"], validated_data["size"])
+    updated_data: dict = {
+        **image_data, **validated_data,
+        "path": blob_path,
+        "modified_at": datetime.now(tz=timezone.utc).replace(tzinfo=None),
+        "pending": False
+    }
+
+    # 검사하는 동안 이미지가 삭제되었다면 새로 저장한 내용만 정리
+    if not await async_replace_image_content(owner_id, file_name, previous_hash, updated_data):
+        await async_release_blob(validated_data["sha256"])
+        return
+
+    if await async_release_blob(previous_hash):
+        invalidate_hot_image(previous_hash)
+    await create_transcoded_variants(updated_data, await storage_backend.async_localize(blob_path))
+
+
+# 검사 중 서버가 종료되는 등으로 공개되지 않은 채 남은 이미지를 다시 검사하는 기능 (IMAGE_VALIDATION=async)
+async def recover_pending_images() -> int:
+    created_before: datetime = datetime.now(tz=timezone.utc).replace(tzinfo=None) - timedelta(
+        seconds=validation_recovery_interval
+    )
+    pending_images: list[dict] = await async_list_pending_image_records(created_before)
+
+    for image_data in pending_images:
+        await process_stored_image(image_data)
+
+    return len(pending_images)
+
+
+# 업로드된 이미지 하나를 검사하고 저장하는 기능
+async def save_uploaded_image(request_id: str, file: UploadFile, background_tasks: BackgroundTasks,
+                              sequence: int | None = None, priority: Priority = Priority.NORMAL) -> dict:
+    """
+    업로드된 파일의 형식을 검사하고 저장공간과 색인에 등록하는 기능 (단일 업로드와 일괄 업로드에서 공통으로 사용)
+    :param request_id: 업로드한 사용자의 ID
+    :param file: 업로드된 파일
+    :param background_tasks: 응답 이후 실행할 작업 목록
+    :param sequence: 같은 요청 안에 같은 이름의 파일이 있는 경우 구분하기 위한 번호 (Nullable)
+    :param priority: 디스크 기록 자리를 얻을 때의 우선 순위
+    :return: 저장된 이미지 정보 dict (실패하면 HTTPException 발생)
+    """
     # 파일 내용 검사
-    file_bytes = await file.read(checker_size)
-    file_type = filetype.guess(file_bytes)
+    with stage_timer("sniff"):
+        file_bytes = await file.read(checker_size)
+        file_type = filetype.guess(file_bytes)
 
     if file_type is None or file_type.mime not in allowed_types:
         logger.warning(f"Invalid file type: {file_type.mime if file_type else 'unknown'}")
@@ -128,96 +655,632 @@ async def upload_image(request: Request, file: UploadFile = File(...), request_i
             }
         )
 
-    file.file.seek(0)  # 포인터 초기화
+    try:
+        # 디스크 기록 자리를 얻은 후 파일 저장 (고정 크기 단위로 임시 파일에 기록하면서 SHA-256 계산)
+        async with disk_write_admission.slot(priority):
+            with stage_timer("disk"):
+                temp_path, file_size, file_hash = await stream_upload(
+                    file, blob_storage, max_image_size, head=file_bytes
+                )
 
-    # 해당 사용자의 이미지 저장공간 접근
+            return await register_uploaded_image(
+                request_id, file.filename, temp_path, file_size, file_hash, file_type.mime, background_tasks, sequence
+            )
+    except AdmissionRejected as error:
+        logger.warning(f"Image upload rejected ({error.reason}): {file.filename}")
+        raise HTTPException(
+            status_code=error.status_code,
+            detail={
+                "type": "too many requests" if error.status_code == 429 else "service unavailable",
+                "message": "Server is busy, please retry later"
+            },
+            headers={"Retry-After": str(error.retry_after)}
+        )
+    except InvalidImage as error:
+        logger.warning(f"Invalid image: {file.filename} ({str(error)})")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "type": "invalid value",
+                "message": "The image file is damaged or not allowed",
+                "input": {
+                    "request_id": request_id,
+                    "file_name": file.filename,
+                    "file_type": file_type.mime
+                }
+            }
+        )
+    except UploadTooLarge as error:
+        logger.warning(f"Image too large: {file.filename}")
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "type": "too large",
+                "message": f"Image size exceeds the limit({max_image_size // 1024 // 1024}MB max).",
+                "input": {
+                    "request_id": request_id,
+                    "file_name": file.filename,
+                    "file_size": f"{error.size // 1024 // 1024}MB",
+                }
+            }
+        )
+    except Exception as error:
+        logger.error(f"Image upload failed: {str(error)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "type": "internal server error",
+                "message": "An error occurred while uploading the image"
+            }
+        )
+
+
+# 업로드 권한을 확인하는 기능 (요청 전체 크기는 UploadSizeMiddleware에서 본문을 받는 도중에 검사)
+async def authorize_upload(request: Request, request_id: str) -> None:
+    # 사용자 계정을 통해 접근하는지 점검 (우선 순위 분류에서 확인한 역할이 있으면 다시 조회하지 않음)
+    account_id, role = getattr(request.state, "account", (None, None))
+    if account_id != request_id:
+        role = await Database.async_get_account_role(request_id)
+
+    if role is None:
+        logger.warning(f"Can not access image: {request_id}")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "type": "can not access",
+                "message": "You do not have permission"
+            }
+        )
+
+
+# 이미지 목록 응답을 만드는 기능
+async def list_images_response(request_id: str, owner_ids: list[str], order: Order, limit: int,
+                               cursor: str | None) -> dict:
     try:
-        user_storage = os.path.join(image_storage, request_id)
-        os.makedirs(user_storage, exist_ok=True)
+        images, next_cursor = await async_list_image_records(owner_ids, order, limit, cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "type": "invalid value",
+                "message": "Invalid cursor",
+                "input": {
+                    "request_id": request_id,
+                    "cursor": cursor
+                }
+            }
+        )
+
+    return {
+        "message": "Image list loaded successfully",
+        "result": {
+            "request_id": request_id,
+            "images": [{
+                "user_id": image_data["owner_id"],
+                "file_name": image_data["file_name"],
+                "file_type": image_data["mime"],
+                "file_size": image_data["size"],
+                "width": image_data["width"],
+                "height": image_data["height"],
+                "created_at": image_data["created_at"].isoformat(),
+                "file_path": f"{image_url}/access/{quote(image_data['owner_id'])}/{quote(image_data['file_name'])}",
+                "signed_path": make_signed_image_url(image_data["owner_id"], image_data["file_name"])
+            } for image_data in images],
+            "next_cursor": next_cursor
+        }
+    }
 
-        # 파일 이름 설정
-        filename, ext = os.path.splitext(file.filename)
-        current_datatime = datetime.now(tz=timezone.utc)
-        time_header = current_datatime.strftime("%Y%m%d_%H%M%S") + f"_{current_datatime.microsecond // 1000:03d}"
-        new_filename = f"{filename}_{time_header}{ext}"
 
-        # 파일 저장 경로
-        file_path = os.path.join(user_storage, new_filename)
+# 이어 올리기 업로드가 없는 경우의 응답
+def resumable_upload_not_found(upload_id: str) -> HTTPException:
+    logger.warning(f"Upload not found: {upload_id}")
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "type": "not found",
+            "message": "Upload not found"
+        }
+    )
 
-        # 파일 저장
-        with open(file_path, "wb") as _buffer:
-            content = await file.read()
-            _buffer.write(content)
 
-        logger.info(f"Image uploaded: {new_filename}")
-        file.file.seek(0)  # 포인터 초기화
+# 요청한 사용자의 이어 올리기 업로드를 불러오는 기능
+async def load_resumable_upload(upload_id: str, request_id: str) -> dict:
+    upload_data: dict = await async_get_upload_session(upload_id, request_id)
 
-        return {
-            "message": "Image uploaded successfully",
+    if not upload_data:
+        raise resumable_upload_not_found(upload_id)
+
+    return upload_data
+
+
+# ========== 이미지 관리 기능 ==========
+@app.post("/upload", status_code=status.HTTP_201_CREATED)
+async def upload_image(request: Request, background_tasks: BackgroundTasks, file: UploadFile = File(...),
+                       request_id=Depends(Database.async_check_current_user)):
+    await authorize_upload(request, request_id)
+
+    return {
+        "message": "Image uploaded successfully",
+        "result": await save_uploaded_image(
+            request_id, file, background_tasks, priority=getattr(request.state, "priority", Priority.NORMAL)
+        )
+    }
+
+
+@app.post("/upload/batch", status_code=status.HTTP_201_CREATED)
+async def upload_images(request: Request, background_tasks: BackgroundTasks, files: list[UploadFile] = File(...),
+                        request_id=Depends(Database.async_check_current_user)):
+    # 인증과 권한 확인은 요청마다 한 번만 수행
+    await authorize_upload(request, request_id)
+
+    if len(files) > max_batch_files:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "type": "invalid value",
+                "message": f"Too many files in one request({max_batch_files} max).",
+                "input": {
+                    "request_id": request_id,
+                    "file_count": len(files)
+                }
+            }
+        )
+
+    # 파일마다 독립적으로 저장하고 결과를 모음 (일부가 실패해도 나머지는 저장)
+    semaphore = asyncio.Semaphore(batch_upload_concurrency)
+    priority: Priority = getattr(request.state, "priority", Priority.NORMAL)
+
+    file_names: list[str] = [file.filename for file in files]
+
+    async def save_one(position: int, file: UploadFile) -> dict:
+        # 같은 이름의 파일이 여러 개면 저장되는 이름이 겹치지 않도록 순번을 붙임
+        sequence: int | None = position if file_names.count(file.filename) > 1 else None
+
+        async with semaphore:
+            try:
+                return {
+                    "status": status.HTTP_201_CREATED,
+                    "result": await save_uploaded_image(request_id, file, background_tasks, sequence, priority)
+                }
+            except HTTPException as error:
+                return {
+                    "status": error.status_code,
+                    "file_name": file.filename,
+                    "detail": error.detail
+                }
+
+    results: list[dict] = await asyncio.gather(*(save_one(position, file) for position, file in enumerate(files)))
+    uploaded: int = sum(1 for result in results if result["status"] == status.HTTP_201_CREATED)
+
+    logger.info(f"Batch uploaded: {uploaded}/{len(results)} images")
+
+    return JSONResponse(
+        status_code=status.HTTP_201_CREATED if uploaded == len(results) else status.HTTP_207_MULTI_STATUS,
+        content={
+            "message": "Images uploaded successfully" if uploaded == len(results) else "Some images failed to upload",
             "result": {
                 "request_id": request_id,
-                "file_name": new_filename,
-                "file_type": file_type.mime if file_type else 'unknown',
-                "file_path": f"{image_url}/access/{request_id}/{new_filename}"
+                "uploaded": uploaded,
+                "failed": len(results) - uploaded,
+                "files": results
             }
         }
-    except Exception as error:
-        logger.error(f"Image upload failed: {str(error)}")
+    )
+
+
+@app.post("/upload/resumable", status_code=status.HTTP_201_CREATED)
+async def create_resumable_upload(request: Request, response: Response, file_name: str,
+                                  upload_length: int = Header(..., alias="Upload-Length", ge=1),
+                                  request_id=Depends(Database.async_check_current_user)):
+    await authorize_upload(request, request_id)
+
+    # 전체 크기를 미리 확인하여 제한을 넘는 업로드는 시작하지 않음
+    if upload_length > max_image_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "type": "too large",
+                "message": f"Image size exceeds the limit({max_image_size // 1024 // 1024}MB max).",
+                "input": {
+                    "request_id": request_id,
+                    "file_name": file_name,
+                    "file_size": f"{upload_length // 1024 // 1024}MB",
+                }
+            }
+        )
+
+    upload_data: dict = await async_create_upload_session(request_id, file_name, upload_length)
+
+    if not upload_data:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
                 "type": "internal server error",
-                "message": "An error occurred while uploading the image"
+                "message": "An error occurred while creating the upload"
             }
         )
 
+    upload_path: str = f"{image_url}/upload/resumable/{upload_data['upload_id']}"
+    response.headers.update({"Location": upload_path, "Upload-Offset": "0"})
 
-@app.get("/access/{user_id}/{file_name}", status_code=status.HTTP_200_OK)
-async def get_image(user_id: str, file_name: str, request_id=Depends(Database.check_current_user)):
-    # 사용자 계정을 통해 접근하는지 확인
-    request_data: dict = Database.get_one_account(request_id)
+    return {
+        "message": "Upload created successfully",
+        "result": {
+            "request_id": request_id,
+            "upload_id": upload_data["upload_id"],
+            "upload_path": upload_path,
+            "offset": 0,
+            "length": upload_length,
+            "expires_in": resumable_upload_expire
+        }
+    }
 
-    if not request_data:
-        logger.warning(f"Can not access image: {request_id}")
+
+@app.patch("/upload/resumable/{upload_id}", status_code=status.HTTP_200_OK)
+async def append_resumable_upload(request: Request, response: Response, upload_id: str,
+                                  upload_offset: int = Header(..., alias="Upload-Offset", ge=0),
+                                  request_id=Depends(Database.async_check_current_user)):
+    upload_data: dict = await load_resumable_upload(upload_id, request_id)
+
+    try:
+        # 요청 본문을 받은 위치부터 임시 파일 끝에 이어서 기록
+        offset: int = await append_upload_chunk(upload_data, upload_offset, request.stream())
+    except UploadOffsetMismatch as error:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
+            status_code=status.HTTP_409_CONFLICT,
             detail={
-                "type": "can not access",
-                "message": "You do not have permission"
+                "type": "conflict",
+                "message": "Upload-Offset does not match the received size",
+                "input": {
+                    "request_id": request_id,
+                    "upload_id": upload_id,
+                    "offset": error.offset
+                }
+            },
+            headers={"Upload-Offset": str(error.offset)}
+        )
+    except UploadLocked:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "type": "conflict",
+                "message": "Another request is writing to this upload"
+            }
+        )
+    except UploadTooLarge as error:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "type": "too large",
+                "message": "Upload exceeds the declared Upload-Length",
+                "input": {
+                    "request_id": request_id,
+                    "upload_id": upload_id,
+                    "file_size": error.size
+                }
             }
         )
+    except FileNotFoundError:
+        raise resumable_upload_not_found(upload_id)
+    except ClientDisconnect:
+        # 받은 데이터까지는 기록되어 있으므로 클라이언트가 상태를 조회한 후 이어서 올림
+        logger.warning(f"Upload interrupted: {upload_id}")
+        return Response(status_code=status.HTTP_400_BAD_REQUEST)
 
-    # 접근 권한 범위 설정
-    accessible_id: list[str] = [request_id]
+    response.headers["Upload-Offset"] = str(offset)
 
-    if request_data["role"] == Role.MAIN:  # 주 사용자가 접근한 경우 소속된 가족 이미지까지 접근 가능
-        family_id: str = Database.main_id_to_family_id(request_id)
-        member_data: list[dict] = Database.get_all_members(family_id=family_id)
-        for member in member_data:
-            accessible_id.append(member["user_id"])
-    elif request_data["role"] == Role.SUB:  # 보조 사용자가 접근한 경우 소속된 주 사용자들의 이미지까지 접근 가능
-        member_data: list[dict] = Database.get_all_members(user_id=request_id)
-        family_id_list: list[str] = [member["family_id"] for member in member_data]
-        for family_id in family_id_list:
-            family_data: dict = Database.get_one_family(family_id)
-            accessible_id.append(family_data["main_user"])
+    return {
+        "message": "Upload chunk received successfully",
+        "result": {
+            "request_id": request_id,
+            "upload_id": upload_id,
+            "offset": offset,
+            "length": upload_data["length"]
+        }
+    }
 
-    # 요청한 사용자가 해당 이미지 경로에 접근 가능한지 점검
-    if request_data["role"] != Role.SYSTEM and user_id not in accessible_id:
-        logger.warning(f"Can not access image: {request_id}")
+
+@app.get("/upload/resumable/{upload_id}", status_code=status.HTTP_200_OK)
+async def get_resumable_upload(response: Response, upload_id: str,
+                               request_id=Depends(Database.async_check_current_user)):
+    upload_data: dict = await load_resumable_upload(upload_id, request_id)
+    response.headers.update({
+        "Upload-Offset": str(upload_data["offset"]),
+        "Upload-Length": str(upload_data["length"]),
+        "Cache-Control": "no-store"
+    })
+
+    return {
+        "message": "Upload status loaded successfully",
+        "result": {
+            "request_id": request_id,
+            "upload_id": upload_id,
+            "file_name": upload_data["file_name"],
+            "offset": upload_data["offset"],
+            "length": upload_data["length"]
+        }
+    }
+
+
+@app.post("/upload/resumable/{upload_id}/finalize", status_code=status.HTTP_201_CREATED)
+async def finalize_resumable_upload(upload_id: str, background_tasks: BackgroundTasks,
+                                    request_id=Depends(Database.async_check_current_user)):
+    upload_data: dict = await load_resumable_upload(upload_id, request_id)
+
+    # 마무리하는 동안 다른 요청이 임시 파일에 기록하지 못하도록 잠금
+    try:
+        buffer = await run_in_threadpool(open_partial_file, upload_id)
+    except UploadLocked:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
+            status_code=status.HTTP_409_CONFLICT,
             detail={
-                "type": "can not access",
-                "message": "You do not have permission"
+                "type": "conflict",
+                "message": "Another request is writing to this upload"
+            }
+        )
+    except FileNotFoundError:
+        raise resumable_upload_not_found(upload_id)
+
+    try:
+        partial_path: str = get_partial_path(upload_id)
+        offset: int = os.fstat(buffer.fileno()).st_size
+
+        if offset != upload_data["length"]:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "type": "conflict",
+                    "message": "Upload is not complete",
+                    "input": {
+                        "request_id": request_id,
+                        "upload_id": upload_id,
+                        "offset": offset,
+                        "length": upload_data["length"]
+                    }
+                },
+                headers={"Upload-Offset": str(offset)}
+            )
+
+        # 파일 내용 검사 (전체 파일을 받은 후 형식과 크기를 확인)
+        file_data: dict = await run_in_threadpool(inspect_image_file, partial_path, checker_size)
+
+        if file_data["size"] > max_image_size:
+            logger.warning(f"Image too large: {upload_data['file_name']}")
+            await async_delete_upload_session(upload_id)
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail={
+                    "type": "too large",
+                    "message": f"Image size exceeds the limit({max_image_size // 1024 // 1024}MB max).",
+                    "input": {
+                        "request_id": request_id,
+                        "file_name": upload_data["file_name"],
+                        "file_size": f"{file_data['size'] // 1024 // 1024}MB",
+                    }
+                }
+            )
+
+        if file_data["mime"] not in allowed_types:
+            logger.warning(f"Invalid file type: {file_data['mime'] or 'unknown'}")
+            await async_delete_upload_session(upload_id)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "type": "invalid value",
+                    "message": "Only image files can be uploaded",
+                    "input": {
+                        "request_id": request_id,
+                        "file_name": upload_data["file_name"],
+                        "file_type": file_data["mime"] or 'unknown'
+                    }
+                }
+            )
+
+        try:
+            result: dict = await register_uploaded_image(
+                request_id, upload_data["file_name"], partial_path,
+                file_data["size"], file_data["sha256"], file_data["mime"], background_tasks
+            )
+        except InvalidImage as error:
+            logger.warning(f"Invalid image: {upload_data['file_name']} ({str(error)})")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "type": "invalid value",
+                    "message": "The image file is damaged or not allowed",
+                    "input": {
+                        "request_id": request_id,
+                        "file_name": upload_data["file_name"],
+                        "file_type": file_data["mime"]
+                    }
+                }
+            )
+        except Exception as error:
+            logger.error(f"Image upload failed: {str(error)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "type": "internal server error",
+                    "message": "An error occurred while uploading the image"
+                }
+            )
+        finally:
+            await async_delete_upload_session(upload_id)
+
+        return {
+            "message": "Image uploaded successfully",
+            "result": result
+        }
+    finally:
+        await run_in_threadpool(close_partial_file, buffer)
+
+
+@app.delete("/upload/resumable/{upload_id}", status_code=status.HTTP_200_OK)
+async def cancel_resumable_upload(upload_id: str, request_id=Depends(Database.async_check_current_user)):
+    await load_resumable_upload(upload_id, request_id)
+    await async_delete_upload_session(upload_id)
+
+    return {
+        "message": "Upload canceled successfully",
+        "result": {
+            "request_id": request_id,
+            "upload_id": upload_id
+        }
+    }
+
+
+@app.get("/sign/{user_id}/{file_name}", status_code=status.HTTP_200_OK)
+async def sign_image(user_id: str, file_name: str, request_id=Depends(Database.async_check_current_user)):
+    # 이미지를 볼 수 있는 사용자만 서명된 URL을 발급받을 수 있음
+    await authorize_image_read(request_id, user_id)
+
+    signed_url: str = make_signed_image_url(user_id, file_name)
+
+    if not signed_url:
+        logger.error("URL signing keys are not configured")
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail={
+                "type": "not supported",
+                "message": "Signed URLs are not enabled"
             }
         )
 
-    # 해당 파일이 존재하는지 확인
-    file_path = os.path.join(image_storage, user_id, file_name)
+    return {
+        "message": "Signed URL issued successfully",
+        "result": {
+            "request_id": request_id,
+            "file_name": file_name,
+            "signed_path": signed_url,
+            "expires_in": signed_url_expire_time
+        }
+    }
+
 
-    if not os.path.exists(file_path):
-        logger.warning(f"Image not found: {file_path}")
+@app.post("/access/batch", status_code=status.HTTP_200_OK)
+async def get_images(body: BatchAccessRequest, request_id=Depends(Database.async_check_current_user)):
+    # 접근 권한 범위는 요청마다 한 번만 계산
+    request_data, accessible_id = await load_access_scope(request_id)
+
+    if len(body.images) > max_batch_access:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "type": "invalid value",
+                "message": f"Too many images in one request({max_batch_access} max).",
+                "input": {
+                    "request_id": request_id,
+                    "image_count": len(body.images)
+                }
+            }
+        )
+
+    # 이미지마다 권한과 존재 여부를 확인하고 메타데이터 모으기
+    results: list[dict] = []
+    entries: list[tuple[str, str, datetime]] = []
+
+    for image in body.images:
+        reference: dict = {"user_id": image.user_id, "file_name": image.file_name}
+
+        if not can_read_image(request_data, accessible_id, image.user_id):
+            results.append({"status": status.HTTP_403_FORBIDDEN, **reference})
+            continue
+
+        image_data: dict = await async_resolve_image_record(image.user_id, image.file_name)
+
+        if not image_data or image_data["pending"] or image_data["mime"] not in allowed_types:
+            results.append({"status": status.HTTP_404_NOT_FOUND, **reference})
+            continue
+
+        results.append({
+            "status": status.HTTP_200_OK,
+            **reference,
+            "file_type": image_data["mime"],
+            "file_size": image_data["size"],
+            "width": image_data["width"],
+            "height": image_data["height"],
+            "etag": make_etag(image_data["sha256"]),
+            "created_at": image_data["created_at"].isoformat(),
+            "file_path": f"{image_url}/access/{quote(image.user_id)}/{quote(image.file_name)}",
+            "signed_path": make_signed_image_url(image.user_id, image.file_name)
+        })
+        entries.append((
+            f"{image.user_id}/{image.file_name}",
+            image_data["path"],
+            image_data["created_at"]
+        ))
+
+    logger.info(f"Batch access: {len(entries)}/{len(results)} images for {request_id}")
+
+    # 압축 파일을 요청한 경우 접근 가능한 이미지를 읽는 대로 묶어서 전달 (디스크에 압축 파일을 만들지 않음)
+    if body.archive is not None:
+        unique_entries: list = list({name: (name, path, moment) for name, path, moment in entries}.values())
+        return StreamingResponse(
+            stream_archive(unique_entries, body.archive),
+            media_type=archive_media_types[body.archive],
+            headers={"Content-Disposition": f'attachment; filename="images.{body.archive.value}"'}
+        )
+
+    return {
+        "message": "Image manifest created successfully",
+        "result": {
+            "request_id": request_id,
+            "expires_in": signed_url_expire_time,
+            "images": results
+        }
+    }
+
+
+@app.get("/list", status_code=status.HTTP_200_OK)
+async def list_family_images(order: Order = Order.DESC, limit: int = Query(30, ge=1, le=max_list_limit),
+                             cursor: str | None = None, request_id=Depends(Database.async_check_current_user)):
+    # 요청한 사용자가 접근할 수 있는 모든 소유자의 이미지를 모아서 제공
+    _, accessible_id = await load_access_scope(request_id)
+
+    return await list_images_response(request_id, sorted(accessible_id), order, limit, cursor)
+
+
+@app.get("/list/{user_id}", status_code=status.HTTP_200_OK)
+async def list_user_images(user_id: str, order: Order = Order.DESC,
+                           limit: int = Query(30, ge=1, le=max_list_limit), cursor: str | None = None,
+                           request_id=Depends(Database.async_check_current_user)):
+    # 이미지를 볼 수 있는 사용자만 목록을 불러올 수 있음
+    await authorize_image_read(request_id, user_id)
+
+    return await list_images_response(request_id, [user_id], order, limit, cursor)
+
+
+@app.get("/access/{user_id}/{file_name}", status_code=status.HTTP_200_OK)
+async def get_image(request: Request, user_id: str, file_name: str,
+                    w: int | None = Query(None, ge=1, le=max_variant_size),
+                    h: int | None = Query(None, ge=1, le=max_variant_size),
+                    fit: ResizeFit = ResizeFit.CONTAIN,
+                    exp: int | None = None, kid: str | None = None, scope: str | None = None,
+                    sig: str | None = None):
+    # 서명된 URL은 HMAC 검증만으로 접근을 허용 (세션과 DB를 사용하지 않음)
+    if sig is not None:
+        request_id: str = f"signed:{kid}"
+
+        if exp is None or not verify_image_access(user_id, file_name, exp, kid or "", scope or "", sig):
+            logger.warning(f"Invalid image signature: {user_id}/{file_name}")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={
+                    "type": "can not access",
+                    "message": "The signed URL is invalid or expired"
+                }
+            )
+    else:
+        request_id: str = await Database.async_check_current_user(request)
+        await authorize_image_read(request_id, user_id)
+
+    # 색인에서 이미지 정보 불러오기 (색인 도입 이전의 파일은 한 번 검사한 후 색인에 등록)
+    with stage_timer("index"):
+        image_data: dict = await async_resolve_image_record(user_id, file_name)
+
+    # 검사가 끝나지 않은 이미지는 공개하지 않음 (IMAGE_VALIDATION=async)
+    if not image_data or image_data["pending"]:
+        logger.warning(f"Image not found: {user_id}/{file_name}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -226,15 +1289,8 @@ async def get_image(user_id: str, file_name: str, request_id=Depends(Database.ch
             }
         )
 
-    # 파일 종류 감지하기
-    file_type = None
-
-    with open(file_path, "rb") as buffer:
-        file_bytes = buffer.read(checker_size)
-        file_type = filetype.guess(file_bytes)
-
-    if file_type is None or file_type.mime not in allowed_types:
-        logger.error(f"Not image file: {file_type.mime if file_type else 'unknown'}")
+    if image_data["mime"] not in allowed_types:
+        logger.error(f"Not image file: {image_data['mime']}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -247,10 +1303,101 @@ async def get_image(user_id: str, file_name: str, request_id=Depends(Database.ch
             }
         )
 
+    file_path: str | None = None  # 원본 파일이 필요한 경우에만 로컬 경로를 준비 (S3 저장소는 내려받을 수 있음)
+    media_type: str = image_data["mime"]
+    content_id: str = image_data["sha256"]
+    content_size: int = image_data["size"]
+    cache_headers: dict = {"Cache-Control": f"public, max-age={cache_duration}"}
+
+    # 크기 변환을 요청한 경우 파생 이미지 Cache에서 제공 (없으면 새로 생성)
+    if w or h:
+        variant_key: str = make_variant_key(image_data["sha256"], image_data["mime"], w, h, fit.value)
+        content_id = variant_key
+
+        # 클라이언트의 Cache가 최신이면 파생 이미지를 만들지 않고 바로 응답
+        if is_not_modified(request.headers, make_etag(content_id), get_last_modified(image_data)):
+            return not_modified_response(content_id, image_data, cache_headers)
+
+        variant_data: dict = await get_or_create_variant(
+            variant_key, image_data["sha256"], await localize_image(image_data), image_data["mime"],
+            resize_image, image_data["mime"], w, h, fit
+        )
+
+        if not variant_data:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "type": "internal server error",
+                    "message": "An error occurred while resizing the image"
+                }
+            )
+
+        file_path = get_variant_path(variant_data)
+        media_type = variant_data["mime"]
+        content_size = variant_data["size"]
+
+    # 원본을 요청한 경우 클라이언트가 받을 수 있는 가장 작은 변환 형식을 제공
+    elif transcode_formats:
+        cache_headers["Vary"] = "Accept"
+        variant_data: dict = await select_transcoded_variant(image_data, request.headers.get("Accept"))
+
+        if variant_data:
+            file_path = get_variant_path(variant_data)
+            media_type = variant_data["mime"]
+            content_id = variant_data["key"]
+            content_size = variant_data["size"]
+
+    # 클라이언트의 Cache가 최신이면 파일을 열지 않고 304로 응답
+    if is_not_modified(request.headers, make_etag(content_id), get_last_modified(image_data)):
+        return not_modified_response(content_id, image_data, cache_headers)
+
+    # 검증 Header 설정 (Range 요청은 FileResponse에서 206으로 처리)
+    cache_headers.update({
+        "ETag": make_etag(content_id),
+        "Last-Modified": make_http_date(get_last_modified(image_data))
+    })
+
+    if file_path is None:
+        file_path = await localize_image(image_data)
+
     try:
-        cache_headers = {"Cache-Control": f"public, max-age={cache_duration}"}
+        # Nginx가 내부 경로로 파일을 직접 전달하도록 위임 (Python은 인증과 권한 확인만 수행)
+        if delivery_mode == "accel":
+            relative_path = os.path.relpath(file_path, image_storage)
+            return Response(
+                media_type=media_type,
+                headers={
+                    **cache_headers,
+                    "X-Accel-Redirect": f"{accel_redirect_prefix}/{quote(relative_path)}"
+                }
+            )
+
+        # 작은 이미지는 메모리 Cache에서 제공 (Range 요청은 FileResponse에서 처리)
+        if "range" not in request.headers and hot_image_cache.accepts(content_size):
+            sync_hot_image_cache()
+            cached_image = hot_image_cache.get(content_id)
+            if cached_image is not None:
+                return Response(content=cached_image[0], media_type=cached_image[1], headers=cache_headers)
+
+            with stage_timer("disk"):
+                image_bytes = await run_in_threadpool(
+                    load_hot_image, content_id, file_path, media_type, image_data["sha256"]
+                )
+            if image_bytes is not None:
+                return Response(content=image_bytes, media_type=media_type, headers=cache_headers)
 
-        return FileResponse(file_path, media_type=file_type.mime, headers=cache_headers)
+        # 파일이 있는지 미리 확인하여 응답을 보내는 도중에 실패하지 않도록 함 (확인한 정보는 FileResponse가 그대로 사용)
+        file_stat: os.stat_result = await run_in_threadpool(os.stat, file_path)
+        return FileResponse(file_path, media_type=media_type, headers=cache_headers, stat_result=file_stat)
+    except FileNotFoundError:
+        logger.error(f"Stored image not found: {user_id}/{file_name} ({image_data['path']})")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "type": "not found",
+                "message": "Image not found"
+            }
+        )
     except Exception as error:
         logger.error(f"Image access failed: {str(error)}")
         raise HTTPException(
@@ -263,9 +1410,9 @@ async def get_image(user_id: str, file_name: str, request_id=Depends(Database.ch
 
 
 @app.delete("/delete/{user_id}/{file_name}", status_code=status.HTTP_200_OK)
-async def delete_image(user_id: str, file_name: str, request_id=Depends(Database.check_current_user)):
+async def delete_image(user_id: str, file_name: str, request_id=Depends(Database.async_check_current_user)):
     # 시스템 계정을 제외한 이미지의 소유자만 삭제할 수 있음
-    request_data: dict = Database.get_one_account(request_id)
+    request_data: dict = await Database.async_get_one_account(request_id)
 
     if not request_data or (request_data["role"] != Role.SYSTEM and user_id != request_id):
         logger.warning(f"Can not delete image: {request_id}")
@@ -277,11 +1424,24 @@ async def delete_image(user_id: str, file_name: str, request_id=Depends(Database
             }
         )
 
-    # 해당 파일이 존재하는지 점검
-    file_path = os.path.join(image_storage, user_id, file_name)
+    # 해당 파일이 존재하는지 점검 (색인에 없으면 색인 도입 이전의 경로 확인)
+    with stage_timer("index"):
+        image_data: dict = await async_resolve_image_record(user_id, file_name)
+
+    if not image_data:
+        logger.warning(f"Image not found: {user_id}/{file_name}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "type": "not found",
+                "message": "Image not found"
+            }
+        )
 
-    if not os.path.exists(file_path):
-        logger.warning(f"Image not found: {file_path}")
+    # 색인 정보 삭제하기 (동시에 같은 이미지를 삭제한 경우 한 요청만 삭제하고 참조를 줄임)
+    deleted: int | None = await async_delete_image_record(user_id, file_name)
+    if deleted == 0:
+        logger.warning(f"Image already deleted: {user_id}/{file_name}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -291,8 +1451,17 @@ async def delete_image(user_id: str, file_name: str, request_id=Depends(Database
         )
 
     try:
-        # 파일 삭제하기
-        os.remove(file_path)
+        if deleted is None:
+            raise RuntimeError(f"Can not delete image record: {user_id}/{file_name}")
+
+        # 파일 삭제하기 (공유된 내용은 참조만 줄이고 마지막 참조일 때 삭제)
+        # 마지막 참조가 삭제된 경우 메모리 Cache에서도 원본과 파생 이미지를 비움
+        if is_blob_path(image_data["path"]):
+            if await async_release_blob(image_data["sha256"]):
+                invalidate_hot_image(image_data["sha256"])
+        else:
+            await run_in_threadpool(remove_quietly, os.path.join(image_storage, image_data["path"]))
+            invalidate_hot_image(image_data["sha256"])
 
         return {
             "message": "Image deleted successfully",
@@ -310,3 +1479,31 @@ async def delete_image(user_id: str, file_name: str, request_id=Depends(Database
                 "message": "An error occurred while deleting the image"
             }
         )
+
+
+# ========== 측정값 조회 ==========
+@app.get("/metrics", status_code=status.HTTP_200_OK, include_in_schema=False)
+async def get_metrics(authorization: str | None = Header(None)):
+    # 측정 기능이 꺼져 있으면 없는 경로로 처리
+    if not metrics_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "type": "not found",
+                "message": "Metrics are disabled"
+            }
+        )
+
+    # 수집용 Token 확인 (Token이 설정되지 않으면 측정 기능이 꺼지므로 항상 확인)
+    if not hmac.compare_digest((authorization or "").encode(), f"Bearer {metrics_token}".encode()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "type": "can not access",
+                "message": "You do not have permission"
+            }
+        )
+
+    # 모든 Worker의 측정값을 합쳐서 Prometheus Text 형식으로 응답
+    content: str = await run_in_threadpool(render_metrics)
+    return PlainTextResponse(content, media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,41 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Test Configuration
+
+외부 서비스(MariaDB, Nginx, S3) 없이 테스트를 실행하기 위한 설정
+설정 값은 모듈을 불러올 때 읽으므로, 테스트 모듈을 불러오기 전에 임시 작업 공간과 환경 변수를 준비함
+"""
+
+# Libraries
+import tempfile
+
+import pytest
+
+from Benchmarks.harness import prepare_environment, seed_database, running_app
+
+prepare_environment(
+    TRANSCODE_FORMATS="",
+    METRICS_DIR=tempfile.mkdtemp(prefix="carebot-metrics-"),
+    METRICS_TOKEN="test",
+    URL_SIGNING_KEYS="current:current-secret,previous:previous-secret"
+)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+# 가족 하나(주 사용자, 보조 사용자 하나)와 다른 가족 하나의 (사용자 ID, 세션 ID)
+@pytest.fixture(scope="session")
+def accounts() -> dict:
+    return seed_database(2, 1)
+
+
+# Lifespan을 실행한 Application에 요청을 보내는 Client (종료한 Worker Pool은 다시 시작할 수 없으므로 한 번만 실행)
+@pytest.fixture(scope="session")
+async def client(anyio_backend):
+    async with running_app() as client:
+        yield client
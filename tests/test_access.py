@@ -0,0 +1,101 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Image Access Tests
+
+이미지 조회(/access) 응답을 확인함 (조건부 요청, Range 요청, 저장된 파일이 없는 경우)
+"""
+
+# Libraries
+import hashlib
+import json
+import os
+
+import pytest
+
+from Benchmarks.harness import make_image
+
+
+async def upload_image(client, session_id: str, image: bytes) -> str:
+    status, _, body = await client.upload(session_id, image)
+    assert status == 201
+    return json.loads(body)["result"]["file_name"]
+
+
+@pytest.mark.anyio
+async def test_missing_stored_file_is_not_found(client, accounts):
+    import main
+    from Utilities.index_tools import get_image_record
+
+    user_id, session_id = accounts["main"][0]
+    image: bytes = make_image(80, 60)
+    file_name: str = await upload_image(client, session_id, image)
+
+    os.remove(os.path.join(main.image_storage, get_image_record(user_id, file_name)["path"]))
+    main.invalidate_hot_image(hashlib.sha256(image).hexdigest())
+
+    status, _, body = await client.request("GET", f"/access/{user_id}/{file_name}", session_id=session_id)
+    assert status == 404
+    assert json.loads(body)["detail"]["message"] == "Image not found"
+
+    status, _, _ = await client.request(
+        "GET", f"/access/{user_id}/{file_name}", {"Range": "bytes=0-9"}, session_id=session_id
+    )
+    assert status == 404
+
+
+@pytest.mark.anyio
+async def test_conditional_requests_are_answered_with_304(client, accounts):
+    user_id, session_id = accounts["main"][0]
+    image: bytes = make_image(90, 60)
+    file_name: str = await upload_image(client, session_id, image)
+    url: str = f"/access/{user_id}/{file_name}"
+
+    status, headers, body = await client.request("GET", url, session_id=session_id)
+    assert status == 200
+    assert body == image
+    etag, last_modified = headers["etag"], headers["last-modified"]
+
+    status, headers, body = await client.request("GET", url, {"If-None-Match": etag}, session_id=session_id)
+    assert (status, body, headers["etag"]) == (304, b"", etag)
+
+    status, _, body = await client.request("GET", url, {"If-Modified-Since": last_modified}, session_id=session_id)
+    assert (status, body) == (304, b"")
+
+    # If-None-Match가 있으면 If-Modified-Since보다 우선함
+    status, _, body = await client.request(
+        "GET", url, {"If-None-Match": '"other"', "If-Modified-Since": last_modified}, session_id=session_id
+    )
+    assert (status, body) == (200, image)
+
+
+@pytest.mark.anyio
+async def test_range_requests_return_partial_content(client, accounts):
+    user_id, session_id = accounts["main"][0]
+    image: bytes = make_image(90, 60)
+    file_name: str = await upload_image(client, session_id, image)
+    url: str = f"/access/{user_id}/{file_name}"
+
+    status, headers, _ = await client.request("GET", url, session_id=session_id)
+    etag: str = headers["etag"]
+
+    status, headers, body = await client.request("GET", url, {"Range": "bytes=10-19"}, session_id=session_id)
+    assert status == 206
+    assert body == image[10:20]
+    assert headers["content-range"] == f"bytes 10-19/{len(image)}"
+    assert headers["etag"] == etag
+
+    status, _, body = await client.request("GET", url, {"Range": "bytes=-5"}, session_id=session_id)
+    assert (status, body) == (206, image[-5:])
+
+    # 내용이 바뀐 경우(If-Range 불일치) 전체를 다시 보냄
+    status, _, body = await client.request(
+        "GET", url, {"Range": "bytes=0-9", "If-Range": '"other"'}, session_id=session_id
+    )
+    assert (status, body) == (200, image)
+
+    status, headers, _ = await client.request(
+        "GET", url, {"Range": f"bytes={len(image)}-"}, session_id=session_id
+    )
+    assert status == 416
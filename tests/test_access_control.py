@@ -0,0 +1,69 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Access Control Tests
+
+가족 구성원만 서로의 이미지를 볼 수 있고, 접근 권한 Cache는 비운 후에 바뀐 가족 관계를 반영하는지 확인함
+"""
+
+# Libraries
+import json
+
+import pytest
+
+from Benchmarks.harness import make_image, seed_database
+from Database.access import get_accessible_ids, invalidate_accessible_ids
+from Database.connector import database_instance as database
+from Database.models import MemberRelationsTable, Role
+
+
+def remove_member(user_id: str) -> None:
+    with database.get_pre_session()() as session:
+        session.query(MemberRelationsTable).filter(MemberRelationsTable.user_id == user_id).delete()
+        session.commit()
+
+
+def test_family_members_can_see_each_other():
+    family: dict = seed_database(1, 2)
+    main_id = family["main"][0][0]
+    sub_ids: list[str] = [account[0] for account in family["sub"]]
+
+    assert get_accessible_ids(main_id, Role.MAIN) == frozenset([main_id, *sub_ids])
+    assert get_accessible_ids(sub_ids[0], Role.SUB) == frozenset([sub_ids[0], main_id])
+
+
+def test_removed_member_keeps_cached_access_until_invalidated():
+    family: dict = seed_database(1, 1)
+    main_id, sub_id = family["main"][0][0], family["sub"][0][0]
+    get_accessible_ids(main_id, Role.MAIN)
+    get_accessible_ids(sub_id, Role.SUB)
+
+    remove_member(sub_id)
+    assert get_accessible_ids(sub_id, Role.SUB) == frozenset([sub_id, main_id])
+
+    invalidate_accessible_ids(sub_id)
+    invalidate_accessible_ids(main_id)
+    assert get_accessible_ids(sub_id, Role.SUB) == frozenset([sub_id])
+    assert get_accessible_ids(main_id, Role.MAIN) == frozenset([main_id])
+
+
+@pytest.mark.anyio
+async def test_image_access_follows_family(client, accounts):
+    main_id, main_session = accounts["main"][0]
+    _, sub_session = accounts["sub"][0]
+    _, other_session = accounts["sub"][1]
+    _, system_session = accounts["system"][0]
+    image: bytes = make_image(32, 48)
+
+    status, _, body = await client.upload(main_session, image)
+    url: str = f"/access/{main_id}/{json.loads(body)['result']['file_name']}"
+
+    for session_id, expected in ((sub_session, 200), (system_session, 200), (other_session, 403)):
+        status, _, body = await client.request("GET", url, session_id=session_id)
+        assert status == expected
+        if expected == 200:
+            assert body == image
+
+    status, _, _ = await client.request("GET", f"/list/{main_id}", session_id=other_session)
+    assert status == 403
@@ -0,0 +1,72 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Admission Control Tests
+
+남겨둔 자리는 높은 우선 순위 요청만 사용하고, 자리가 나면 높은 우선 순위의 대기 요청부터 들어가는지 확인함
+"""
+
+# Libraries
+import asyncio
+
+import pytest
+
+from Utilities.admission_tools import AdmissionController, AdmissionRejected, Priority
+
+
+async def enter(controller: AdmissionController, priority: Priority, name: str, order: list[str]) -> None:
+    await controller.acquire(priority)
+    order.append(name)
+
+
+@pytest.mark.anyio
+async def test_reserved_slot_is_only_for_high_priority():
+    controller = AdmissionController("test", limit=2, high_reserved=1, queue_timeout=0.05)
+    await controller.acquire(Priority.NORMAL)
+
+    with pytest.raises(AdmissionRejected) as error:
+        await controller.acquire(Priority.NORMAL)
+    assert error.value.status_code == 503
+
+    await asyncio.wait_for(controller.acquire(Priority.HIGH), timeout=1)
+    assert controller.stats() == {"high": {"in_flight": 1, "queued": 0}, "normal": {"in_flight": 1, "queued": 0}}
+
+
+@pytest.mark.anyio
+async def test_high_priority_waiters_enter_first():
+    controller = AdmissionController("test", limit=1, high_reserved=0)
+    await controller.acquire(Priority.NORMAL)
+    order: list[str] = []
+
+    tasks = [
+        asyncio.create_task(enter(controller, Priority.NORMAL, "normal-1", order)),
+        asyncio.create_task(enter(controller, Priority.NORMAL, "normal-2", order)),
+    ]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(enter(controller, Priority.HIGH, "high", order)))
+    await asyncio.sleep(0)
+    assert controller.stats()["high"]["queued"] == 1
+
+    # 자리를 돌려줄 때마다 다음 대기 요청이 하나씩 들어감
+    for priority in (Priority.NORMAL, Priority.HIGH, Priority.NORMAL):
+        controller.release(priority)
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+
+    assert order == ["high", "normal-1", "normal-2"]
+
+
+@pytest.mark.anyio
+async def test_full_queue_is_rejected_immediately():
+    controller = AdmissionController("test", limit=1, high_reserved=0, queue_size=1, queue_timeout=1)
+    await controller.acquire(Priority.NORMAL)
+    waiting = asyncio.create_task(controller.acquire(Priority.NORMAL))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected) as error:
+        await controller.acquire(Priority.NORMAL)
+    assert error.value.status_code == 429
+
+    controller.release(Priority.NORMAL)
+    await waiting
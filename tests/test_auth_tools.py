@@ -0,0 +1,100 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Signed Image URL Tests
+
+서명은 "scope\\nuser\\nfile\\nexp\\nkid"에 대한 HMAC-SHA256이며, 첫 번째 키로 서명하고 모든 키로 검증함
+"""
+
+# Libraries
+from time import time
+import base64
+import hashlib
+import hmac
+import json
+
+import pytest
+
+from Benchmarks.harness import make_image
+from Utilities.auth_tools import SignatureScope, sign_image_access, verify_image_access
+
+
+def expected_signature(secret: bytes, message: str) -> str:
+    digest: bytes = hmac.new(secret, message.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def verify(user_id: str, file_name: str, signature: dict) -> bool:
+    return verify_image_access(user_id, file_name, signature["exp"], signature["kid"], signature["scope"],
+                               signature["sig"])
+
+
+def test_signature_covers_scope_user_file_expiry_and_key():
+    signature: dict = sign_image_access("user", "photo.jpg", expire_time=60)
+
+    assert signature["kid"] == "current"
+    assert signature["scope"] == SignatureScope.READ.value
+    assert int(time()) < signature["exp"] <= int(time()) + 60
+    assert signature["sig"] == expected_signature(
+        b"current-secret", f"read\nuser\nphoto.jpg\n{signature['exp']}\ncurrent"
+    )
+    assert verify("user", "photo.jpg", signature)
+
+
+@pytest.mark.parametrize("field, value", [
+    ("user", "other"),
+    ("file", "other.jpg"),
+    ("exp", 1),
+    ("scope", "write"),
+    ("kid", "previous"),
+    ("kid", "unknown"),
+    ("sig", "A" * 43),
+])
+def test_tampered_signature_is_rejected(field, value):
+    signature: dict = sign_image_access("user", "photo.jpg")
+    user_id, file_name = "user", "photo.jpg"
+
+    if field == "user":
+        user_id = value
+    elif field == "file":
+        file_name = value
+    else:
+        signature[field] = value
+
+    assert not verify(user_id, file_name, signature)
+
+
+def test_expired_signature_is_rejected():
+    expires: int = int(time()) - 1
+    signature: str = expected_signature(b"current-secret", f"read\nuser\nphoto.jpg\n{expires}\ncurrent")
+
+    assert not verify_image_access("user", "photo.jpg", expires, "current", "read", signature)
+
+
+def test_previous_key_still_verifies():
+    expires: int = int(time()) + 60
+    signature: str = expected_signature(b"previous-secret", f"read\nuser\nphoto.jpg\n{expires}\nprevious")
+
+    assert verify_image_access("user", "photo.jpg", expires, "previous", "read", signature)
+
+
+@pytest.mark.anyio
+async def test_signed_url_grants_access_without_session(client, accounts):
+    user_id, session_id = accounts["main"][0]
+    image: bytes = make_image(64, 64)
+    status, _, body = await client.upload(session_id, image)
+    assert status == 201
+    file_name: str = json.loads(body)["result"]["file_name"]
+
+    status, _, body = await client.request("GET", f"/sign/{user_id}/{file_name}", session_id=session_id)
+    assert status == 200
+    signed_url: str = json.loads(body)["result"]["signed_path"]
+    path: str = signed_url[signed_url.index("/access/"):]
+
+    status, _, body = await client.request("GET", path)
+    assert status == 200
+    assert body == image
+
+    status, _, _ = await client.request("GET", path.replace(file_name, "other.jpg"))
+    assert status == 403
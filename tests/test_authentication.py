@@ -0,0 +1,130 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Session Authentication Tests
+
+세션 Cache는 DB 조회 없이 사용자를 식별하고, 만료되거나 정리된 세션은 Cache에서도 비워지는지 확인함
+최근 접근 기록은 모아두었다가 한 번에 반영하며, 반영 전에도 만료 판정에 사용되는지 확인함
+"""
+
+# Libraries
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from Benchmarks.harness import seed_database
+from Database.authentication import (session_cache, activity_buffer, session_expire_time, session_expire_skew,
+                                     load_current_user, cleanup_login_sessions, touch_session,
+                                     flush_session_activity)
+from Database.connector import database_instance as database
+from Database.models import LoginSessionsTable
+from Utilities.cache_tools import WriteBehindBuffer
+
+
+# 마지막 접근 시각을 바꾸는 기능 (이 Worker에 남은 접근 기록도 비워 오래 사용하지 않은 세션으로 만듦)
+def set_last_active(session_id: str, last_active: datetime) -> None:
+    activity_buffer.discard(session_id)
+    with database.get_pre_session()() as session:
+        session.query(LoginSessionsTable).filter(LoginSessionsTable.xid == session_id).update({
+            LoginSessionsTable.last_active: last_active.replace(tzinfo=None)
+        }, synchronize_session=False)
+        session.commit()
+
+
+def delete_session(session_id: str) -> None:
+    with database.get_pre_session()() as session:
+        session.query(LoginSessionsTable).filter(LoginSessionsTable.xid == session_id).delete()
+        session.commit()
+
+
+def get_last_active(session_id: str) -> datetime:
+    with database.get_pre_session()() as session:
+        last_active: datetime = session.query(LoginSessionsTable.last_active).filter(
+            LoginSessionsTable.xid == session_id
+        ).scalar()
+        return last_active.replace(tzinfo=timezone.utc)
+
+
+def expired_time() -> datetime:
+    return datetime.now(tz=timezone.utc) - timedelta(seconds=session_expire_time + session_expire_skew + 60)
+
+
+@pytest.mark.anyio
+async def test_cached_session_is_used_until_invalidated(client):
+    family: dict = seed_database(1, 0)
+    user_id, session_id = family["main"][0]
+
+    status, _, _ = await client.request("GET", f"/list/{user_id}", session_id=session_id)
+    assert status == 200
+    assert session_cache.get(session_id) == user_id
+
+    # 다른 서비스에서 로그아웃한 경우에도 Cache가 남아 있는 동안은 DB를 조회하지 않음
+    delete_session(session_id)
+    status, _, _ = await client.request("GET", f"/list/{user_id}", session_id=session_id)
+    assert status == 200
+
+    session_cache.invalidate(session_id)
+    status, _, _ = await client.request("GET", f"/list/{user_id}", session_id=session_id)
+    assert status == 403
+
+
+def test_expired_sub_session_is_removed():
+    family: dict = seed_database(1, 1)
+    sub_id, session_id = family["sub"][0]
+    assert load_current_user(session_id) == sub_id
+
+    session_cache.invalidate(session_id)
+    set_last_active(session_id, expired_time())
+
+    assert load_current_user(session_id) == ""
+    assert session_cache.get(session_id) is None
+    assert load_current_user(session_id) == ""
+
+
+def test_cleanup_invalidates_cached_sessions():
+    family: dict = seed_database(1, 1)
+    sub_id, session_id = family["sub"][0]
+    main_id, main_session_id = family["main"][0]
+    load_current_user(session_id)
+    load_current_user(main_session_id)
+    set_last_active(session_id, expired_time())
+    set_last_active(main_session_id, expired_time())
+
+    assert cleanup_login_sessions() >= 1
+    assert session_cache.get(session_id) is None
+    assert session_cache.get(main_session_id) == main_id  # 주 사용자 세션은 만료되지 않음
+
+
+def test_write_behind_buffer_keeps_latest_touch():
+    buffer = WriteBehindBuffer(max_size=2)
+
+    assert buffer.touch("a", 10) is False
+    assert buffer.touch("a", 5) is False
+    assert buffer.pending("a") == 10
+    assert buffer.touch("b", 20) is True  # 가득 차면 바로 반영하도록 알림
+
+    drained: dict = buffer.drain()
+    assert drained == {"a": 10, "b": 20} and len(buffer) == 0
+
+    buffer.touch("a", 30)
+    buffer.restore(drained)  # 반영에 실패한 기록을 되돌려도 더 최근 기록은 유지
+    assert buffer.pending("a") == 30 and buffer.pending("b") == 20
+
+
+def test_session_activity_is_written_on_flush():
+    family: dict = seed_database(1, 1)
+    sub_id, session_id = family["sub"][0]
+    stale: datetime = expired_time()
+    set_last_active(session_id, stale)
+
+    touch_session(session_id)
+    assert get_last_active(session_id) == stale  # 바로 기록하지 않음
+
+    # 아직 반영하지 않은 접근 기록이 있으므로 만료되지 않음
+    session_cache.invalidate(session_id)
+    assert load_current_user(session_id) == sub_id
+
+    assert flush_session_activity() >= 1
+    assert activity_buffer.pending(session_id) == 0
+    assert get_last_active(session_id) > stale
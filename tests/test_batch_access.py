@@ -0,0 +1,94 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Batch Access Tests
+
+여러 이미지를 한 번에 조회(/access/batch)할 때 이미지마다 권한과 존재 여부가 나뉘어 전달되고,
+요청한 경우 접근 가능한 이미지만 압축 파일로 묶이는지 확인함
+"""
+
+# Libraries
+from io import BytesIO
+import json
+import tarfile
+import zipfile
+
+import pytest
+
+from Benchmarks.harness import make_image
+
+
+async def upload_image(client, session_id: str, image: bytes) -> str:
+    status, _, body = await client.upload(session_id, image)
+    assert status == 201
+    return json.loads(body)["result"]["file_name"]
+
+
+async def access_batch(client, session_id: str, images: list[tuple[str, str]],
+                       archive: str = None) -> tuple[int, dict, bytes]:
+    payload: dict = {"images": [{"user_id": user_id, "file_name": file_name} for user_id, file_name in images]}
+    if archive is not None:
+        payload["archive"] = archive
+
+    return await client.request(
+        "POST", "/access/batch", {"content-type": "application/json"}, json.dumps(payload).encode(),
+        session_id=session_id
+    )
+
+
+@pytest.mark.anyio
+async def test_manifest_reports_each_image(client, accounts):
+    user_id, session_id = accounts["main"][0]
+    other_id, other_session_id = accounts["main"][1]
+    file_name: str = await upload_image(client, session_id, make_image(48, 32))
+    other_name: str = await upload_image(client, other_session_id, make_image(32, 32))
+
+    status, _, body = await access_batch(client, session_id, [
+        (user_id, file_name), (user_id, "missing.jpg"), (other_id, other_name)
+    ])
+    assert status == 200
+
+    images: list[dict] = json.loads(body)["result"]["images"]
+    assert [image["status"] for image in images] == [200, 404, 403]
+    assert (images[0]["width"], images[0]["height"]) == (48, 32)
+
+    # 목록의 ETag는 단일 조회의 ETag와 같음
+    _, headers, _ = await client.request("GET", f"/access/{user_id}/{file_name}", session_id=session_id)
+    assert images[0]["etag"] == headers["etag"]
+
+
+@pytest.mark.anyio
+async def test_archives_contain_only_accessible_images(client, accounts):
+    user_id, session_id = accounts["main"][0]
+    other_id, other_session_id = accounts["main"][1]
+    image: bytes = make_image(40, 40)
+    file_name: str = await upload_image(client, session_id, image)
+    other_name: str = await upload_image(client, other_session_id, make_image(24, 24))
+    images: list[tuple[str, str]] = [(user_id, file_name), (user_id, file_name), (other_id, other_name)]
+
+    status, headers, body = await access_batch(client, session_id, images, "zip")
+    assert status == 200
+    assert headers["content-type"] == "application/zip"
+    with zipfile.ZipFile(BytesIO(body)) as archive:
+        assert archive.namelist() == [f"{user_id}/{file_name}"]
+        assert archive.read(f"{user_id}/{file_name}") == image
+
+    status, headers, body = await access_batch(client, session_id, images, "tar")
+    assert status == 200
+    assert headers["content-type"] == "application/x-tar"
+    with tarfile.open(fileobj=BytesIO(body)) as archive:
+        assert archive.getnames() == [f"{user_id}/{file_name}"]
+        assert archive.extractfile(f"{user_id}/{file_name}").read() == image
+
+
+@pytest.mark.anyio
+async def test_batch_access_limits_image_count(client, accounts, monkeypatch):
+    import main
+
+    user_id, session_id = accounts["main"][0]
+    monkeypatch.setattr(main, "max_batch_access", 2)
+
+    status, _, body = await access_batch(client, session_id, [(user_id, f"image-{index}.jpg") for index in range(3)])
+    assert status == 400
+    assert json.loads(body)["detail"]["input"]["image_count"] == 3
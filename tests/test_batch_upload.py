@@ -0,0 +1,73 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Batch Upload Tests
+
+여러 이미지를 한 번에 업로드(/upload/batch)할 때 파일마다 결과가 나뉘어 전달되는지 확인함
+"""
+
+# Libraries
+import json
+
+import pytest
+
+import main
+from Benchmarks.harness import make_image, make_multipart
+
+
+async def upload_batch(client, session_id: str, files: list[tuple[str, bytes, str]]) -> tuple[int, dict]:
+    body, content_type = make_multipart([("files", name, data, mime) for name, data, mime in files])
+    status, _, response = await client.request(
+        "POST", "/upload/batch", {"content-type": content_type}, body, session_id=session_id
+    )
+    return status, json.loads(response)
+
+
+@pytest.mark.anyio
+async def test_batch_upload_saves_every_file(client, accounts):
+    user_id, session_id = accounts["main"][0]
+    status, body = await upload_batch(client, session_id, [
+        ("batch.jpg", make_image(40, 40), "image/jpeg"),
+        ("batch.jpg", make_image(50, 50), "image/jpeg"),
+        ("other.jpg", make_image(60, 60), "image/jpeg")
+    ])
+
+    assert status == 201
+    assert (body["result"]["uploaded"], body["result"]["failed"]) == (3, 0)
+
+    # 같은 이름의 파일도 서로 다른 이름으로 저장됨
+    file_names: set[str] = {result["result"]["file_name"] for result in body["result"]["files"]}
+    assert len(file_names) == 3
+
+    for file_name in file_names:
+        status, _, _ = await client.request("GET", f"/access/{user_id}/{file_name}", session_id=session_id)
+        assert status == 200
+
+
+@pytest.mark.anyio
+async def test_batch_upload_reports_partial_failure(client, accounts):
+    _, session_id = accounts["main"][0]
+    status, body = await upload_batch(client, session_id, [
+        ("good.jpg", make_image(40, 40), "image/jpeg"),
+        ("notes.txt", b"not an image", "text/plain")
+    ])
+
+    assert status == 207
+    assert (body["result"]["uploaded"], body["result"]["failed"]) == (1, 1)
+
+    failed: dict = body["result"]["files"][1]
+    assert failed["file_name"] == "notes.txt"
+    assert failed["status"] >= 400
+
+
+@pytest.mark.anyio
+async def test_batch_upload_limits_file_count(client, accounts, monkeypatch):
+    _, session_id = accounts["main"][0]
+    monkeypatch.setattr(main, "max_batch_files", 2)
+
+    status, body = await upload_batch(client, session_id, [
+        (f"image-{index}.jpg", make_image(20, 20), "image/jpeg") for index in range(3)
+    ])
+    assert status == 400
+    assert body["detail"]["input"]["file_count"] == 3
@@ -0,0 +1,202 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Content Addressed Blob Tests
+
+같은 내용은 한 번만 저장되고, 마지막 참조가 해제될 때만 파일이 삭제되는지 확인함
+"""
+
+# Libraries
+import hashlib
+import json
+import os
+import sqlite3
+import uuid
+
+import pytest
+
+from Benchmarks.harness import make_image
+from Utilities import blob_tools
+from Utilities.blob_tools import BlobsTable, blob_storage, store_blob, release_blob
+from Utilities.index_tools import index_instance
+from Utilities.storage_tools import storage_backend
+
+
+def write_temp_file(data: bytes) -> str:
+    temp_path: str = os.path.join(blob_storage, f".upload_{uuid.uuid4().hex}.tmp")
+    with open(temp_path, "wb") as buffer:
+        buffer.write(data)
+    return temp_path
+
+
+def get_refcount(sha256: str) -> int | None:
+    with index_instance.get_pre_session()() as session:
+        return session.query(BlobsTable.refcount).filter(BlobsTable.sha256 == sha256).scalar()
+
+
+def test_same_content_is_stored_once():
+    data: bytes = os.urandom(1024)
+    sha256: str = hashlib.sha256(data).hexdigest()
+    first_temp, second_temp = write_temp_file(data), write_temp_file(data)
+
+    first_path: str = store_blob(first_temp, sha256, len(data))
+    second_path: str = store_blob(second_temp, sha256, len(data))
+
+    assert first_path == second_path
+    assert get_refcount(sha256) == 2
+    assert storage_backend.get(first_path) == data
+    assert not os.path.exists(first_temp) and not os.path.exists(second_temp)
+
+
+def test_file_is_removed_with_last_reference():
+    data: bytes = os.urandom(1024)
+    sha256: str = hashlib.sha256(data).hexdigest()
+    relative_path: str = store_blob(write_temp_file(data), sha256, len(data))
+    store_blob(write_temp_file(data), sha256, len(data))
+
+    assert release_blob(sha256) is False
+    assert get_refcount(sha256) == 1
+    assert storage_backend.stat(relative_path) == len(data)
+
+    assert release_blob(sha256) is True
+    assert get_refcount(sha256) is None
+    assert storage_backend.stat(relative_path) is None
+
+
+def test_released_content_can_be_stored_again():
+    data: bytes = os.urandom(1024)
+    sha256: str = hashlib.sha256(data).hexdigest()
+    store_blob(write_temp_file(data), sha256, len(data))
+    release_blob(sha256)
+
+    relative_path: str = store_blob(write_temp_file(data), sha256, len(data))
+
+    assert get_refcount(sha256) == 1
+    assert storage_backend.get(relative_path) == data
+
+
+def test_unknown_blob_release_is_ignored():
+    assert release_blob(hashlib.sha256(os.urandom(16)).hexdigest()) is False
+
+
+@pytest.mark.anyio
+async def test_deleting_one_upload_keeps_shared_content(client, accounts):
+    user_id, session_id = accounts["main"][0]
+    image: bytes = make_image(64, 64)
+    sha256: str = hashlib.sha256(image).hexdigest()
+
+    file_names: list[str] = []
+    for _ in range(2):
+        status, _, body = await client.upload(session_id, image)
+        assert status == 201
+        file_names.append(json.loads(body)["result"]["file_name"])
+    assert get_refcount(sha256) == 2
+
+    status, _, _ = await client.request("DELETE", f"/delete/{user_id}/{file_names[0]}", session_id=session_id)
+    assert status == 200
+    assert get_refcount(sha256) == 1
+
+    status, _, body = await client.request("GET", f"/access/{user_id}/{file_names[1]}", session_id=session_id)
+    assert status == 200
+    assert body == image
+
+    status, _, _ = await client.request("DELETE", f"/delete/{user_id}/{file_names[1]}", session_id=session_id)
+    assert status == 200
+    assert get_refcount(sha256) is None
+
+
+def test_blob_is_uploaded_outside_the_index_transaction(monkeypatch):
+    data: bytes = os.urandom(1024)
+    sha256: str = hashlib.sha256(data).hexdigest()
+    put_file = storage_backend.put_file
+    observed: dict = {}
+
+    # 저장하는 동안 정보는 이미 등록되어 있고, 다른 연결이 바로 색인에 쓸 수 있어야 함
+    def checked_put_file(source_path: str, key: str) -> None:
+        observed["refcount"] = get_refcount(sha256)
+        connection = sqlite3.connect(index_instance.engine.url.database, timeout=0)
+        try:
+            connection.execute("UPDATE blobs SET refcount = refcount WHERE sha256 = ?", (sha256,))
+            connection.commit()
+            observed["writable"] = True
+        finally:
+            connection.close()
+        put_file(source_path, key)
+
+    monkeypatch.setattr(storage_backend, "put_file", checked_put_file)
+    relative_path: str = store_blob(write_temp_file(data), sha256, len(data))
+
+    assert observed == {"refcount": 1, "writable": True}
+    assert storage_backend.get(relative_path) == data
+
+
+def test_failed_upload_releases_the_reference(monkeypatch):
+    data: bytes = os.urandom(1024)
+    sha256: str = hashlib.sha256(data).hexdigest()
+    temp_path: str = write_temp_file(data)
+
+    def failing_put_file(source_path: str, key: str) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage_backend, "put_file", failing_put_file)
+    with pytest.raises(OSError):
+        store_blob(temp_path, sha256, len(data))
+
+    assert get_refcount(sha256) is None
+    assert not os.path.exists(temp_path)
+
+
+@pytest.mark.anyio
+async def test_repeated_delete_releases_shared_content_once(client, accounts):
+    user_id, session_id = accounts["main"][0]
+    other_id, other_session_id = accounts["main"][1]
+    image: bytes = make_image(72, 72)
+    sha256: str = hashlib.sha256(image).hexdigest()
+
+    status, _, body = await client.upload(session_id, image)
+    file_name: str = json.loads(body)["result"]["file_name"]
+    status, _, body = await client.upload(other_session_id, image)
+    other_file_name: str = json.loads(body)["result"]["file_name"]
+    assert get_refcount(sha256) == 2
+
+    # 시간 초과 후 다시 보낸 삭제 요청은 참조를 다시 줄이지 않음
+    status, _, _ = await client.request("DELETE", f"/delete/{user_id}/{file_name}", session_id=session_id)
+    assert status == 200
+    status, _, _ = await client.request("DELETE", f"/delete/{user_id}/{file_name}", session_id=session_id)
+    assert status == 404
+    assert get_refcount(sha256) == 1
+
+    status, _, body = await client.request("GET", f"/access/{other_id}/{other_file_name}", session_id=other_session_id)
+    assert status == 200
+    assert body == image
+
+
+def test_content_registered_during_release_is_kept(monkeypatch):
+    data: bytes = os.urandom(1024)
+    sha256: str = hashlib.sha256(data).hexdigest()
+    relative_path: str = store_blob(write_temp_file(data), sha256, len(data))
+    get_pre_session = index_instance.get_pre_session
+    removed_variants: list[str] = []
+    calls: int = 0
+
+    # 정보를 삭제한 후 파일을 삭제하기 전에 같은 내용이 다시 등록되는 경우
+    def interleaved_pre_session():
+        pre_session = get_pre_session()
+
+        def make_session():
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                store_blob(write_temp_file(data), sha256, len(data))
+            return pre_session()
+
+        return make_session
+
+    monkeypatch.setattr(index_instance, "get_pre_session", interleaved_pre_session)
+    monkeypatch.setattr(blob_tools, "remove_source_variants", removed_variants.append)
+
+    assert release_blob(sha256) is False
+    assert get_refcount(sha256) == 1
+    assert storage_backend.get(relative_path) == data
+    assert removed_variants == []
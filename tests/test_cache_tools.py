@@ -0,0 +1,81 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Memory Cache Tests
+
+메모리 Cache의 한도, 만료, 삭제와 자주 조회되는 이미지 Cache의 제공/비우기를 확인함
+"""
+
+# Libraries
+import hashlib
+import json
+import os
+
+import pytest
+
+from Benchmarks.harness import make_image
+from Utilities.cache_tools import ByteLRUCache
+
+
+def test_byte_cache_evicts_least_recently_used():
+    cache = ByteLRUCache(max_bytes=10, max_item_bytes=6)
+    cache.set("a", b"aaaa", 4)
+    cache.set("b", b"bbbb", 4)
+    cache.get("a")
+    cache.set("c", b"cccc", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    assert cache.stats()["bytes"] == 8
+
+
+def test_byte_cache_rejects_large_items():
+    cache = ByteLRUCache(max_bytes=10, max_item_bytes=6)
+
+    assert not cache.accepts(7)
+    assert cache.set("large", b"x" * 7, 7) is False
+    assert cache.stats()["size"] == 0
+
+
+def test_byte_cache_invalidates_by_tag():
+    cache = ByteLRUCache(max_bytes=100, max_item_bytes=100)
+    cache.set("source", b"source", 6, tag="hash")
+    cache.set("variant", b"variant", 7, tag="hash")
+    cache.set("other", b"other", 5, tag="other")
+
+    cache.invalidate_tag("hash")
+
+    assert cache.get("source") is None and cache.get("variant") is None
+    assert cache.get("other") == b"other"
+    assert cache.stats()["bytes"] == 5
+
+
+@pytest.mark.anyio
+async def test_hot_image_is_served_from_memory_until_deleted(client, accounts):
+    import main
+    from Utilities.index_tools import get_image_record
+
+    user_id, session_id = accounts["main"][0]
+    image: bytes = make_image(40, 40)
+    sha256: str = hashlib.sha256(image).hexdigest()
+    status, _, body = await client.upload(session_id, image)
+    file_name: str = json.loads(body)["result"]["file_name"]
+    url: str = f"/access/{user_id}/{file_name}"
+    file_path: str = os.path.join(main.image_storage, get_image_record(user_id, file_name)["path"])
+
+    # 업로드 직후 Cache에 보관되므로 파일을 읽지 않고 제공
+    hits: int = main.hot_image_cache.stats()["hits"]
+    os.rename(file_path, file_path + ".moved")
+    try:
+        status, headers, body = await client.request("GET", url, session_id=session_id)
+        assert (status, body) == (200, image)
+        assert headers["etag"]
+        assert main.hot_image_cache.stats()["hits"] == hits + 1
+    finally:
+        os.rename(file_path + ".moved", file_path)
+
+    status, _, _ = await client.request("DELETE", f"/delete/{user_id}/{file_name}", session_id=session_id)
+    assert status == 200
+    assert main.hot_image_cache.get(sha256) is None
@@ -0,0 +1,154 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Image Index Tests
+
+색인 레코드는 덮어쓰지 않고, 삭제는 실제로 삭제한 요청만 알 수 있는지 확인함
+목록은 여러 소유자의 이미지를 (업로드 시각, 소유자 ID, 파일명) 순서로 빠짐없이 나누어 제공하는지 확인함
+"""
+
+# Libraries
+from datetime import datetime, timedelta
+import json
+import uuid
+
+import pytest
+
+from Database.models import Order
+from Benchmarks.harness import make_image
+from Utilities.index_tools import add_image_record, delete_image_record, get_image_record, list_image_records
+
+
+def make_record(owner_id: str, file_name: str, sha256: str) -> dict:
+    return {
+        "owner_id": owner_id,
+        "file_name": file_name,
+        "path": f".blobs/{sha256}",
+        "mime": "image/jpeg",
+        "size": 10,
+        "sha256": sha256,
+        "width": 1,
+        "height": 1,
+        "created_at": datetime(2025, 1, 31, 12, 0, 0)
+    }
+
+
+def test_same_name_is_not_overwritten():
+    owner_id: str = uuid.uuid4().hex[:16]
+    first: dict = add_image_record(make_record(owner_id, "capture.jpg", "a" * 64), rename=True)
+    second: dict = add_image_record(make_record(owner_id, "capture.jpg", "b" * 64), rename=True)
+
+    assert first["file_name"] == "capture.jpg"
+    assert second["file_name"] == "capture_1.jpg"
+    assert get_image_record(owner_id, "capture.jpg")["sha256"] == "a" * 64
+    assert get_image_record(owner_id, "capture_1.jpg")["sha256"] == "b" * 64
+
+
+def test_same_name_without_rename_fails():
+    owner_id: str = uuid.uuid4().hex[:16]
+    add_image_record(make_record(owner_id, "capture.jpg", "a" * 64))
+
+    assert add_image_record(make_record(owner_id, "capture.jpg", "b" * 64)) == {}
+    assert get_image_record(owner_id, "capture.jpg")["sha256"] == "a" * 64
+
+
+def test_delete_reports_removed_rows():
+    owner_id: str = uuid.uuid4().hex[:16]
+    add_image_record(make_record(owner_id, "capture.jpg", "a" * 64))
+
+    assert delete_image_record(owner_id, "capture.jpg") == 1
+    assert delete_image_record(owner_id, "capture.jpg") == 0
+    assert get_image_record(owner_id, "capture.jpg") == {}
+
+
+def read_all_pages(owner_ids: list[str], order: Order, limit: int) -> list[list[tuple[str, str]]]:
+    pages: list[list[tuple[str, str]]] = []
+    cursor: str | None = None
+
+    while True:
+        images, cursor = list_image_records(owner_ids, order, limit, cursor)
+        pages.append([(image_data["owner_id"], image_data["file_name"]) for image_data in images])
+        if cursor is None:
+            return pages
+
+
+@pytest.fixture(scope="module")
+def listed_records() -> tuple[list[str], list[tuple[str, str]]]:
+    """
+    두 소유자의 이미지 7개 (같은 시각에 올린 이미지와 공개하지 않은 이미지 포함)
+    :return: 소유자 ID 목록과 오름차순으로 정렬된 공개 이미지 (소유자 ID, 파일명) 목록
+    """
+    owner_ids: list[str] = sorted(uuid.uuid4().hex[:16] for _ in range(2))
+    started = datetime(2025, 1, 31, 12, 0, 0)
+    expected: list[tuple] = []
+
+    for index in range(7):
+        owner_id: str = owner_ids[index % 2]
+        created_at = started + timedelta(seconds=index // 2)  # 두 개씩 같은 시각
+        record: dict = {**make_record(owner_id, f"capture_{index}.jpg", "c" * 64), "created_at": created_at}
+        add_image_record(record)
+        expected.append((created_at, owner_id, record["file_name"]))
+
+    add_image_record({**make_record(owner_ids[0], "pending.jpg", "d" * 64), "pending": True})
+
+    return owner_ids, [(owner_id, file_name) for _, owner_id, file_name in sorted(expected)]
+
+
+@pytest.mark.parametrize("order", [Order.ASC, Order.DESC])
+def test_cursor_pages_cover_every_image_once(listed_records, order):
+    owner_ids, expected = listed_records
+    pages: list[list[tuple[str, str]]] = read_all_pages(owner_ids, order, 3)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert sum(pages, []) == (expected if order == Order.ASC else expected[::-1])
+
+
+def test_last_full_page_has_no_cursor(listed_records):
+    owner_ids, expected = listed_records
+
+    images, cursor = list_image_records(owner_ids, Order.ASC, len(expected))
+
+    assert len(images) == len(expected)
+    assert cursor is None
+
+
+def test_cursor_continues_after_deleted_image(listed_records):
+    owner_ids, expected = listed_records
+    images, cursor = list_image_records(owner_ids, Order.ASC, 2)
+    deleted: dict = get_image_record(*expected[1])
+    delete_image_record(*expected[1])
+
+    try:
+        next_images, _ = list_image_records(owner_ids, Order.ASC, 2, cursor)
+        assert [(image_data["owner_id"], image_data["file_name"]) for image_data in next_images] == expected[2:4]
+    finally:
+        add_image_record(deleted)
+
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(ValueError):
+        list_image_records(["owner"], Order.ASC, 3, "not-a-cursor")
+
+
+@pytest.mark.anyio
+async def test_list_endpoint_pages_with_next_cursor(client, accounts):
+    user_id, session_id = accounts["main"][1]
+    uploaded: list[str] = []
+    for _ in range(3):
+        status, _, body = await client.upload(session_id, make_image(24, 24))
+        uploaded.append(json.loads(body)["result"]["file_name"])
+
+    listed: list[str] = []
+    url: str = f"/list/{user_id}?order=asc&limit=2"
+    while url:
+        status, _, body = await client.request("GET", url, session_id=session_id)
+        assert status == 200
+        result: dict = json.loads(body)["result"]
+        listed.extend(image["file_name"] for image in result["images"])
+        url = result["next_cursor"] and f"/list/{user_id}?order=asc&limit=2&cursor={result['next_cursor']}"
+
+    assert listed[-3:] == uploaded
+
+    status, _, _ = await client.request("GET", f"/list/{user_id}?cursor=not-a-cursor", session_id=session_id)
+    assert status == 400
@@ -0,0 +1,125 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Resumable Upload Tests
+
+이어 올리기 업로드의 위치(Upload-Offset)가 받은 크기와 일치하는 경우에만 기록되고,
+연결이 끊어져도 받은 데이터까지는 유지되는지 확인함
+"""
+
+# Libraries
+import json
+
+import pytest
+
+from Benchmarks.harness import make_image
+from Utilities.resumable_tools import (UploadOffsetMismatch, append_upload_chunk, create_upload_session,
+                                       delete_upload_session, get_upload_session)
+from Utilities.upload_tools import UploadTooLarge
+
+
+async def iterate(*chunks: bytes, error: Exception = None):
+    for chunk in chunks:
+        yield chunk
+    if error is not None:
+        raise error
+
+
+@pytest.fixture
+def upload_data():
+    upload_data: dict = create_upload_session("owner", "photo.jpg", 10)
+    yield upload_data
+    delete_upload_session(upload_data["upload_id"])
+
+
+@pytest.mark.anyio
+async def test_chunks_are_appended_at_offset(upload_data):
+    assert get_upload_session(upload_data["upload_id"], "owner")["offset"] == 0
+
+    assert await append_upload_chunk(upload_data, 0, iterate(b"abc", b"de")) == 5
+    assert await append_upload_chunk(upload_data, 5, iterate(b"fghij")) == 10
+    assert get_upload_session(upload_data["upload_id"], "owner")["offset"] == 10
+
+
+@pytest.mark.anyio
+async def test_offset_mismatch_reports_received_size(upload_data):
+    await append_upload_chunk(upload_data, 0, iterate(b"abc"))
+
+    with pytest.raises(UploadOffsetMismatch) as error:
+        await append_upload_chunk(upload_data, 0, iterate(b"abc"))
+
+    assert error.value.offset == 3
+    assert get_upload_session(upload_data["upload_id"], "owner")["offset"] == 3
+
+
+@pytest.mark.anyio
+async def test_interrupted_chunk_keeps_received_data(upload_data):
+    with pytest.raises(ConnectionError):
+        await append_upload_chunk(upload_data, 0, iterate(b"abc", b"d", error=ConnectionError()))
+
+    assert get_upload_session(upload_data["upload_id"], "owner")["offset"] == 4
+
+
+@pytest.mark.anyio
+async def test_data_beyond_length_is_rejected(upload_data):
+    with pytest.raises(UploadTooLarge):
+        await append_upload_chunk(upload_data, 0, iterate(b"abcdefgh", b"ijk"))
+
+    assert get_upload_session(upload_data["upload_id"], "owner")["offset"] == 8
+
+
+def test_other_owner_can_not_see_upload(upload_data):
+    assert get_upload_session(upload_data["upload_id"], "other") == {}
+
+
+@pytest.mark.anyio
+async def test_resumable_upload_flow(client, accounts):
+    user_id, session_id = accounts["main"][0]
+    image: bytes = make_image(128, 96)
+    half: int = len(image) // 2
+
+    status, headers, body = await client.request(
+        "POST", "/upload/resumable?file_name=photo.jpg", {"Upload-Length": str(len(image))}, session_id=session_id
+    )
+    assert status == 201
+    upload_id: str = json.loads(body)["result"]["upload_id"]
+    assert headers["upload-offset"] == "0"
+
+    status, headers, _ = await client.request(
+        "PATCH", f"/upload/resumable/{upload_id}", {"Upload-Offset": "0"}, image[:half], session_id=session_id
+    )
+    assert status == 200
+    assert headers["upload-offset"] == str(half)
+
+    # 이미 받은 조각을 다시 보내면 서버가 받은 위치를 알려줌
+    status, headers, _ = await client.request(
+        "PATCH", f"/upload/resumable/{upload_id}", {"Upload-Offset": "0"}, image[:half], session_id=session_id
+    )
+    assert status == 409
+    assert headers["upload-offset"] == str(half)
+
+    status, _, _ = await client.request("POST", f"/upload/resumable/{upload_id}/finalize", session_id=session_id)
+    assert status == 409
+
+    status, headers, body = await client.request("GET", f"/upload/resumable/{upload_id}", session_id=session_id)
+    assert status == 200
+    assert json.loads(body)["result"]["offset"] == half
+    assert headers["upload-length"] == str(len(image))
+
+    status, headers, _ = await client.request(
+        "PATCH", f"/upload/resumable/{upload_id}", {"Upload-Offset": str(half)}, image[half:], session_id=session_id
+    )
+    assert status == 200
+    assert headers["upload-offset"] == str(len(image))
+
+    status, _, body = await client.request("POST", f"/upload/resumable/{upload_id}/finalize", session_id=session_id)
+    assert status == 201
+    file_name: str = json.loads(body)["result"]["file_name"]
+
+    status, _, body = await client.request("GET", f"/access/{user_id}/{file_name}", session_id=session_id)
+    assert status == 200
+    assert body == image
+
+    status, _, _ = await client.request("GET", f"/upload/resumable/{upload_id}", session_id=session_id)
+    assert status == 404
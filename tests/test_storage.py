@@ -0,0 +1,155 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Storage Backend Tests
+
+S3 저장소는 MinIO 없이 boto3 Client를 흉내 내는 FakeClient로 확인함
+"""
+
+# Libraries
+from io import BytesIO
+import os
+
+import pytest
+
+from Utilities.storage_tools import StorageBackend, LocalStorage, S3Storage
+
+
+class NotFound(Exception):
+    response = {"Error": {"Code": "404"}}
+
+
+class FakeBody(BytesIO):
+    def iter_chunks(self, chunk_size: int):
+        while chunk := self.read(chunk_size):
+            yield chunk
+
+
+class FakeClient:
+    """
+    S3Storage가 사용하는 boto3 S3 Client 기능만 메모리에서 흉내 내는 Client
+    """
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.calls: list[tuple[str, str]] = []
+
+    def upload_file(self, path: str, bucket: str, key: str, Config=None) -> None:
+        self.calls.append(("upload", key))
+        with open(path, "rb") as buffer:
+            self.objects[key] = buffer.read()
+
+    def download_file(self, bucket: str, key: str, path: str, Config=None) -> None:
+        self.calls.append(("download", key))
+        if key not in self.objects:
+            raise NotFound()
+        with open(path, "wb") as buffer:
+            buffer.write(self.objects[key])
+
+    def get_object(self, Bucket: str, Key: str) -> dict:
+        if Key not in self.objects:
+            raise NotFound()
+        return {"Body": FakeBody(self.objects[Key])}
+
+    def head_object(self, Bucket: str, Key: str) -> dict:
+        if Key not in self.objects:
+            raise NotFound()
+        return {"ContentLength": len(self.objects[Key])}
+
+    def delete_object(self, Bucket: str, Key: str) -> None:
+        self.objects.pop(Key, None)
+
+
+@pytest.fixture
+def s3_storage(tmp_path) -> S3Storage:
+    storage = S3Storage(str(tmp_path), "bucket", prefix="/images/")
+    storage.client = FakeClient()
+    return storage
+
+
+def write_source(storage: StorageBackend, data: bytes) -> str:
+    source_path: str = os.path.join(storage.root, ".upload_source.tmp")
+    with open(source_path, "wb") as buffer:
+        buffer.write(data)
+    return source_path
+
+
+def test_storage_backend_is_abstract():
+    with pytest.raises(TypeError):
+        StorageBackend("/tmp")
+
+
+def test_local_storage_round_trip(tmp_path):
+    storage = LocalStorage(str(tmp_path))
+    key: str = os.path.join(".blobs", "ab", "abcd")
+
+    storage.put_file(write_source(storage, b"image"), key)
+    assert storage.get(key) == b"image"
+    assert storage.stat(key) == 5
+    assert storage.localize(key) == os.path.join(str(tmp_path), key)
+
+    storage.delete(key)
+    assert storage.stat(key) is None
+
+
+def test_s3_put_uploads_and_keeps_local_copy(s3_storage):
+    key: str = os.path.join(".blobs", "ab", "abcd")
+    source_path: str = write_source(s3_storage, b"image")
+
+    s3_storage.put_file(source_path, key)
+
+    assert not os.path.exists(source_path)
+    assert s3_storage.client.objects == {"images/.blobs/ab/abcd": b"image"}
+    assert s3_storage.get(key) == b"image"
+    assert s3_storage.stat(key) == 5
+    assert s3_storage.localize(key) == s3_storage.local_path(key)
+    assert ("download", "images/.blobs/ab/abcd") not in s3_storage.client.calls
+
+
+def test_s3_reads_objects_stored_by_other_hosts(s3_storage):
+    key: str = os.path.join(".blobs", "cd", "cdef")
+    s3_storage.client.objects["images/.blobs/cd/cdef"] = b"x" * 10
+
+    assert s3_storage.get(key) == b"x" * 10
+    assert b"".join(s3_storage.iter_chunks(key, 3)) == b"x" * 10
+
+    file_path: str = s3_storage.localize(key)
+    with open(file_path, "rb") as buffer:
+        assert buffer.read() == b"x" * 10
+    assert s3_storage.client.calls == [("download", "images/.blobs/cd/cdef")]
+    assert [name for name in os.listdir(os.path.dirname(file_path)) if name != "cdef"] == []
+
+
+def test_s3_missing_object(s3_storage):
+    key: str = os.path.join(".blobs", "ef", "efgh")
+
+    assert s3_storage.stat(key) is None
+    with pytest.raises(FileNotFoundError):
+        s3_storage.get(key)
+    with pytest.raises(FileNotFoundError):
+        s3_storage.localize(key)
+    with pytest.raises(FileNotFoundError):
+        list(s3_storage.iter_chunks(key))
+
+
+def test_s3_delete_removes_object_and_local_copy(s3_storage):
+    key: str = os.path.join(".blobs", "ab", "abcd")
+    s3_storage.put_file(write_source(s3_storage, b"image"), key)
+
+    s3_storage.delete(key)
+
+    assert s3_storage.client.objects == {}
+    assert not os.path.exists(s3_storage.local_path(key))
+
+
+def test_s3_prune_local_copies(s3_storage):
+    old_key: str = os.path.join(".blobs", "ab", "old")
+    new_key: str = os.path.join(".blobs", "ab", "new")
+    s3_storage.put_file(write_source(s3_storage, b"old"), old_key)
+    s3_storage.put_file(write_source(s3_storage, b"new"), new_key)
+    os.utime(s3_storage.local_path(old_key), (0, 0))
+
+    assert s3_storage.prune_local_copies(os.path.join(s3_storage.root, ".blobs"), 60) == 1
+    assert not os.path.exists(s3_storage.local_path(old_key))
+    assert s3_storage.get(old_key) == b"old"
+    assert os.path.exists(s3_storage.local_path(new_key))
@@ -0,0 +1,93 @@
+"""
+┏━━━━━━━━━━━━━━━━━━━━━━━━━┓
+┃ Care-bot Image Provider ┃
+┗━━━━━━━━━━━━━━━━━━━━━━━━━┛
+Image Variant Tests
+
+크기를 변환한 파생 이미지는 한 번만 만들어 다시 사용하고, 원본이 삭제되면 함께 삭제되는지 확인함
+"""
+
+# Libraries
+from io import BytesIO
+import asyncio
+import hashlib
+import json
+import os
+
+import pytest
+from PIL import Image
+
+from Benchmarks.harness import make_image
+from Utilities import variant_tools
+from Utilities.image_tools import ResizeFit, resize_image
+from Utilities.variant_tools import get_or_create_variant, get_variant_record, make_variant_key
+
+
+@pytest.mark.anyio
+async def test_resized_variant_is_served_and_cached(client, accounts):
+    user_id, session_id = accounts["main"][0]
+    image: bytes = make_image(120, 60)
+    status, _, body = await client.upload(session_id, image)
+    url: str = f"/access/{user_id}/{json.loads(body)['result']['file_name']}"
+
+    status, headers, original = await client.request("GET", url, session_id=session_id)
+    status, variant_headers, variant = await client.request("GET", f"{url}?w=30", session_id=session_id)
+    assert status == 200
+    assert Image.open(BytesIO(variant)).size == (30, 15)
+    assert variant_headers["etag"] != headers["etag"]
+
+    status, _, body = await client.request("GET", f"{url}?w=30", session_id=session_id)
+    assert (status, body) == (200, variant)
+
+    status, _, body = await client.request(
+        "GET", f"{url}?w=30", {"If-None-Match": variant_headers["etag"]}, session_id=session_id
+    )
+    assert (status, body) == (304, b"")
+
+
+@pytest.mark.anyio
+async def test_concurrent_requests_create_variant_once(tmp_path, monkeypatch, anyio_backend):
+    source: bytes = make_image(80, 80)
+    source_hash: str = hashlib.sha256(source).hexdigest()
+    source_path = tmp_path / "source.jpg"
+    source_path.write_bytes(source)
+    key: str = make_variant_key(source_hash, "image/jpeg", 20, None, "contain")
+
+    save_variant = variant_tools.save_variant
+    saved: list[str] = []
+
+    def counting_save_variant(*arguments):
+        saved.append(arguments[0])
+        return save_variant(*arguments)
+
+    monkeypatch.setattr(variant_tools, "save_variant", counting_save_variant)
+    results: list[dict] = await asyncio.gather(*[
+        get_or_create_variant(key, source_hash, str(source_path), "image/jpeg", resize_image,
+                              "image/jpeg", 20, None, ResizeFit.CONTAIN)
+        for _ in range(5)
+    ])
+
+    assert saved == [key]
+    assert all(result == results[0] for result in results)
+    assert results[0]["key"] == key
+    assert os.path.isfile(variant_tools.get_variant_path(results[0]))
+
+
+@pytest.mark.anyio
+async def test_variants_are_removed_with_source(client, accounts):
+    user_id, session_id = accounts["main"][0]
+    image: bytes = make_image(64, 64)
+    sha256: str = hashlib.sha256(image).hexdigest()
+    status, _, body = await client.upload(session_id, image)
+    file_name: str = json.loads(body)["result"]["file_name"]
+
+    await client.request("GET", f"/access/{user_id}/{file_name}?w=16", session_id=session_id)
+    variant_data: dict = get_variant_record(make_variant_key(sha256, "image/jpeg", 16, None, "contain"))
+    assert variant_data
+    variant_path: str = variant_tools.get_variant_path(variant_data)
+    assert os.path.isfile(variant_path)
+
+    status, _, _ = await client.request("DELETE", f"/delete/{user_id}/{file_name}", session_id=session_id)
+    assert status == 200
+    assert not os.path.exists(variant_path)
+    assert get_variant_record(variant_data["key"]) == {}